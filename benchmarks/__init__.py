@@ -0,0 +1 @@
+"""Benchmarks for performance-sensitive parts of Vitae."""
@@ -0,0 +1,81 @@
+"""Benchmark of resuming an ingestion.
+
+Compares loading ``processed.log`` into a set of ``<id>.xml`` strings
+against opening the memory-mapped `Checkpoint`, then checking whether
+each curriculum of a group was processed.
+
+Usage
+-----
+    $ python -m benchmarks.checkpoint
+    $ python -m benchmarks.checkpoint --processed 5000000
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import random
+import tempfile
+import time
+import tracemalloc
+
+from vitae.features.ingestion.checkpoint import Checkpoint
+
+
+def from_log(log: Path) -> set[str]:
+    """Previous strategy, as `curricula_xml_from` used to."""
+    with log.open("r") as file:
+        return {line.strip("\n") + ".xml" for line in file}
+
+
+def measure(name: str, open_processed, lookups: list[str]) -> None:  # noqa: ANN001
+    tracemalloc.start()
+    start = time.perf_counter()
+    processed = open_processed()
+    opened = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    found = sum(lookup in processed for lookup in lookups)
+    looked = time.perf_counter() - start
+
+    print(
+        f"{name:>12} {opened:>9.3f} {peak / 2**20:>10.1f}"
+        f" {looked / len(lookups) * 1e6:>12.2f} {found:>7}",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processed", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    arguments = parser.parse_args()
+
+    ids = [f"{i * 7:016}" for i in range(arguments.processed)]
+    lookups = random.sample(range(arguments.processed * 7), arguments.lookups)
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = Path(directory) / "processed.log"
+        log.write_text("".join(f"{lattes_id}\n" for lattes_id in ids))
+        Checkpoint.from_log(log, Path(directory) / "processed.ids").close()
+        del ids
+
+        print(
+            f"{'strategy':>12} {'open (s)':>9} {'peak (MB)':>10}"
+            f" {'lookup (us)':>12} {'found':>7}",
+        )
+        measure(
+            "set[str]",
+            lambda: from_log(log),
+            [f"{i:016}.xml" for i in lookups],
+        )
+        measure(
+            "checkpoint",
+            lambda: Checkpoint(Path(directory) / "processed.ids"),
+            [f"{i:016}" for i in lookups],
+        )
+
+
+if __name__ == "__main__":
+    main()
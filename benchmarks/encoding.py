@@ -0,0 +1,75 @@
+"""Benchmark of the XML decoding path.
+
+Compares the previous two-step path, where `pre-process` transcodes each
+file from ISO-8859-1 to UTF-8 and the ingestion decodes it again into a
+``str``, against parsing the file's raw bytes as delivered by CNPq.
+
+Usage
+-----
+    $ python -m benchmarks.encoding
+    $ python -m benchmarks.encoding --files 200 --entries 300
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+
+from benchmarks.parsing_index import curriculum
+from vitae.features.ingestion.parsing import _xml as xml
+
+DECLARATION = '<?xml version="1.0" encoding="ISO-8859-1"?>\n'
+
+
+def transcoded(files: list[Path]) -> None:
+    """Previous path: transcode on disk, then decode and parse a ``str``."""
+    for file in files:
+        content = file.read_text(encoding="iso-8859-1")
+        file.write_text(content, encoding="utf-8")
+        xml.parse(file.read_text(encoding="utf-8"))
+
+
+def direct(files: list[Path]) -> None:
+    """Current path: parse raw bytes, honouring the declared encoding."""
+    for file in files:
+        xml.parse(file.read_bytes())
+
+
+def corpus(directory: Path, files: int, entries: int) -> list[Path]:
+    content = (DECLARATION + curriculum(entries)).replace(
+        "Institution",
+        "Instituição",
+    )
+
+    paths = [directory / f"{i:016}.xml" for i in range(files)]
+    for path in paths:
+        path.write_text(content, encoding="iso-8859-1")
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--entries", type=int, default=100)
+    arguments = parser.parse_args()
+
+    print(f"{'path':>12} {'total (s)':>10} {'per file (ms)':>14}")
+
+    for name, strategy in (("transcoded", transcoded), ("direct", direct)):
+        with tempfile.TemporaryDirectory() as directory:
+            files = corpus(Path(directory), arguments.files, arguments.entries)
+
+            start = time.perf_counter()
+            strategy(files)
+            elapsed = time.perf_counter() - start
+
+        print(
+            f"{name:>12} {elapsed:>10.3f}"
+            f" {elapsed / arguments.files * 1000:>14.3f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
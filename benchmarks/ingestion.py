@@ -0,0 +1,285 @@
+"""Benchmark of the ingestion, stage by stage.
+
+Synthetic curricula, shaped by the options of `benchmarks.synthetic`,
+go through each stage of the ingestion, timed separately:
+
+- ``parse``: parsing files into `CurriculumDocument`, and walking them.
+- ``adapt``: building the adapters, with `CurriculumDocument.as_schema`.
+- ``convert``: converting adapters into tables, as `Researchers` does.
+- ``put``: storing them with `Researchers.put`, only with ``--database``.
+
+Each stage is run ``--repeat`` times, keeping the fastest.
+Results can be saved as a named baseline, under ``benchmarks/baselines``,
+and later runs compared with it. Comparisons exit with an error
+when a stage is slower than the baseline beyond ``--tolerance``.
+
+Notes
+-----
+With ``--database``, tables of the database configured on ``vitae.toml``
+are dropped and re-created on each run, use a disposable database.
+Baselines are only comparable on the same machine.
+
+Usage
+-----
+    $ python -m benchmarks.ingestion
+    $ python -m benchmarks.ingestion --save main
+    $ python -m benchmarks.ingestion --compare main --educations 10
+    $ python -m benchmarks.ingestion --database --loader copy
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict
+import json
+from pathlib import Path
+import sys
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any
+
+import loguru
+from sqlmodel import SQLModel
+
+from benchmarks.synthetic import add_shape_arguments, generate, shape_from
+from vitae.features.ingestion.parsing import CurriculumDocument
+from vitae.features.ingestion.repository import Researchers
+from vitae.infra.database import Database
+from vitae.settings.vitae import Vitae
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from vitae.features.ingestion.adapters import Curriculum
+
+BASELINES = Path(__file__).parent / "baselines"
+STAGES = ("parse", "adapt", "convert", "put")
+
+
+def parsed(files: list[Path]) -> list[CurriculumDocument]:
+    documents = [CurriculumDocument(file) for file in files]
+    for document in documents:
+        document.index  # noqa: B018
+        document.general  # noqa: B018
+    return documents
+
+
+def adapted(documents: list[CurriculumDocument]) -> list[Curriculum]:
+    return [document.as_schema for document in documents]
+
+
+def converted(curricula: list[Curriculum]) -> None:
+    Researchers._as_tables(curricula)  # noqa: SLF001
+
+
+def reset(vitae: Vitae) -> None:
+    """Re-create the tables, so each ``put`` starts from empty ones."""
+    engine = vitae.postgres.engine
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+
+
+def repository(
+    vitae: Vitae,
+    loader: str,
+    every: int,
+    log_directory: Path,
+) -> Researchers:
+    """Empty tables, and new Researchers to ``put`` the curricula into them.
+
+    Researchers remember the institutions they stored, so each run needs
+    new ones. Each adds its log handlers, so the handlers of the previous
+    one are removed first, else later runs would log through all of them.
+
+    Returns
+    -------
+    Researchers logging under ``log_directory``.
+
+    """
+    loguru.logger.remove()
+    reset(vitae)
+    return Researchers(
+        db=Database(vitae.postgres.engine, loader),  # type: ignore[arg-type]
+        log_directory=log_directory,
+        every=every,
+    )
+
+
+def fastest[T](
+    repeat: int,
+    stage: Callable[[], T],
+    setup: Callable[[], object] | None = None,
+) -> tuple[float, T]:
+    """Run a stage ``repeat`` times, after its untimed ``setup``, if any.
+
+    Returns
+    -------
+    The fastest run's seconds, and its result.
+
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        result = stage()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(arguments: argparse.Namespace) -> dict[str, float]:
+    """Time each stage over the same synthetic curricula.
+
+    Returns
+    -------
+    Seconds taken by each stage run.
+
+    """
+    repeat = arguments.repeat
+    with tempfile.TemporaryDirectory() as directory:
+        files = generate(
+            Path(directory),
+            curricula=arguments.curricula,
+            shape=shape_from(arguments),
+        )
+
+        seconds = {}
+        seconds["parse"], documents = fastest(repeat, lambda: parsed(files))
+        seconds["adapt"], curricula = fastest(
+            repeat,
+            lambda: adapted(documents),
+        )
+        seconds["convert"], _ = fastest(repeat, lambda: converted(curricula))
+
+    if arguments.database:
+        vitae = Vitae.from_toml(Path("vitae.toml"))
+        with tempfile.TemporaryDirectory() as directory:
+            researchers: list[Researchers] = []
+
+            def setup() -> None:
+                researchers[:] = [
+                    repository(
+                        vitae,
+                        arguments.loader,
+                        arguments.every,
+                        Path(directory),
+                    ),
+                ]
+
+            try:
+                seconds["put"], _ = fastest(
+                    repeat,
+                    lambda: researchers[0].put(curricula),
+                    setup=setup,
+                )
+            finally:
+                loguru.logger.remove()  # before their directory is removed
+    return seconds
+
+
+def parameters(arguments: argparse.Namespace) -> dict[str, Any]:
+    """What a run depends on, so only alike runs are compared.
+
+    Returns
+    -------
+    Number and shape of the curricula, and how they are stored.
+
+    """
+    return {
+        "curricula": arguments.curricula,
+        "shape": asdict(shape_from(arguments)),
+        "loader": arguments.loader,
+        "every": arguments.every,
+    }
+
+
+def report(
+    seconds: dict[str, float],
+    curricula: int,
+    baseline: dict[str, float] | None,
+    tolerance: float,
+) -> list[str]:
+    """Print each stage's timing, against the baseline's if any.
+
+    Returns
+    -------
+    Stages slower than the baseline, beyond the tolerance.
+
+    """
+    compared = f" {'baseline (s)':>13} {'ratio':>7}" if baseline else ""
+    print(
+        f"{'stage':>8} {'total (s)':>10} {'per curriculum (ms)':>20}"
+        f" {'curricula/s':>12}{compared}",
+    )
+
+    slower = []
+    for stage in STAGES:
+        if stage not in seconds:
+            continue
+
+        elapsed = seconds[stage]
+        line = (
+            f"{stage:>8} {elapsed:>10.3f}"
+            f" {elapsed / curricula * 1000:>20.3f}"
+            f" {curricula / elapsed:>12,.0f}"
+        )
+        if baseline and stage in baseline:
+            ratio = elapsed / baseline[stage]
+            line += f" {baseline[stage]:>13.3f} {ratio:>6.2f}x"
+            if ratio > 1 + tolerance:
+                line += "  slower"
+                slower.append(stage)
+        print(line)
+
+    return slower
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--curricula", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--database", action="store_true")
+    parser.add_argument("--loader", choices=("orm", "copy"), default="orm")
+    parser.add_argument("--every", type=int, default=200)
+    parser.add_argument("--save", metavar="BASELINE")
+    parser.add_argument("--compare", metavar="BASELINE")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    add_shape_arguments(parser)
+    arguments = parser.parse_args()
+
+    baseline = None
+    if arguments.compare:
+        stored = json.loads(
+            (BASELINES / f"{arguments.compare}.json").read_text(),
+        )
+        if stored["parameters"] != parameters(arguments):
+            sys.exit(
+                f"Baseline {arguments.compare!r} was run with"
+                f" {stored['parameters']}, run with the same parameters.",
+            )
+        baseline = stored["seconds"]
+
+    loguru.logger.remove()
+    seconds = run(arguments)
+    slower = report(
+        seconds,
+        arguments.curricula,
+        baseline,
+        arguments.tolerance,
+    )
+
+    if arguments.save:
+        BASELINES.mkdir(exist_ok=True)
+        (BASELINES / f"{arguments.save}.json").write_text(
+            json.dumps(
+                {"parameters": parameters(arguments), "seconds": seconds},
+                indent=2,
+            ),
+        )
+
+    if slower:
+        sys.exit(f"Slower than {arguments.compare!r}: {', '.join(slower)}")
+
+
+if __name__ == "__main__":
+    main()
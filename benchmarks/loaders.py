@@ -0,0 +1,107 @@
+"""Benchmark of the database loaders.
+
+Writes the same synthetic curricula with the ORM loader, which adds each
+row through the session, and with the ``COPY`` loader.
+
+Notes
+-----
+Tables of the database configured on ``vitae.toml`` are dropped and
+re-created on each run, use a disposable database.
+
+Usage
+-----
+    $ python -m benchmarks.loaders
+    $ python -m benchmarks.loaders --curricula 5000 --every 500
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+
+import loguru
+from sqlmodel import SQLModel
+
+from vitae.features.ingestion.parsing import CurriculumDocument
+from vitae.features.ingestion.repository import Researchers
+from vitae.infra.database import Database
+from vitae.settings.vitae import Vitae
+
+
+def curriculum(lattes_id: int) -> bytes:
+    """Synthetic curriculum, with a few rows on each table."""
+    institution = f"I{lattes_id % 50}"
+    return (
+        "<CURRICULO-VITAE>"
+        f'<DADOS-GERAIS NOME-COMPLETO="Researcher {lattes_id}" '
+        'PAIS-DE-NASCIMENTO="Brasil" NACIONALIDADE="B">'
+        '<RESUMO-CV TEXTO-RESUMO-CV-RH="Abstract"/>'
+        f'<ENDERECO><ENDERECO-PROFISSIONAL CEP="44000000" '
+        f'CODIGO-INSTITUICAO-EMPRESA="{institution}" '
+        f'NOME-INSTITUICAO-EMPRESA="Institution {institution}"/></ENDERECO>'
+        "<FORMACAO-ACADEMICA-TITULACAO>"
+        f'<GRADUACAO CODIGO-INSTITUICAO="{institution}" '
+        f'NOME-INSTITUICAO="Institution {institution}" NOME-CURSO="Course" '
+        'ANO-DE-INICIO="2000" ANO-DE-CONCLUSAO="2004" '
+        f'NUMERO-ID-ORIENTADOR="{lattes_id + 1:016}"/>'
+        f'<DOUTORADO CODIGO-INSTITUICAO="{institution}" '
+        f'NOME-INSTITUICAO="Institution {institution}" NOME-CURSO="Course">'
+        "<AREAS-DO-CONHECIMENTO><AREA-DO-CONHECIMENTO-1 "
+        'NOME-GRANDE-AREA-DO-CONHECIMENTO="Exatas"/>'
+        "</AREAS-DO-CONHECIMENTO></DOUTORADO>"
+        "</FORMACAO-ACADEMICA-TITULACAO>"
+        "<ATUACOES-PROFISSIONAIS>"
+        f'<ATUACAO-PROFISSIONAL CODIGO-INSTITUICAO="{institution}" '
+        f'NOME-INSTITUICAO="Institution {institution}">'
+        '<VINCULOS TIPO-DE-VINCULO="LIVRE" ANO-INICIO="2010"/>'
+        "</ATUACAO-PROFISSIONAL></ATUACOES-PROFISSIONAIS>"
+        "<AREAS-DE-ATUACAO><AREA-DE-ATUACAO "
+        'NOME-GRANDE-AREA-DO-CONHECIMENTO="Exatas"/></AREAS-DE-ATUACAO>'
+        "</DADOS-GERAIS></CURRICULO-VITAE>"
+    ).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--curricula", type=int, default=2000)
+    parser.add_argument("--every", type=int, default=200)
+    arguments = parser.parse_args()
+
+    loguru.logger.remove()
+    vitae = Vitae.from_toml(Path("vitae.toml"))
+    engine = vitae.postgres.engine
+
+    with tempfile.TemporaryDirectory() as directory:
+        files = [
+            Path(directory) / f"{i:016}.xml" for i in range(arguments.curricula)
+        ]
+        for i, file in enumerate(files):
+            file.write_bytes(curriculum(i))
+        curricula = [CurriculumDocument(file).as_schema for file in files]
+
+        print(f"{'loader':>8} {'total (s)':>10} {'per curriculum (ms)':>20}")
+
+        for loader in ("orm", "copy"):
+            SQLModel.metadata.drop_all(engine)
+            SQLModel.metadata.create_all(engine)
+
+            researchers = Researchers(
+                db=Database(engine, loader),
+                log_directory=Path(directory),
+                every=arguments.every,
+            )
+
+            start = time.perf_counter()
+            researchers.put(curricula)
+            elapsed = time.perf_counter() - start
+
+            print(
+                f"{loader:>8} {elapsed:>10.3f}"
+                f" {elapsed / arguments.curricula * 1000:>20.3f}",
+            )
+
+
+if __name__ == "__main__":
+    main()
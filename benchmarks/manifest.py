@@ -0,0 +1,76 @@
+"""Benchmark of listing the Curricula repository.
+
+Compares globbing each group's directory, as the ingestion used to,
+against building the `Manifest` and reading it back from its cache.
+
+On local disks, listing is cheap and the strategies take about the same.
+What matters on network volumes, where each directory listing and ``stat``
+is a round trip, is how many directories are listed by each one.
+
+Usage
+-----
+    $ python -m benchmarks.manifest
+    $ python -m benchmarks.manifest --groups 20 --files 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+import tempfile
+import time
+from unittest import mock
+
+from vitae.features.ingestion.manifest import Manifest
+
+
+def globbed(root: Path) -> int:
+    """Previous strategy, a glob per group."""
+    return sum(
+        len(list(group.glob("*.xml")))
+        for group in root.iterdir()
+        if group.is_dir()
+    )
+
+
+def manifested(root: Path, cache: Path) -> int:
+    manifest = Manifest(root, cache)
+    return sum(
+        len(manifest.files(group, ".xml")) for group in manifest.groups()
+    )
+
+
+def timed(name: str, list_files) -> None:  # noqa: ANN001
+    scandir = mock.Mock(wraps=os.scandir)
+    with mock.patch("os.scandir", scandir):
+        start = time.perf_counter()
+        listed = list_files()
+        elapsed = time.perf_counter() - start
+
+    print(f"{name:>18} {elapsed:>9.3f} {listed:>9} {scandir.call_count:>9}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=10)
+    parser.add_argument("--files", type=int, default=10_000)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory) / "all_files"
+        cache = Path(directory) / "cache"
+
+        for group in range(arguments.groups):
+            (root / f"{group:02}").mkdir(parents=True)
+            for i in range(arguments.files):
+                (root / f"{group:02}" / f"{group:02}{i:014}.xml").touch()
+
+        print(f"{'strategy':>18} {'time (s)':>9} {'files':>9} {'listings':>9}")
+        timed("glob", lambda: globbed(root))
+        timed("manifest (build)", lambda: manifested(root, cache))
+        timed("manifest (cached)", lambda: manifested(root, cache))
+
+
+if __name__ == "__main__":
+    main()
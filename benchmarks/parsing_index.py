@@ -0,0 +1,142 @@
+"""Benchmark of institution and course lookups of the parsing layer.
+
+Compares the linear scan over `DADOS-COMPLEMENTARES`, done for each
+education, professional link and address, against the `DocumentIndex`
+built once per document.
+
+Usage
+-----
+    $ python -m benchmarks.parsing_index
+    $ python -m benchmarks.parsing_index --entries 100 500 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+import timeit
+
+from vitae.features.ingestion.parsing import _xml as xml
+from vitae.features.ingestion.parsing._extraction import Record, visit
+from vitae.features.ingestion.parsing.academic import education_from_xml
+from vitae.features.ingestion.parsing.index import COMPLEMENTARY, DocumentIndex
+from vitae.features.ingestion.parsing.professional import (
+    address_from_xml,
+    experience_from_xml,
+)
+
+
+@dataclass(frozen=True)
+class LinearIndex:
+    """Previous lookup strategy: scan every entry on each lookup."""
+
+    document: xml.Node
+
+    def institution(self, code: str | None) -> Record | None:
+        return self._scan("institutions", "institution", code)
+
+    def course(self, code: str | None) -> Record | None:
+        return self._scan("courses", "course", code)
+
+    def _scan(self, group: str, name: str, code: str | None) -> Record | None:
+        extra = visit(
+            self.document.first("dados complementares").element,
+            COMPLEMENTARY,
+        )
+        found = extra.first(group)
+        for record in found.all(name) if found else []:
+            if record["code"] == code:
+                return record
+        return None
+
+
+def curriculum(entries: int) -> str:
+    """Synthetic curriculum with ``entries`` of each referencing kind."""
+    educations = "".join(
+        f'<GRADUACAO CODIGO-CURSO="{i}" CODIGO-INSTITUICAO="I{i}" '
+        f'NOME-INSTITUICAO="Institution {i}"/>'
+        for i in range(entries)
+    )
+    experiences = "".join(
+        f'<ATUACAO-PROFISSIONAL CODIGO-INSTITUICAO="I{i}" '
+        f'NOME-INSTITUICAO="Institution {i}">'
+        '<VINCULOS TIPO-DE-VINCULO="LIVRE" ANO-INICIO="2000"/>'
+        "</ATUACAO-PROFISSIONAL>"
+        for i in range(entries)
+    )
+    institutions = "".join(
+        f'<INFORMACAO-ADICIONAL-INSTITUICAO CODIGO-INSTITUICAO="I{i}" '
+        f'SIGLA-INSTITUICAO="I{i}" SIGLA-UF-INSTITUICAO="BA" '
+        'NOME-PAIS-INSTITUICAO="Brasil"/>'
+        for i in range(entries)
+    )
+    courses = "".join(
+        f'<INFORMACAO-ADICIONAL-CURSO CODIGO-CURSO="{i}" '
+        'NOME-GRANDE-AREA-DO-CONHECIMENTO="Ciências Exatas"/>'
+        for i in range(entries)
+    )
+
+    return (
+        "<CURRICULO-VITAE><DADOS-GERAIS>"
+        '<ENDERECO><ENDERECO-PROFISSIONAL CEP="1" '
+        f'CODIGO-INSTITUICAO-EMPRESA="I{entries - 1}"/></ENDERECO>'
+        f"<FORMACAO-ACADEMICA-TITULACAO>{educations}"
+        "</FORMACAO-ACADEMICA-TITULACAO>"
+        f"<ATUACOES-PROFISSIONAIS>{experiences}</ATUACOES-PROFISSIONAIS>"
+        "</DADOS-GERAIS><DADOS-COMPLEMENTARES>"
+        "<INFORMACOES-ADICIONAIS-INSTITUICOES>"
+        f"{institutions}</INFORMACOES-ADICIONAIS-INSTITUICOES>"
+        f"<INFORMACOES-ADICIONAIS-CURSOS>{courses}"
+        "</INFORMACOES-ADICIONAIS-CURSOS>"
+        "</DADOS-COMPLEMENTARES></CURRICULO-VITAE>"
+    )
+
+
+def extract(document: xml.Node, index: DocumentIndex | LinearIndex) -> None:
+    address_from_xml("0", document, index)  # type: ignore[arg-type]
+    list(education_from_xml("0", document, index))  # type: ignore[arg-type]
+    list(experience_from_xml("0", document, index))  # type: ignore[arg-type]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--entries",
+        type=int,
+        nargs="+",
+        default=[10, 100, 300, 1000],
+        help="Educations, links, institutions and courses per document.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    print(
+        f"{'entries':>8} {'linear (ms)':>12} {'indexed (ms)':>13} {'speedup':>8}"
+    )
+
+    for entries in arguments.entries:
+        document = xml.parse(curriculum(entries))
+
+        linear = min(
+            timeit.repeat(
+                lambda: extract(document, LinearIndex(document)),
+                number=1,
+                repeat=arguments.repeat,
+            ),
+        )
+        indexed = min(
+            timeit.repeat(
+                lambda: extract(document, DocumentIndex.of(document)),
+                number=1,
+                repeat=arguments.repeat,
+            ),
+        )
+
+        print(
+            f"{entries:>8} {linear * 1000:>12.2f} {indexed * 1000:>13.2f}"
+            f" {linear / indexed:>7.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,494 @@
+"""Benchmark of the researchers' search, by its query plans.
+
+The database configured on ``vitae.toml`` is filled, on the server,
+with ``--researchers`` synthetic researchers, each with a nationality,
+two educations and two expertise areas, and an address but for every
+twentieth one, so millions of rows take only seconds.
+
+Each scenario of ``/search`` is built by `searched`, as `by_name` or
+`by_text` run it, and explained with ``EXPLAIN (ANALYZE, BUFFERS)``,
+first without the secondary indexes declared on the tables, then with
+them, keeping the fastest of ``--repeat`` runs. The scans of each plan
+are summarized, use ``--plans`` to print them whole.
+
+Each one is also explained, with the indexes, as `joined` filtered it
+before `filtered_by`, and their results compared, on every page.
+
+Notes
+-----
+Tables are dropped and re-created, use a disposable database,
+or ``--reuse`` the one filled by a previous run.
+
+Usage
+-----
+    $ python -m benchmarks.search
+    $ python -m benchmarks.search --researchers 2000000 --plans
+    $ python -m benchmarks.search --reuse --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import psycopg
+from sqlalchemy import text
+from sqlmodel import SQLModel, col, select
+
+from vitae.features.researchers.repository.researchers import (
+    FILTERS,
+    searched,
+)
+from vitae.infra.database import tables
+from vitae.infra.database.tables.text_search import folded
+from vitae.settings.vitae import Vitae
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy import Connection, Index
+    from sqlalchemy.engine import Engine
+
+    from vitae.features.researchers.repository.researchers import (
+        SelectedResearchers,
+    )
+    from vitae.features.researchers.schemes import ChoosenFilters
+
+FIRST_NAMES = (
+    "Ana", "João", "Maria", "José", "Paulo", "Carla", "Pedro", "Julia",
+    "Lucas", "Fernanda", "Marcos", "Beatriz", "Rafael", "Camila", "Tiago",
+    "Larissa", "Bruno", "Patrícia", "Gabriel", "Mariana",
+)  # fmt: skip
+LAST_NAMES = (
+    "Silva", "Souza", "Santos", "Oliveira", "Pereira", "Lima", "Costa",
+    "Ferreira", "Rodrigues", "Almeida", "Nascimento", "Carvalho", "Gomes",
+    "Martins", "Araújo", "Ribeiro", "Barbosa", "Rocha", "Dias", "Moreira",
+)  # fmt: skip
+STATES = (
+    "AC", "AL", "AP", "AM", "BA", "CE", "DF", "ES", "GO", "MA", "MT", "MS",
+    "MG", "PA", "PB", "PR", "PE", "PI", "RJ", "RN", "RS", "RO", "RR", "SC",
+    "SP", "SE", "TO",
+)  # fmt: skip
+CATEGORIES = (
+    "GRADUACAO", "ESPECIALIZACAO", "MESTRADO", "DOUTORADO", "POS-DOUTORADO",
+)  # fmt: skip
+AREAS = (
+    "Ciência da Computação", "Matemática", "Física", "Química", "Medicina",
+    "Educação", "Direito", "Economia", "Agronomia", "Engenharia Elétrica",
+    "Engenharia Civil", "Biologia Geral", "Genética", "Ecologia", "História",
+    "Geografia", "Letras", "Psicologia", "Sociologia", "Filosofia",
+    "Odontologia", "Enfermagem", "Farmácia", "Zootecnia", "Arquitetura",
+    "Administração", "Artes", "Astronomia", "Oceanografia", "Nutrição",
+)  # fmt: skip
+
+# Accented letters of names, translated as `folded` by the database.
+ACCENTED = "".join(
+    sorted(
+        {
+            letter
+            for name in FIRST_NAMES + LAST_NAMES
+            for letter in name.lower()
+            if folded(letter) != letter
+        },
+    ),
+)
+UNACCENTED = "".join(folded(letter) for letter in ACCENTED)
+
+
+def filters(**chosen: object) -> ChoosenFilters:
+    return cast("ChoosenFilters", chosen)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A search of ``/search``, by name, or by text with ``full_text``."""
+
+    name: str
+    filters: ChoosenFilters | None = None
+    full_text: bool = False
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "name": Scenario("silva"),
+    "accents": Scenario("joao araujo"),
+    "names": Scenario("maria souza"),
+    "state": Scenario("silva", filters(state="SP")),
+    "started": Scenario("", filters(started="DOUTORADO")),
+    "ended": Scenario("lima", filters(started="MESTRADO", has_finished=True)),
+    "country": Scenario("", filters(country="Portugal")),
+    "expertise": Scenario("", filters(expertise="Ciência da Computação")),
+    "all": Scenario(
+        "ana",
+        filters(
+            state="MG",
+            country="Brasil",
+            started="DOUTORADO",
+            has_finished=True,
+            expertise="Física",
+        ),
+    ),
+    "text": Scenario("genética", full_text=True),
+    "text_state": Scenario(
+        "engenharia civil",
+        filters(state="RJ"),
+        full_text=True,
+    ),
+}
+
+
+def array(values: tuple[str, ...]) -> str:
+    quoted = ", ".join(
+        "'{}'".format(value.replace("'", "''")) for value in values
+    )
+    return f"(ARRAY[{quoted}])"
+
+
+def picked(values: tuple[str, ...], seed: str) -> str:
+    """SQL picking one of ``values``, spread by the integer ``seed``.
+
+    Returns
+    -------
+    An SQL expression.
+
+    """
+    return f"{array(values)}[1 + ({seed}) % {len(values)}]"
+
+
+FILLING = (
+    f"""
+    INSERT INTO researcher
+        (lattes_id, full_name, search_name, expertise_areas, abstract)
+    SELECT
+        i,
+        name,
+        translate(lower(name), '{ACCENTED}', '{UNACCENTED}'),
+        {picked(AREAS, "i * 13")} || '; ' || {picked(AREAS, "i * 13 + 7")},
+        'Pesquisador de ' || {picked(AREAS, "i * 17")} || ' desde ' || i
+    FROM generate_series(1::bigint, :researchers) AS i,
+        LATERAL (
+            SELECT {picked(FIRST_NAMES, "i")}
+                || ' ' || {picked(LAST_NAMES, "i / 20")}
+                || ' ' || {picked(LAST_NAMES, "i / 400")} AS name
+        ) AS names
+    """,
+    """
+    INSERT INTO nationality (researcher_id, born_country, nationality)
+    SELECT
+        i,
+        CASE WHEN i % 100 = 0 THEN 'Portugal' ELSE 'Brasil' END,
+        CASE WHEN i % 100 = 0 THEN 'E' ELSE 'B' END
+    FROM generate_series(1::bigint, :researchers) AS i
+    """,
+    f"""
+    INSERT INTO address (researcher_id, country, state)
+    SELECT i, 'Brasil', {picked(STATES, "i * 31")}
+    FROM generate_series(1::bigint, :researchers) AS i
+    WHERE i % 20 <> 0
+    """,
+    f"""
+    INSERT INTO education (id, researcher_id, category, start, "end")
+    SELECT
+        md5(i || ':' || k)::uuid,
+        i,
+        {picked(CATEGORIES, "i + k * 2")},
+        1990 + k * 5,
+        CASE WHEN (i + k) % 5 = 0 THEN NULL ELSE 1994 + k * 5 END
+    FROM generate_series(1::bigint, :researchers) AS i,
+        generate_series(0, 1) AS k
+    """,
+    f"""
+    INSERT INTO expertise (researcher_id, area)
+    SELECT i, {picked(AREAS, "i * 13 + k * 7")}
+    FROM generate_series(1::bigint, :researchers) AS i,
+        generate_series(0, 1) AS k
+    """,
+)
+
+
+# Researchers with rows on every table that `joined` joins.
+COMPLETE = """
+    SELECT lattes_id FROM researcher
+    WHERE EXISTS (SELECT FROM address WHERE researcher_id = lattes_id)
+        AND EXISTS (SELECT FROM nationality WHERE researcher_id = lattes_id)
+        AND EXISTS (SELECT FROM education WHERE researcher_id = lattes_id)
+        AND EXISTS (SELECT FROM expertise WHERE researcher_id = lattes_id)
+"""
+
+
+def secondary_indexes() -> list[Index]:
+    return [
+        index
+        for table in SQLModel.metadata.sorted_tables
+        for index in sorted(table.indexes, key=lambda index: index.name or "")
+    ]
+
+
+def fill(engine: Engine, researchers: int) -> None:
+    """Re-create the tables, and fill them without secondary indexes."""
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        drop_indexes(connection)
+        for statement in FILLING:
+            connection.execute(text(statement), {"researchers": researchers})
+
+
+def drop_indexes(connection: Connection) -> None:
+    for index in secondary_indexes():
+        index.drop(connection, checkfirst=True)
+
+
+def create_indexes(connection: Connection) -> None:
+    for index in secondary_indexes():
+        index.create(connection, checkfirst=True)
+
+
+def joined(
+    selected: SelectedResearchers,
+    filters: ChoosenFilters | None,
+) -> SelectedResearchers:
+    """Filter researchers as `searched` did before `filtered_by`.
+
+    Every related table is inner joined, filtered or not, so researchers
+    are repeated by their rows, removed by ``DISTINCT``, and the ones
+    without rows on any of them are dropped.
+
+    Returns
+    -------
+    SQL Statement.
+
+    """
+    chosen = cast("dict[str, Any]", filters or {})
+    return (
+        selected.join(tables.Education)
+        .join(tables.Address)
+        .join(tables.Nationality)
+        .join(tables.Expertise)
+        .where(
+            *(
+                condition(chosen[key])
+                for key, (_, condition) in FILTERS.items()
+                if chosen.get(key)
+            ),
+        )
+        .distinct()
+    )
+
+
+def built(
+    scenario: Scenario,
+    *,
+    page: int | None = 1,
+    joining: bool = False,
+) -> SelectedResearchers:
+    """Search of a scenario, ordered by name, or by rank by text.
+
+    Returns
+    -------
+    The ``SELECT`` of its ``page`` of researchers, or of all of them,
+    filtered by `joined` when ``joining``.
+
+    """
+    order_by = None if scenario.full_text else "asc"
+    if not joining:
+        return searched(
+            scenario.name,
+            order_by=order_by,
+            page=page,
+            filter_by=scenario.filters,
+            full_text=scenario.full_text,
+        )
+
+    statement = searched(
+        scenario.name,
+        order_by=order_by,
+        page=page,
+        full_text=scenario.full_text,
+    )
+    if not scenario.full_text:
+        return joined(statement, scenario.filters)
+    # ranks were ordered by the IDs filtered, as DISTINCT can't order them
+    lattes_id = col(tables.Researcher.lattes_id)
+    ids = joined(select(lattes_id), scenario.filters)  # type: ignore[arg-type]
+    return statement.where(lattes_id.in_(ids))
+
+
+def inlined(connection: Connection, statement: SelectedResearchers) -> str:
+    """SQL of a statement, as sent by the repository, with parameters inlined.
+
+    Returns
+    -------
+    SQL.
+
+    """
+    compiled = statement.compile(dialect=connection.dialect)
+    raw = connection.connection.driver_connection
+    return psycopg.ClientCursor(raw).mogrify(  # type: ignore[arg-type]
+        compiled.string,
+        compiled.params,
+    )
+
+
+def found(connection: Connection, statement: SelectedResearchers) -> set[int]:
+    ids = select(statement.subquery().c.lattes_id)
+    return set(connection.execute(ids).scalars())
+
+
+def compared(engine: Engine) -> dict[str, tuple[bool, int]]:
+    """Compare every scenario's researchers, when filtered by `joined`.
+
+    Researchers without rows on some related table were dropped by
+    `joined`, so only the ones with rows on all of them are compared.
+
+    Returns
+    -------
+    Whether each scenario has the same researchers, and how many
+    researchers dropped by `joined` it finds.
+
+    """
+    results = {}
+    with engine.connect() as connection:
+        complete = set(connection.exec_driver_sql(COMPLETE).scalars())
+        for name, scenario in SCENARIOS.items():
+            now = found(connection, built(scenario, page=None))
+            before = found(
+                connection,
+                built(scenario, page=None, joining=True),
+            )
+            results[name] = (now & complete == before, len(now - before))
+    return results
+
+
+def explained(
+    connection: Connection,
+    statement: str,
+    repeat: int,
+) -> tuple[float, dict[str, Any]]:
+    """Run a statement ``repeat`` times, through ``EXPLAIN ANALYZE``.
+
+    Returns
+    -------
+    The fastest run's execution milliseconds, and its plan.
+
+    """
+    raw = connection.connection.driver_connection
+    best = float("inf")
+    plan: dict[str, Any] = {}
+    for _ in range(repeat):
+        [[[explain]]] = raw.execute(  # type: ignore[union-attr]
+            f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}",
+        ).fetchall()
+        if explain["Execution Time"] < best:
+            best, plan = explain["Execution Time"], explain["Plan"]
+    return best, plan
+
+
+def scans(plan: dict[str, Any]) -> Iterator[str]:
+    """Scan of each table on a plan, e.g. ``education: Index Only Scan``.
+
+    Yields
+    ------
+    Its scans, depth first.
+
+    """
+    if "Relation Name" in plan:
+        yield f"{plan['Relation Name']}: {plan['Node Type']}"
+    for child in plan.get("Plans", []):
+        yield from scans(child)
+
+
+def text_plan(connection: Connection, statement: str) -> str:
+    raw = connection.connection.driver_connection
+    rows = raw.execute(  # type: ignore[union-attr]
+        f"EXPLAIN (ANALYZE, BUFFERS) {statement}",
+    ).fetchall()
+    return "\n".join(row[0] for row in rows)
+
+
+def measured(
+    engine: Engine,
+    repeat: int,
+    *,
+    plans: bool,
+    joining: bool = False,
+) -> dict[str, tuple[float, dict[str, Any]]]:
+    """Explain every scenario, with the indexes as they are.
+
+    Returns
+    -------
+    Fastest milliseconds and plan of each scenario.
+
+    """
+    results = {}
+    with engine.connect() as connection:
+        connection.exec_driver_sql("ANALYZE")
+        for scenario, searched_by in SCENARIOS.items():
+            statement = inlined(
+                connection,
+                built(searched_by, joining=joining),
+            )
+            results[scenario] = explained(connection, statement, repeat)
+            if plans:
+                print(f"-- {scenario}\n{text_plan(connection, statement)}\n")
+    return results
+
+
+def report(
+    before: dict[str, tuple[float, dict[str, Any]]],
+    joins: dict[str, tuple[float, dict[str, Any]]],
+    after: dict[str, tuple[float, dict[str, Any]]],
+    comparison: dict[str, tuple[bool, int]],
+) -> None:
+    print(
+        f"{'scenario':>10} {'before (ms)':>12} {'joined (ms)':>12}"
+        f" {'after (ms)':>11} {'speedup':>8} {'vs joined':>10}"
+        f" {'same':>5} {'kept':>6}  scans after",
+    )
+    for scenario in SCENARIOS:
+        slow, _ = before[scenario]
+        joining, _ = joins[scenario]
+        fast, plan = after[scenario]
+        same, kept = comparison[scenario]
+        print(
+            f"{scenario:>10} {slow:>12.1f} {joining:>12.1f} {fast:>11.1f}"
+            f" {slow / fast:>7.1f}x {joining / fast:>9.1f}x"
+            f" {'yes' if same else 'NO':>5} {kept:>6}"
+            f"  {', '.join(scans(plan))}",
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--researchers", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--reuse", action="store_true")
+    parser.add_argument("--plans", action="store_true")
+    arguments = parser.parse_args()
+
+    engine = Vitae.from_toml(Path("vitae.toml")).postgres.engine
+
+    if arguments.reuse:
+        with engine.begin() as connection:
+            drop_indexes(connection)
+    else:
+        fill(engine, arguments.researchers)
+
+    before = measured(engine, arguments.repeat, plans=arguments.plans)
+    with engine.begin() as connection:
+        create_indexes(connection)
+    joins = measured(
+        engine,
+        arguments.repeat,
+        plans=arguments.plans,
+        joining=True,
+    )
+    after = measured(engine, arguments.repeat, plans=arguments.plans)
+
+    report(before, joins, after, compared(engine))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+"""Synthetic Lattes curricula, since real ones can not be shared.
+
+Curricula follow the structure of the ones delivered by CNPq, with
+every element read by the parsing layer, some bibliographic production
+that is discarded while streaming, and Portuguese accented text, so the
+declared encoding matters. How many entries each one has is configured
+by a `Shape`, and they are written into the repository's layout:
+
+    <root>/
+        00/
+            0000000000000000.xml
+            ...
+        01/
+            0100000000000000.zip
+
+Generation is seeded, so the same arguments write the same curricula.
+
+Usage
+-----
+    $ python -m benchmarks.synthetic all_files
+    $ python -m benchmarks.synthetic all_files --groups 4 --curricula 5000
+    $ python -m benchmarks.synthetic all_files --educations 8 --zip
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+import random
+from typing import Literal
+from xml.sax.saxutils import quoteattr
+import zipfile
+
+type Encoding = Literal["iso-8859-1", "utf-8"]
+
+ENCODINGS: tuple[Encoding, ...] = ("iso-8859-1", "utf-8")
+
+DEGREES = (
+    "GRADUACAO",
+    "ESPECIALIZACAO",
+    "MESTRADO",
+    "DOUTORADO",
+    "POS-DOUTORADO",
+)
+LINKS = ("LIVRE", "SERVIDOR_PUBLICO", "CELETISTA", "COLABORADOR", "OUTRO")
+STATES = ("BA", "SP", "RJ", "MG", "PE", "RS", "PR", "CE", "AM", "DF")
+AREAS = (
+    ("CIENCIAS_EXATAS_E_DA_TERRA", "Ciência da Computação"),
+    ("CIENCIAS_EXATAS_E_DA_TERRA", "Matemática"),
+    ("CIENCIAS_BIOLOGICAS", "Genética"),
+    ("CIENCIAS_DA_SAUDE", "Saúde Coletiva"),
+    ("CIENCIAS_HUMANAS", "Educação"),
+    ("ENGENHARIAS", "Engenharia Elétrica"),
+)
+FIRST_NAMES = ("João", "Maria", "José", "Ana", "Antônio", "Conceição")
+LAST_NAMES = ("Silva", "Souza", "Conceição", "Araújo", "Simões", "Lúcio")
+WORDS = (
+    "pesquisa",
+    "educação",
+    "análise",
+    "informação",
+    "ciência",
+    "avaliação",
+    "saúde",
+    "produção",
+    "tecnologia",
+    "redes",
+)
+
+
+@dataclass(frozen=True)
+class Shape:
+    """How many entries of each kind a curriculum has.
+
+    Notes
+    -----
+    Education, experience and addresses reference ``institutions``
+    from a shared pool, only some of them detailed on
+    `DADOS-COMPLEMENTARES`, as ``complementary`` ones.
+
+    """
+
+    educations: int = 4
+    experiences: int = 3
+    areas: int = 3
+    complementary: int = 5
+    productions: int = 20
+    abstract: int = 1_000
+    encoding: Encoding = "iso-8859-1"
+    institutions: int = 500
+
+
+def lattes_id(group: int, index: int) -> str:
+    return f"{group:02}{index:014}"
+
+
+def curriculum(
+    researcher_id: str,
+    shape: Shape = Shape(),  # noqa: B008
+    seed: int = 0,
+) -> bytes:
+    """Synthetic curriculum of a Researcher.
+
+    Returns
+    -------
+    The XML document, encoded as declared by ``shape``.
+
+    """
+    rng = random.Random(f"{seed}:{researcher_id}")  # noqa: S311
+    referenced = shape.educations + shape.experiences + 1
+    institutions = rng.sample(
+        range(shape.institutions),
+        min(shape.institutions, max(shape.complementary, referenced)),
+    )
+
+    def institution() -> str:
+        return f"{rng.choice(institutions):06}"
+
+    year = rng.randint(1980, 2010)
+    full_name = " ".join(
+        (rng.choice(FIRST_NAMES), *rng.choices(LAST_NAMES, k=2)),
+    )
+    code = institution()
+
+    document = "".join(
+        (
+            f'<?xml version="1.0" encoding="{shape.encoding.upper()}"?>\n',
+            "<CURRICULO-VITAE",
+            _attributes(
+                SISTEMA_ORIGEM_XML="LATTES_OFFLINE",
+                NUMERO_IDENTIFICADOR=researcher_id,
+                DATA_ATUALIZACAO=(
+                    f"{rng.randint(1, 28):02}{rng.randint(1, 12):02}"
+                    f"{rng.randint(2015, 2025)}"
+                ),
+                HORA_ATUALIZACAO=f"{rng.randint(0, 23):02}0000",
+            ),
+            ">",
+            "<DADOS-GERAIS",
+            _attributes(
+                NOME_COMPLETO=full_name,
+                NOME_EM_CITACOES_BIBLIOGRAFICAS=full_name.upper(),
+                NACIONALIDADE="B",
+                PAIS_DE_NASCIMENTO="Brasil",
+                ORCID_ID=f"https://orcid.org/0000-000{rng.randint(1, 9)}"
+                f"-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+            ),
+            ">",
+            "<RESUMO-CV",
+            _attributes(TEXTO_RESUMO_CV_RH=_text(rng, shape.abstract)),
+            "/>",
+            "<ENDERECO><ENDERECO-PROFISSIONAL",
+            _attributes(
+                CODIGO_INSTITUICAO_EMPRESA=code,
+                NOME_INSTITUICAO_EMPRESA=f"Universidade {code}",
+                PAIS="Brasil",
+                UF=rng.choice(STATES),
+                CIDADE="São Paulo",
+                BAIRRO="Centro",
+                CEP=f"{rng.randint(10_000_000, 99_999_999)}",
+                LOGRADOURO_COMPLEMENTO="Rua da Conceição, 100",
+            ),
+            "/></ENDERECO>",
+            "<FORMACAO-ACADEMICA-TITULACAO>",
+            *(
+                _education(rng, i, year, institution())
+                for i in range(shape.educations)
+            ),
+            "</FORMACAO-ACADEMICA-TITULACAO>",
+            "<ATUACOES-PROFISSIONAIS>",
+            *(
+                _experience(rng, year, institution())
+                for _ in range(shape.experiences)
+            ),
+            "</ATUACOES-PROFISSIONAIS>",
+            "<AREAS-DE-ATUACAO>",
+            *(f"<AREA-DE-ATUACAO{_area(rng)}/>" for _ in range(shape.areas)),
+            "</AREAS-DE-ATUACAO>",
+            "</DADOS-GERAIS>",
+            "<PRODUCAO-BIBLIOGRAFICA><ARTIGOS-PUBLICADOS>",
+            *(
+                "<ARTIGO-PUBLICADO><DADOS-BASICOS-DO-ARTIGO"
+                + _attributes(
+                    TITULO_DO_ARTIGO=_text(rng, 120),
+                    ANO_DO_ARTIGO=str(rng.randint(year, 2025)),
+                )
+                + "/></ARTIGO-PUBLICADO>"
+                for _ in range(shape.productions)
+            ),
+            "</ARTIGOS-PUBLICADOS></PRODUCAO-BIBLIOGRAFICA>",
+            "<DADOS-COMPLEMENTARES>",
+            "<INFORMACOES-ADICIONAIS-INSTITUICOES>",
+            *(
+                "<INFORMACAO-ADICIONAL-INSTITUICAO"
+                + _attributes(
+                    CODIGO_INSTITUICAO=f"{number:06}",
+                    SIGLA_INSTITUICAO=f"U{number}",
+                    SIGLA_UF_INSTITUICAO=rng.choice(STATES),
+                    NOME_PAIS_INSTITUICAO="Brasil",
+                )
+                + "/>"
+                for number in institutions[: shape.complementary]
+            ),
+            "</INFORMACOES-ADICIONAIS-INSTITUICOES>",
+            "<INFORMACOES-ADICIONAIS-CURSOS>",
+            *(
+                "<INFORMACAO-ADICIONAL-CURSO"
+                + _attributes(CODIGO_CURSO=f"C{i}")
+                + _area(rng)
+                + "/>"
+                for i in range(shape.educations)
+            ),
+            "</INFORMACOES-ADICIONAIS-CURSOS>",
+            "</DADOS-COMPLEMENTARES>",
+            "</CURRICULO-VITAE>",
+        ),
+    )
+    return document.encode(shape.encoding, errors="xmlcharrefreplace")
+
+
+def generate(
+    root: Path,
+    *,
+    groups: int = 1,
+    curricula: int = 100,
+    shape: Shape = Shape(),  # noqa: B008
+    zipped: bool = False,
+    seed: int = 0,
+) -> list[Path]:
+    """Write synthetic curricula into ``root``, ``curricula`` per group.
+
+    With ``zipped``, each one is a ``.zip`` archive of its ``.xml``,
+    as downloaded from the Lattes' extraction service.
+
+    Returns
+    -------
+    Paths of the written files.
+
+    """
+    paths = []
+    for group in range(groups):
+        directory = root / f"{group:02}"
+        directory.mkdir(parents=True, exist_ok=True)
+
+        for index in range(curricula):
+            researcher_id = lattes_id(group, index)
+            content = curriculum(researcher_id, shape, seed)
+
+            if zipped:
+                path = directory / f"{researcher_id}.zip"
+                with zipfile.ZipFile(
+                    path, "w", zipfile.ZIP_DEFLATED
+                ) as archive:
+                    archive.writestr(f"{researcher_id}.xml", content)
+            else:
+                path = directory / f"{researcher_id}.xml"
+                path.write_bytes(content)
+
+            paths.append(path)
+    return paths
+
+
+def _education(
+    rng: random.Random,
+    index: int,
+    year: int,
+    institution: str,
+) -> str:
+    degree = DEGREES[index % len(DEGREES)]
+    start = year + 2 * index
+    return (
+        f"<{degree}"
+        + _attributes(
+            SEQUENCIA_FORMACAO=str(index + 1),
+            CODIGO_CURSO=f"C{index}",
+            NOME_CURSO=f"Curso de {rng.choice(AREAS)[1]}",
+            CODIGO_INSTITUICAO=institution,
+            NOME_INSTITUICAO=f"Universidade {institution}",
+            ANO_DE_INICIO=str(start),
+            ANO_DE_CONCLUSAO=str(start + rng.randint(1, 4)),
+            NUMERO_ID_ORIENTADOR=lattes_id(
+                rng.randrange(100),
+                rng.randrange(10**6),
+            ),
+        )
+        + "><AREAS-DO-CONHECIMENTO>"
+        + "".join(f"<AREA-DO-CONHECIMENTO-{i}{_area(rng)}/>" for i in (1, 2))
+        + f"</AREAS-DO-CONHECIMENTO></{degree}>"
+    )
+
+
+def _experience(rng: random.Random, year: int, institution: str) -> str:
+    start = rng.randint(year, 2020)
+    return (
+        "<ATUACAO-PROFISSIONAL"
+        + _attributes(
+            CODIGO_INSTITUICAO=institution,
+            NOME_INSTITUICAO=f"Universidade {institution}",
+        )
+        + "><VINCULOS"
+        + _attributes(
+            TIPO_DE_VINCULO=rng.choice(LINKS),
+            OUTRO_VINCULO_INFORMADO="",
+            ANO_INICIO=str(start),
+            ANO_FIM=str(start + rng.randint(0, 5)),
+        )
+        + "/></ATUACAO-PROFISSIONAL>"
+    )
+
+
+def _area(rng: random.Random) -> str:
+    major, area = rng.choice(AREAS)
+    return _attributes(
+        NOME_GRANDE_AREA_DO_CONHECIMENTO=major,
+        NOME_DA_AREA_DO_CONHECIMENTO=area,
+        NOME_DA_SUB_AREA_DO_CONHECIMENTO="",
+        NOME_DA_ESPECIALIDADE="",
+    )
+
+
+def _attributes(**attributes: str) -> str:
+    """Lattes' attributes, named with hyphens instead of underscores."""
+    return "".join(
+        f" {name.replace('_', '-')}={quoteattr(value)}"
+        for name, value in attributes.items()
+    )
+
+
+def _text(rng: random.Random, length: int) -> str:
+    words: list[str] = []
+    size = 0
+    while size < length:
+        words.append(rng.choice(WORDS))
+        size += len(words[-1]) + 1
+    return " ".join(words).capitalize()[:length]
+
+
+def add_shape_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add an option for each field of `Shape`."""
+    for name, default in vars(Shape()).items():
+        if name == "encoding":
+            parser.add_argument(f"--{name}", choices=ENCODINGS, default=default)
+        else:
+            parser.add_argument(f"--{name}", type=int, default=default)
+
+
+def shape_from(arguments: argparse.Namespace) -> Shape:
+    """Shape of the curricula, from the options of `add_shape_arguments`.
+
+    Returns
+    -------
+    The configured shape.
+
+    """
+    return Shape(**{name: getattr(arguments, name) for name in vars(Shape())})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("root", type=Path)
+    parser.add_argument("--groups", type=int, default=1)
+    parser.add_argument("--curricula", type=int, default=1_000)
+    parser.add_argument("--zip", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    add_shape_arguments(parser)
+    arguments = parser.parse_args()
+
+    paths = generate(
+        arguments.root,
+        groups=arguments.groups,
+        curricula=arguments.curricula,
+        shape=shape_from(arguments),
+        zipped=arguments.zip,
+        seed=arguments.seed,
+    )
+    print(f"{len(paths):,} curricula written into {arguments.root}")
+
+
+if __name__ == "__main__":
+    main()
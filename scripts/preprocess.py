@@ -5,10 +5,15 @@ Data Processing Steps
 
 - Unzip all ``.zip`` files under `all_files`.
   - This make easier to parse the files by removing the unzip step before hand.
-- Decode XML from ISO 8859-1 to UTF-8 due to compatibility issues with PostreSQL.
 - Prettify XML files to make it easier to debug and inspect.
+  - The original encoding (ISO 8859-1) is kept, since the ingestion parses
+    raw bytes honouring the XML declaration. There is no need to transcode.
 - Removes all old .zip files to save disk space.
 
+The repository is listed by the same cached `Manifest` used by the ingestion,
+under `paths.cache` of `vitae.toml`, so only the sub-directories changed since
+the last run are listed again.
+
 """
 
 from dataclasses import dataclass
@@ -20,6 +25,9 @@ from typing import Protocol, Self
 from xml.dom.minidom import parseString as XmlDom
 from zipfile import ZipFile
 
+from vitae.features.ingestion.manifest import Manifest
+from vitae.settings.vitae import Vitae
+
 
 class File(Protocol):
     file: Path
@@ -67,25 +75,15 @@ class Encoding:
 class Xml:
     file: Path
 
-    encoding: str = "iso-8859-1"
-
     def __bool__(self) -> bool:
         return self.file.exists()
 
-    @log("TO UTF-8 >> {}")
-    def to_utf_8(self) -> "Xml":
-        output = "utf-8"
-        content = self.file.read_text(encoding=self.encoding)
-        self.file.write_text(content, encoding=output)
-
-        return Xml(self.file, "utf-8")
-
     @log("PRETTIFY >> {}")
     def prettify(self) -> "Xml":
-        content = self.file.read_text(encoding=self.encoding)
-        self.file.write_text(
-            XmlDom(content).toprettyxml(indent="  "),
-            encoding=self.encoding,
+        """Prettify the XML in-place, keeping its declared encoding."""
+        dom = XmlDom(self.file.read_bytes())
+        self.file.write_bytes(
+            dom.toprettyxml(indent="  ", encoding=dom.encoding or "utf-8"),
         )
 
         return self
@@ -114,28 +112,44 @@ class Zip:
         self.file.unlink()
 
 
+def manifest_of(all_files: Path) -> Manifest:
+    """Cached `Manifest` of the repository, shared with `vitae ingest`."""
+    vitae = Vitae.from_toml(Path("vitae.toml"))
+    return Manifest(all_files, vitae.paths.cache / "manifest")
+
+
 def optmized(all_files: Path) -> None:
     """Script entry.
 
     Preprocess all files, skipping the already pre-processed.
 
-    Be careful. Since we can't ensure the file was already converted to UTF-8,
+    Be careful. Since we can't ensure the file was already prettified,
     this script only seeks if the equvalente XML file exists.
     """
     count: int = 0
     skipped: int = 0
     start = time.time()
+    manifest = manifest_of(all_files)
+
+    for group in manifest.groups():
+        files = manifest.records(group)
+        extracted = {
+            file.lattes_id for file in files if file.name.endswith(".xml")
+        }
 
-    for count, archive in enumerate(all_files.glob("**/*.zip"), start=1):
-        archive = Zip(archive)
-        extracted = archive.xml()
+        for file in files:
+            if not file.name.endswith(".zip"):
+                continue
+
+            count += 1
+            if file.lattes_id in extracted:
+                skipped += 1
+                continue
 
-        if not extracted:
+            archive = Zip(group / file.name)
             archive.unzip()
-            extracted.to_utf_8().prettify()
+            archive.xml().prettify()
             print()
-        else:
-            skipped += 1
 
     print(
         f"[FINISHED] {count} files processed, {skipped} skipped. In {time.time() - start} seconds.",
@@ -150,10 +164,11 @@ def force(all_files: Path, sub_folders: list[str]) -> None:
     """
     count: int = 0
     start = time.time()
+    manifest = manifest_of(all_files)
 
     for sub_folder in sub_folders:
-        for archive in all_files.glob(f"{sub_folder}/**/*.zip"):
-            Zip(archive).unzip().xml().to_utf_8().prettify()
+        for archive in manifest.files(all_files / sub_folder, ".zip"):
+            Zip(archive).unzip().xml().prettify()
             count += 1
 
             print()
@@ -5,11 +5,20 @@ bring data to the system.
 
 Usage
 -----
-    # For serial scanning ingestion
-    serial_scanning(Path("all_files"), ingestion(database))
+    # For serial ingestion
+    Ingestion(
+        researchers=Researchers(database, logs),
+        files=Path("all_files"),
+    ).ingest()
 
-    # For parallel scanning ingestion
-    arallel_scanning(Path("all_files"), ingestion(database))
+    # For parallel parsing, with a single database writer
+    Ingestion(
+        researchers=Researchers(database, logs),
+        files=Path("all_files"),
+        workers=8,
+    ).ingest()
+
+Or from the command line, with `vitae ingest --workers 8`.
 
 """
 
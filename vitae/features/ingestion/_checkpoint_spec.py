@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import pytest
+
+from vitae.features.ingestion.checkpoint import Checkpoint
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "ingestion" / "processed.ids"
+
+
+class DescribeCheckpoint:
+    def when_new_should_be_empty(self, path):
+        with Checkpoint(path) as checkpoint:
+            assert len(checkpoint) == 0
+            assert "0000000000000001" not in checkpoint
+
+    def has_added_ids(self, path):
+        with Checkpoint(path) as checkpoint:
+            checkpoint.add(["0000000000000002", "0000000000000001"])
+
+            assert "0000000000000001" in checkpoint
+            assert "0000000000000002" in checkpoint
+            assert "0000000000000003" not in checkpoint
+
+    def has_added_ids_when_reopened_without_closing(self, path):
+        Checkpoint(path).add(["0000000000000001"])
+        assert "0000000000000001" in Checkpoint(path)
+
+    def has_each_id_counted_once(self, path):
+        with Checkpoint(path) as checkpoint:
+            checkpoint.add(["1", "2"])
+        with Checkpoint(path) as checkpoint:
+            checkpoint.add(["2", "3"])
+            assert len(checkpoint) == 3
+
+    def is_sorted_when_closed(self, path):
+        with Checkpoint(path) as checkpoint:
+            checkpoint.add(["0300000000000000", "0100000000000000"])
+            checkpoint.add(["0200000000000000", "0100000000000000"])
+
+        assert path.stat().st_size == 3 * 8
+        assert Checkpoint(path).journal.stat().st_size == 0
+        assert list(Checkpoint(path)) == [
+            100000000000000,
+            200000000000000,
+            300000000000000,
+        ]
+
+    def is_compacted_once_the_journal_grows(self, path):
+        checkpoint = Checkpoint(path, compact_after=3)
+        checkpoint.add(["3", "1"])
+        assert path.stat().st_size == 0
+
+        checkpoint.add(["2"])
+        assert path.stat().st_size == 3 * 8
+        assert all(key in checkpoint for key in ("1", "2", "3"))
+
+    def can_search_any_of_many_ids(self, path):
+        with Checkpoint(path, compact_after=1_000) as checkpoint:
+            checkpoint.add(str(key) for key in range(0, 10_000, 3))
+
+        checkpoint = Checkpoint(path)
+        assert all(str(key) in checkpoint for key in range(0, 10_000, 3))
+        assert not any(str(key) in checkpoint for key in range(1, 10_000, 3))
+
+    def when_not_an_integer_should_not_contain(self, path):
+        assert "not-an-id.xml" not in Checkpoint(path)
+
+    def can_be_converted_from_the_processed_log(self, path, tmp_path):
+        log = tmp_path / "processed.log"
+        log.write_text("0000000000000002\n0000000000000001\n0000000000000002\n")
+
+        checkpoint = Checkpoint.from_log(log, path)
+
+        assert list(checkpoint) == [1, 2]
+        assert "0000000000000002" in checkpoint
@@ -0,0 +1,97 @@
+import os
+
+import pytest
+
+from vitae.features.ingestion import adapters
+from vitae.features.ingestion.curricula_cache import CurriculaCache
+
+
+def curriculum(lattes_id: str) -> adapters.Curriculum:
+    return adapters.Curriculum(
+        researcher=adapters.Researcher(
+            lattes_id=lattes_id,
+            full_name="João",
+            quotes_names=None,
+            orcid=None,
+            abstract="x" * 1000,
+            nationality=adapters.Nationality(None, None),
+            expertise=[],
+        ),
+        address=None,
+        education=[],
+        experience=[],
+    )
+
+
+@pytest.fixture
+def cache(tmp_path) -> CurriculaCache:
+    return CurriculaCache(tmp_path / "cache")
+
+
+def aged(cache: CurriculaCache, key: str, seconds: int) -> None:
+    os.utime(cache.path(key), ns=(seconds * 10**9, seconds * 10**9))
+
+
+class DescribeKey:
+    def is_the_same_for_the_same_file(self):
+        assert CurriculaCache.key("1.xml", b"<a/>") == CurriculaCache.key(
+            "1.xml",
+            b"<a/>",
+        )
+
+    def when_the_content_differs_should_differ(self):
+        assert CurriculaCache.key("1.xml", b"<a/>") != CurriculaCache.key(
+            "1.xml",
+            b"<b/>",
+        )
+
+    def when_the_name_differs_should_differ(self):
+        assert CurriculaCache.key("1.xml", b"<a/>") != CurriculaCache.key(
+            "2.xml",
+            b"<a/>",
+        )
+
+
+class DescribeGet:
+    def is_what_was_put(self, cache):
+        cache.put("ab12", curriculum("1"))
+        assert cache.get("ab12") == curriculum("1")
+
+    def when_not_cached_should_be_nothing(self, cache):
+        assert cache.get("ab12") is None
+
+    def when_corrupted_should_be_nothing(self, cache):
+        cache.put("ab12", curriculum("1"))
+        cache.path("ab12").write_bytes(b"corrupted")
+        assert cache.get("ab12") is None
+
+    def has_the_entry_marked_as_recently_used(self, cache):
+        cache.put("ab12", curriculum("1"))
+        aged(cache, "ab12", 1)
+
+        cache.get("ab12")
+        assert cache.path("ab12").stat().st_mtime > 1
+
+
+class DescribeEvict:
+    def when_under_the_limit_should_keep_everything(self, cache):
+        cache.put("ab12", curriculum("1"))
+        assert cache.evict() == 0
+        assert cache.get("ab12") is not None
+
+    def has_the_least_recently_used_removed_first(self, tmp_path):
+        keys = ["aa01", "bb02", "cc03"]
+        unlimited = CurriculaCache(tmp_path / "cache")
+        for seconds, key in enumerate(keys, start=1):
+            unlimited.put(key, curriculum(key))
+            aged(unlimited, key, seconds)
+
+        size = unlimited.path("aa01").stat().st_size
+        limited = CurriculaCache(tmp_path / "cache", max_bytes=int(2.5 * size))
+
+        assert limited.evict() > 0
+        assert [limited.path(key).exists() for key in keys] == [
+            False,
+            True,
+            True,
+        ]
@@ -0,0 +1,101 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from vitae.features.ingestion.manifest import File, Manifest
+
+
+@pytest.fixture
+def root(tmp_path: Path) -> Path:
+    root = tmp_path / "all_files"
+    for group in ("00", "01"):
+        (root / group).mkdir(parents=True)
+        for i in range(3):
+            (root / group / f"{group}{i:014}.xml").write_text("<CV/>")
+    return root
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Path:
+    return tmp_path / "cache" / "manifest"
+
+
+def touch_later(path: Path) -> None:
+    """Ensure a directory's mtime changes, whatever its resolution is."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class DescribeFile:
+    def its_lattes_id_is_derived_from_its_name(self):
+        assert File("0000000000000001.zip", 0, 0).lattes_id == "0000000000000001"
+
+
+class DescribeManifest:
+    def has_sorted_groups(self, root):
+        assert Manifest(root).groups() == [root / "00", root / "01"]
+
+    def has_files_of_a_group(self, root):
+        files = Manifest(root).files(root / "01", ".xml")
+        assert [file.name for file in files] == [
+            "0100000000000000.xml",
+            "0100000000000001.xml",
+            "0100000000000002.xml",
+        ]
+
+    def has_size_of_each_file(self, root):
+        records = Manifest(root).records(root / "00")
+        assert {record.size for record in records} == {len("<CV/>")}
+
+    def is_persisted_on_cache(self, root, cache):
+        Manifest(root, cache).files(root / "00")
+
+        assert (cache / "index.json").exists()
+        assert (cache / "00.tsv").exists()
+        assert not (cache / "01.tsv").exists()
+
+    def when_cached_should_not_list_again(self, root, cache):
+        mtime_ns = (root / "00").stat().st_mtime_ns
+        Manifest(root, cache).files(root / "00")
+
+        # Not seen, since the directory's modification time is the same.
+        extra = root / "00" / "0000000000000009.xml"
+        extra.write_text("<CV/>")
+        os.utime(root / "00", ns=(mtime_ns, mtime_ns))
+
+        files = Manifest(root, cache).files(root / "00")
+        assert extra not in files
+
+    def when_group_changed_should_list_again(self, root, cache):
+        Manifest(root, cache).files(root / "00")
+
+        extra = root / "00" / "0000000000000009.xml"
+        extra.write_text("<CV/>")
+        touch_later(root / "00")
+
+        assert extra in Manifest(root, cache).files(root / "00")
+
+    def when_group_is_removed_should_not_be_listed(self, root, cache):
+        Manifest(root, cache).files(root / "01")
+
+        for file in (root / "01").iterdir():
+            file.unlink()
+        (root / "01").rmdir()
+
+        manifest = Manifest(root, cache)
+        assert manifest.groups() == [root / "00"]
+        assert manifest.files(root / "01") == []
+
+    def when_cache_is_from_another_root_should_be_ignored(
+        self,
+        root,
+        cache,
+        tmp_path,
+    ):
+        Manifest(root, cache).files(root / "00")
+
+        other = tmp_path / "other"
+        (other / "00").mkdir(parents=True)
+
+        assert Manifest(other, cache).files(other / "00") == []
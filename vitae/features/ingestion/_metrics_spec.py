@@ -0,0 +1,92 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from vitae.features.ingestion import metrics
+from vitae.features.ingestion.metrics import Metered, Metrics, Sample
+
+
+@pytest.fixture
+def run(tmp_path: Path) -> Metrics:
+    return Metrics(directory=tmp_path / "ingestion", expected=4)
+
+
+class DescribeSample:
+    def has_the_bytes_read(self):
+        sample = Sample()
+        stream = Metered(io.BytesIO(b"<CURRICULO-VITAE/>"), sample)
+
+        while stream.read(4):
+            pass
+
+        assert sample.bytes == len(b"<CURRICULO-VITAE/>")
+
+    def has_parsing_apart_from_reading(self, monkeypatch):
+        clock = iter([0.0, 1.0, 3.0, 10.0])
+        monkeypatch.setattr(metrics.time, "perf_counter", lambda: next(clock))
+
+        sample = Sample()
+        with sample.timing():
+            Metered(io.BytesIO(b"<CURRICULO-VITAE/>"), sample).read()
+
+        assert sample.read == 2.0
+        assert sample.parse == 8.0
+
+
+class DescribeMetrics:
+    def has_documents_and_unchanged_apart(self, run):
+        run.add(Sample(bytes=10))
+        run.add(Sample(bytes=5, parsed=False))
+
+        assert run.counts["files"] == 2
+        assert run.counts["bytes"] == 15
+        assert run.counts["documents"] == 1
+        assert run.counts["unchanged"] == 1
+
+    def has_the_commit_latency(self, run):
+        with run.timing("commit"):
+            pass
+
+        assert run.counts["transactions"] == 1
+        assert run.slowest_commit == run.seconds["commit"]
+
+    def has_no_eta_before_handling_anything(self, run):
+        assert run.eta is None
+        assert "ETA ?" in run.progress()
+
+    def has_an_eta_once_handling(self, run):
+        run.add(Sample())
+        run.count("skipped")
+
+        assert run.handled == 2
+        assert run.eta is not None
+        assert run.progress().startswith("2/4 curricula")
+
+    def is_reported_at_the_end_of_each_group(self, run, tmp_path):
+        run.add(Sample(bytes=10))
+        run.rows["researcher"] += 1
+        run.write(tmp_path / "all_files" / "00")
+
+        report = json.loads((run.directory / "report.json").read_text())
+        assert report["groups"] == ["all_files/00"]
+        assert report["counts"]["documents"] == 1
+        assert report["rows"] == {"researcher": 1}
+        assert set(report["seconds"]) == {"read", "parse", "convert", "commit"}
+
+    def is_reported_for_prometheus(self, run, tmp_path):
+        run.rows["researcher"] += 3
+        run.write(tmp_path / "all_files" / "00")
+
+        textfile = (run.directory / "ingestion.prom").read_text()
+        assert 'vitae_ingestion_rows_total{table="researcher"} 3' in textfile
+        assert "# TYPE vitae_ingestion_groups_total counter" in textfile
+        assert "vitae_ingestion_groups_total 1" in textfile
+
+    def when_without_directory_should_not_be_reported(self, tmp_path):
+        run = Metrics()
+        run.write(tmp_path / "all_files" / "00")
+
+        assert run.groups == ["all_files/00"]
+        assert list(tmp_path.iterdir()) == []
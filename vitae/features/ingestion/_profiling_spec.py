@@ -0,0 +1,75 @@
+from pathlib import Path
+import pstats
+import tracemalloc
+
+import pytest
+
+from vitae.features.ingestion.profiling import (
+    CpuProfiler,
+    MemoryProfiler,
+    profiler_from,
+)
+
+
+@pytest.fixture
+def directory(tmp_path: Path) -> Path:
+    return tmp_path / "profiles"
+
+
+@pytest.fixture
+def group(tmp_path: Path) -> Path:
+    return tmp_path / "all_files" / "00"
+
+
+def allocate() -> list[bytes]:
+    return [bytes(1024) for _ in range(1024)]
+
+
+class DescribeCpuProfiler:
+    def has_sortable_stats_of_each_group(self, directory, group):
+        with CpuProfiler(directory) as profiler, profiler.group(group):
+            allocate()
+
+        stats = pstats.Stats(str(directory / "00.cpu.prof"))
+        assert any(name == "allocate" for *_, name in stats.stats)
+
+    def has_a_report_of_each_group(self, directory, group):
+        with CpuProfiler(directory) as profiler, profiler.group(group):
+            allocate()
+
+        assert "allocate" in (directory / "00.cpu.txt").read_text()
+
+
+class DescribeMemoryProfiler:
+    def has_the_top_allocations_of_each_group(self, directory, group):
+        with MemoryProfiler(directory) as profiler, profiler.group(group):
+            allocated = allocate()  # noqa: F841
+
+        report = (directory / "00.memory.txt").read_text()
+        assert "Top 50 allocations" in report
+        assert "_profiling_spec.py" in report
+
+    def has_the_growth_since_the_last_group(self, directory, tmp_path):
+        with MemoryProfiler(directory) as profiler:
+            with profiler.group(tmp_path / "00"):
+                pass
+            with profiler.group(tmp_path / "01"):
+                pass
+
+        assert "growths" not in (directory / "00.memory.txt").read_text()
+        assert "growths" in (directory / "01.memory.txt").read_text()
+
+    def when_closed_should_stop_tracing(self, directory):
+        with MemoryProfiler(directory):
+            assert tracemalloc.is_tracing()
+        assert not tracemalloc.is_tracing()
+
+
+class DescribeProfilerFrom:
+    def when_no_kind_should_be_none(self, directory):
+        with profiler_from(None, directory) as profiler:
+            assert profiler is None
+
+    def is_the_profiler_of_a_kind(self, directory):
+        with profiler_from("cpu", directory) as profiler:
+            assert isinstance(profiler, CpuProfiler)
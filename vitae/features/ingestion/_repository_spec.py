@@ -0,0 +1,228 @@
+from dataclasses import dataclass, field
+
+import pytest
+
+from vitae.features.ingestion import adapters, repository
+from vitae.features.ingestion.metrics import Metrics
+from vitae.features.ingestion.repository import Researchers
+from vitae.features.ingestion.sinks import NullSink
+
+
+def curriculum(lattes_id: str) -> adapters.Curriculum:
+    return adapters.Curriculum(
+        researcher=adapters.Researcher(
+            lattes_id=lattes_id,
+            full_name=f"Researcher {lattes_id}",
+            quotes_names=None,
+            orcid=None,
+            abstract=None,
+            nationality=adapters.Nationality(None, None),
+            expertise=[],
+        ),
+        address=None,
+        education=[],
+        experience=[],
+    )
+
+
+@dataclass
+class Put:
+    defected: set[str]
+    transactions: list[list[str]] = field(default_factory=list)
+    upserted: list[str] = field(default_factory=list)
+
+    def batch_transaction(
+        self,
+        institutions,  # noqa: ARG002
+        curricula,
+        *,
+        upsert=False,
+    ) -> bool:
+        ids = [
+            f"{table.lattes_id:016}"
+            for table in curricula.researchers.researchers
+        ]
+        self.transactions.append(ids)
+        if upsert:
+            self.upserted.extend(ids)
+        return not self.defected.intersection(ids)
+
+
+@dataclass
+class Session:
+    queries: list = field(default_factory=list)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return None
+
+    def exec(self, query):
+        self.queries.append(query)
+        return []
+
+
+@dataclass
+class Database:
+    put: Put
+    session: Session = field(default_factory=Session)
+
+
+@dataclass
+class Log:
+    processed: list[str] = field(default_factory=list)
+    rolledback: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+    def info(self, message: str) -> None:
+        self.processed.append(message)
+
+    def warning(self, message: str) -> None:
+        self.rolledback.append(message)
+
+    def error(self, message: str) -> None:
+        self.failed.append(message)
+
+
+@pytest.fixture
+def curricula() -> list[adapters.Curriculum]:
+    return [curriculum(f"{i:016}") for i in range(16)]
+
+
+def researchers_with(monkeypatch, tmp_path, *defected: int, upsert=False):
+    monkeypatch.setattr(repository, "log_with", lambda *_: None)
+
+    db = Database(Put({f"{i:016}" for i in defected}))
+    researchers = Researchers(
+        db=db,
+        log_directory=tmp_path,
+        every=16,
+        upsert=upsert,
+    )
+    researchers.log = Log()
+    return researchers
+
+
+class DescribePut:
+    def when_all_are_stored_should_use_one_transaction(
+        self,
+        monkeypatch,
+        tmp_path,
+        curricula,
+    ):
+        researchers = researchers_with(monkeypatch, tmp_path)
+        researchers.put(curricula)
+
+        assert len(researchers.db.put.transactions) == 1
+        assert len(researchers.log.processed) == 16
+
+    def has_the_rolledback_group_logged(self, monkeypatch, tmp_path, curricula):
+        researchers = researchers_with(monkeypatch, tmp_path, 5)
+        researchers.put(curricula)
+
+        assert researchers.log.rolledback == [
+            ",".join(cv.id for cv in curricula),
+        ]
+
+    def has_only_the_defected_logged_as_failed(
+        self,
+        monkeypatch,
+        tmp_path,
+        curricula,
+    ):
+        researchers = researchers_with(monkeypatch, tmp_path, 5, 12)
+        researchers.put(curricula)
+
+        assert researchers.log.failed == [f"{5:016}", f"{12:016}"]
+        assert sorted(researchers.log.processed) == sorted(
+            cv.id for cv in curricula if cv.id not in researchers.log.failed
+        )
+
+    def is_bisected_instead_of_one_by_one(
+        self,
+        monkeypatch,
+        tmp_path,
+        curricula,
+    ):
+        researchers = researchers_with(monkeypatch, tmp_path, 5)
+        researchers.put(curricula)
+
+        # 1 for the group, then 2 for each one of the 4 halving levels.
+        assert len(researchers.db.put.transactions) == 1 + 2 * 4
+
+    def when_not_upserting_should_upsert_nothing(
+        self,
+        monkeypatch,
+        tmp_path,
+        curricula,
+    ):
+        researchers = researchers_with(monkeypatch, tmp_path)
+        researchers.put(curricula)
+
+        assert researchers.db.put.upserted == []
+
+    def when_upserting_should_upsert_each_one(
+        self,
+        monkeypatch,
+        tmp_path,
+        curricula,
+    ):
+        researchers = researchers_with(monkeypatch, tmp_path, upsert=True)
+        researchers.put(curricula)
+
+        assert researchers.db.put.upserted == [cv.id for cv in curricula]
+
+
+class DescribeMetrics:
+    def has_the_rows_stored_by_table(self, monkeypatch, tmp_path, curricula):
+        researchers = researchers_with(monkeypatch, tmp_path)
+        researchers.metrics = Metrics()
+        researchers.put(curricula)
+
+        assert researchers.metrics.rows == {
+            "researcher": 16,
+            "nationality": 16,
+        }
+        assert researchers.metrics.counts["transactions"] == 1
+
+    def has_the_rollbacks_and_failures(self, monkeypatch, tmp_path, curricula):
+        researchers = researchers_with(monkeypatch, tmp_path, 5)
+        researchers.metrics = Metrics()
+        researchers.put(curricula)
+
+        counts = researchers.metrics.counts
+        assert counts["rolledback_groups"] == 1
+        assert counts["rollbacks"] == 1 + 4
+        assert counts["failed"] == 1
+        assert researchers.metrics.rows["researcher"] == 15
+
+
+class DescribeSink:
+    def when_given_should_not_touch_the_database(
+        self,
+        monkeypatch,
+        tmp_path,
+        curricula,
+    ):
+        researchers = researchers_with(monkeypatch, tmp_path, 5)
+        researchers.sink = NullSink()
+        researchers.put(curricula)
+
+        assert researchers.db.put.transactions == []
+        assert len(researchers.log.processed) == 16
+
+    def has_nothing_stored(self, monkeypatch, tmp_path):
+        researchers = researchers_with(monkeypatch, tmp_path)
+        researchers.sink = NullSink()
+
+        assert researchers.last_updates([f"{0:016}"]) == {}
+
+
+class DescribeLastUpdates:
+    def has_only_numeric_ids_queried(self, monkeypatch, tmp_path):
+        researchers = researchers_with(monkeypatch, tmp_path)
+
+        assert researchers.last_updates(["", "README", f"{7:016}"]) == {}
+        (query,) = researchers.db.session.queries
+        assert list(query.compile().params.values()) == [[7]]
@@ -0,0 +1,143 @@
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from vitae.features.ingestion.sinks import (
+    JsonLinesSink,
+    NullSink,
+    StagingSink,
+    sink_from,
+)
+from vitae.infra.database import tables
+from vitae.infra.database.transactions import bulk
+
+
+def institution(lattes_id: str) -> tables.Institution:
+    return tables.Institution(
+        lattes_id=lattes_id,
+        name="Universidade de São Paulo",
+        abbr="USP",
+        country="Brasil",
+        state="SP",
+    )
+
+
+def batch(*lattes_ids: int) -> tuple[bulk.Institutions, bulk.Curricula]:
+    return bulk.Institutions([institution("I1")]), bulk.Curricula(
+        researchers=bulk.Researchers(
+            researchers=[
+                tables.Researcher(
+                    lattes_id=lattes_id,
+                    full_name="João",
+                    quotes_names=None,
+                    orcid=None,
+                    abstract=None,
+                )
+                for lattes_id in lattes_ids
+            ],
+            nationality=[],
+            expertise=[],
+        ),
+        academic=bulk.Academic(education=[], fields=[], advisoring=[]),
+        professional=bulk.Professional(experience=[], address=[]),
+    )
+
+
+def lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class DescribeNullSink:
+    def is_always_stored(self):
+        assert NullSink().batch_transaction(*batch(1), upsert=True)
+
+
+class DescribeJsonLinesSink:
+    def has_a_line_per_row_tagged_by_table(self, tmp_path):
+        with JsonLinesSink(tmp_path) as sink:
+            assert sink.batch_transaction(*batch(1, 2))
+
+        rows = lines(tmp_path / "curricula.jsonl")
+        assert [row["table"] for row in rows] == [
+            "institution",
+            "researcher",
+            "researcher",
+        ]
+        assert rows[1]["row"]["lattes_id"] == 1
+        assert rows[1]["row"]["full_name"] == "João"
+
+    def has_each_institution_only_once(self, tmp_path):
+        with JsonLinesSink(tmp_path) as sink:
+            sink.batch_transaction(*batch(1))
+            sink.batch_transaction(*batch(2))
+
+        tables = [row["table"] for row in lines(sink.path)]
+        assert tables.count("institution") == 1
+
+    def is_truncated_once_open(self, tmp_path):
+        for lattes_id in (1, 2):
+            with JsonLinesSink(tmp_path) as sink:
+                sink.batch_transaction(*batch(lattes_id))
+
+        rows = lines(sink.path)
+        assert [row["row"]["lattes_id"] for row in rows[1:]] == [2]
+
+    def when_closed_cannot_write(self, tmp_path):
+        with pytest.raises(RuntimeError):
+            JsonLinesSink(tmp_path).batch_transaction(*batch(1))
+
+
+class DescribeSinkFrom:
+    def when_database_is_nothing(self, tmp_path):
+        with sink_from("database", tmp_path) as sink:
+            assert sink is None
+
+    def can_be_a_null_sink(self, tmp_path):
+        with sink_from("null", tmp_path) as sink:
+            assert isinstance(sink, NullSink)
+
+        assert not list(tmp_path.iterdir())
+
+
+class DescribeStagingSink:
+    def has_a_file_per_table_and_group(self, tmp_path):
+        with StagingSink(tmp_path) as sink:
+            sink.batch_transaction(*batch(1))
+            sink.batch_transaction(*batch(100000000000001))
+
+        assert sorted(
+            str(path.relative_to(tmp_path)) for path in tmp_path.rglob("*.*")
+        ) == [
+            "institution/00.csv",
+            "researcher/00.csv",
+            "researcher/01.csv",
+        ]
+
+    def has_a_row_per_line_after_the_header(self, tmp_path):
+        with StagingSink(tmp_path) as sink:
+            sink.batch_transaction(*batch(1, 2))
+
+        with (tmp_path / "researcher" / "00.csv").open() as file:
+            rows = list(csv.DictReader(file))
+        assert [row["lattes_id"] for row in rows] == ["1", "2"]
+        assert rows[0]["full_name"] == "João"
+
+    def when_failed_should_keep_the_group_partial(self, tmp_path):
+        with pytest.raises(RuntimeError), StagingSink(tmp_path) as sink:
+            sink.batch_transaction(*batch(1))
+            raise RuntimeError
+
+        assert (tmp_path / "researcher" / "00.csv.part").exists()
+        assert not (tmp_path / "researcher" / "00.csv").exists()
+
+    def when_staged_again_should_replace_the_group(self, tmp_path):
+        with StagingSink(tmp_path) as sink:
+            sink.batch_transaction(*batch(1))
+        with StagingSink(tmp_path) as sink:
+            sink.batch_transaction(*batch(2))
+
+        with (tmp_path / "researcher" / "00.csv").open() as file:
+            rows = list(csv.DictReader(file))
+        assert [row["lattes_id"] for row in rows] == ["2"]
@@ -0,0 +1,74 @@
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from vitae.features.ingestion.sources import (
+    UnreadableArchive,
+    ZippedXml,
+    xml_files,
+    zipped_xml,
+)
+from vitae.features.ingestion.usecase import curriculum_from
+
+CURRICULUM = (
+    b'<?xml version="1.0" encoding="ISO-8859-1"?>'
+    b"<CURRICULO-VITAE>"
+    b'<DADOS-GERAIS NOME-COMPLETO="Jo\xe3o Ant\xf4nio"/>'
+    b"</CURRICULO-VITAE>"
+)
+
+
+@pytest.fixture
+def directory(tmp_path: Path) -> Path:
+    (tmp_path / "0000000000000001.xml").write_bytes(CURRICULUM)
+
+    with ZipFile(tmp_path / "0000000000000002.zip", "w") as archive:
+        archive.writestr("0000000000000002.xml", CURRICULUM)
+
+    return tmp_path
+
+
+class DescribeXmlFiles:
+    def has_only_xml_files(self, directory):
+        assert [entry.name for entry in xml_files(sorted(directory.iterdir()))] == [
+            "0000000000000001.xml",
+        ]
+
+    def its_curriculum_is_named_by_the_file(self, directory):
+        entry = next(xml_files(sorted(directory.iterdir())))
+        curriculum = curriculum_from(entry)
+        assert curriculum.researcher.lattes_id == "0000000000000001"
+
+
+class DescribeZippedXml:
+    def has_only_zip_archives_named_as_xml(self, directory):
+        assert [entry.name for entry in zipped_xml(sorted(directory.iterdir()))] == [
+            "0000000000000002.xml",
+        ]
+
+    def its_curriculum_is_read_from_the_archive(self, directory):
+        entry = next(zipped_xml(sorted(directory.iterdir())))
+        curriculum = curriculum_from(entry)
+        assert curriculum.researcher.lattes_id == "0000000000000002"
+        assert curriculum.researcher.full_name == "João Antônio"
+
+    def can_be_streamed(self, directory):
+        entry = next(zipped_xml(sorted(directory.iterdir())))
+        curriculum = curriculum_from(entry, streaming=True)
+        assert curriculum.researcher.full_name == "João Antônio"
+
+    def when_without_a_curriculum_should_name_the_archive(self, tmp_path):
+        path = tmp_path / "0000000000000003.zip"
+        with ZipFile(path, "w") as archive:
+            archive.writestr("readme.txt", b"")
+
+        with pytest.raises(UnreadableArchive, match="0000000000000003.zip"):
+            curriculum_from(ZippedXml(path))
+
+    def when_corrupt_should_name_the_archive(self, tmp_path):
+        path = tmp_path / "0000000000000004.zip"
+        path.write_bytes(b"not a zip")
+
+        with pytest.raises(UnreadableArchive, match="0000000000000004.zip"):
+            curriculum_from(ZippedXml(path))
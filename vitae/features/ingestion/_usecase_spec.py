@@ -0,0 +1,220 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from vitae.features.ingestion.curricula_cache import CurriculaCache
+from vitae.features.ingestion.metrics import Metrics
+from vitae.features.ingestion.sources import XmlFile
+from vitae.features.ingestion.usecase import (
+    Ingestion,
+    process_each,
+    process_in_parallel,
+)
+
+
+@pytest.fixture
+def entries(tmp_path: Path) -> list[XmlFile]:
+    paths = [tmp_path / f"{i:016}.xml" for i in range(10)]
+    for i, path in enumerate(paths):
+        path.write_text(
+            '<CURRICULO-VITAE DATA-ATUALIZACAO="18102026"'
+            ' HORA-ATUALIZACAO="093000">'
+            f'<DADOS-GERAIS NOME-COMPLETO="Researcher {i}"/>'
+            "</CURRICULO-VITAE>",
+        )
+    return [XmlFile(path) for path in paths]
+
+
+@dataclass(frozen=True)
+class CountedCache(CurriculaCache):
+    evictions: list[int] = field(default_factory=list)
+
+    def evict(self) -> int:
+        self.evictions.append(super().evict())
+        return self.evictions[-1]
+
+
+@dataclass
+class Stored:
+    lattes_ids: list[str] = field(default_factory=list)
+    queried: list[str] = field(default_factory=list)
+
+    def put(self, curricula) -> None:
+        self.lattes_ids.extend(
+            curriculum.researcher.lattes_id for curriculum in curricula
+        )
+
+    def last_updates(self, lattes_ids) -> dict[str, datetime | None]:
+        self.queried.extend(lattes_ids)
+        return {}
+
+
+@pytest.fixture
+def updated_at() -> datetime:
+    return datetime(2026, 10, 18, 9, 30)  # noqa: DTZ001
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+class DescribeProcessInParallel:
+    def is_the_same_as_processing_each(self, entries, pool):
+        parallel = process_in_parallel(entries, set(), pool, in_flight=3)
+        serial = process_each(entries, set())
+
+        assert [cv.researcher for cv in parallel] == [
+            cv.researcher for cv in serial
+        ]
+
+    def has_the_order_of_its_entries(self, entries, pool):
+        curricula = process_in_parallel(entries, set(), pool, in_flight=3)
+        assert [cv.id for cv in curricula] == [f"{i:016}" for i in range(10)]
+
+    def when_skipped_should_not_be_parsed(self, entries, pool):
+        to_skip = {entry.lattes_id for entry in entries[1:]}
+        curricula = process_in_parallel(entries, to_skip, pool)
+        assert [cv.id for cv in curricula] == [f"{0:016}"]
+
+    def when_stored_and_not_updated_should_not_be_parsed(
+        self,
+        entries,
+        updated_at,
+        pool,
+    ):
+        stored = {entry.lattes_id: updated_at for entry in entries[1:]}
+        curricula = process_in_parallel(entries, set(), pool, stored=stored)
+        assert [cv.id for cv in curricula] == [f"{0:016}"]
+
+
+class DescribeProcessEach:
+    def when_stored_and_not_updated_should_not_be_parsed(
+        self,
+        entries,
+        updated_at,
+    ):
+        stored = {entry.lattes_id: updated_at for entry in entries[1:]}
+        curricula = process_each(entries, set(), stored=stored)
+        assert [cv.id for cv in curricula] == [f"{0:016}"]
+
+    def when_stored_and_updated_should_be_parsed(self, entries, updated_at):
+        stored = {entries[0].lattes_id: updated_at.replace(year=2025)}
+        curricula = process_each(entries[:1], set(), stored=stored)
+        assert [cv.researcher.updated_at for cv in curricula] == [updated_at]
+
+    def when_stored_without_update_should_be_parsed(self, entries):
+        stored = {entries[0].lattes_id: None}
+        curricula = process_each(entries[:1], set(), stored=stored)
+        assert [cv.id for cv in curricula] == [f"{0:016}"]
+
+    def has_its_throughput_measured(self, entries, updated_at):
+        metrics = Metrics()
+        to_skip = {entries[0].lattes_id}
+        stored = {entries[1].lattes_id: updated_at}
+
+        list(process_each(entries, to_skip, stored=stored, metrics=metrics))
+
+        assert metrics.counts["skipped"] == 1
+        assert metrics.counts["unchanged"] == 1
+        assert metrics.counts["documents"] == 8
+        assert metrics.counts["files"] == 9
+        assert metrics.counts["bytes"] == sum(
+            entry.path.stat().st_size for entry in entries[1:]
+        )
+
+    def when_cached_should_not_be_parsed_again(self, entries, tmp_path):
+        cache = CurriculaCache(tmp_path / "cache")
+        first = list(process_each(entries, set(), cache=cache))
+
+        metrics = Metrics()
+        again = list(process_each(entries, set(), cache=cache, metrics=metrics))
+
+        assert [cv.researcher for cv in again] == [
+            cv.researcher for cv in first
+        ]
+        assert metrics.counts["cached"] == len(entries)
+
+    def when_changed_should_be_parsed_again(self, entries, tmp_path):
+        cache = CurriculaCache(tmp_path / "cache")
+        list(process_each(entries[:1], set(), cache=cache))
+        entries[0].path.write_text(
+            '<CURRICULO-VITAE><DADOS-GERAIS NOME-COMPLETO="Renamed"/>'
+            "</CURRICULO-VITAE>",
+        )
+
+        metrics = Metrics()
+        (curriculum,) = process_each(
+            entries[:1],
+            set(),
+            cache=cache,
+            metrics=metrics,
+        )
+
+        assert curriculum.researcher.full_name == "Renamed"
+        assert metrics.counts["cached"] == 0
+
+
+@pytest.fixture
+def files(tmp_path: Path, entries: list[XmlFile]) -> Path:
+    files = tmp_path / "all_files"
+    for group, group_entries in (("00", entries[:5]), ("01", entries[5:])):
+        (files / group).mkdir(parents=True)
+        for entry in group_entries:
+            entry.path.rename(files / group / entry.path.name)
+    return files
+
+
+class DescribeIngestion:
+    def when_incremental_should_query_only_curricula(self, files, entries):
+        (files / "00" / ".DS_Store").write_bytes(b"")
+        (files / "00" / "README").write_text("Curricula of 2026")
+
+        researchers = Stored()
+        Ingestion(
+            researchers=researchers,
+            files=files,
+            incremental=True,
+        ).ingest()
+
+        assert sorted(researchers.queried) == sorted(
+            entry.lattes_id for entry in entries
+        )
+        assert len(researchers.lattes_ids) == len(entries)
+
+    def has_the_cache_evicted_once_per_run(self, tmp_path, files, entries):
+        researchers = Stored()
+        cache = CountedCache(tmp_path / "cache")
+        Ingestion(researchers=researchers, files=files, cache=cache).ingest()
+
+        assert len(researchers.lattes_ids) == len(entries)
+        assert cache.evictions == [0]
+
+    def has_the_cache_evicted_every_few_groups(self, tmp_path, files):
+        cache = CountedCache(tmp_path / "cache")
+        Ingestion(
+            researchers=Stored(),
+            files=files,
+            cache=cache,
+            evict_every=1,
+        ).ingest()
+
+        assert cache.evictions == [0, 0]
+
+    def when_failed_should_have_the_cache_evicted(self, tmp_path, files):
+        class Failing(Stored):
+            def put(self, curricula) -> None:
+                list(curricula)
+                message = "database is gone"
+                raise ConnectionError(message)
+
+        cache = CountedCache(tmp_path / "cache")
+        with pytest.raises(ConnectionError):
+            Ingestion(researchers=Failing(), files=files, cache=cache).ingest()
+
+        assert cache.evictions == [0]
+        assert len(list((tmp_path / "cache").rglob("*.pickle.z"))) == 5
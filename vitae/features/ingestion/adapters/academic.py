@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 import uuid
 
@@ -13,7 +13,23 @@ if TYPE_CHECKING:
 
     from .institution import Institution
 
-__all__ = ["Education", "StudyField"]
+__all__ = ["Education", "StudyField", "education_id"]
+
+EDUCATIONS = uuid.UUID("5d1b7c1e-8f0a-4d6e-9a53-2f4c6b8e0a17")
+
+
+def education_id(researcher_id: str, ordinal: int) -> uuid.UUID:
+    """ID of a Researcher's education, by its position on the curriculum.
+
+    The same curriculum always gets the same IDs,
+    so reloading it replaces its rows instead of adding new ones.
+
+    Returns
+    -------
+    A name based UUID, under the ``EDUCATIONS`` namespace.
+
+    """
+    return uuid.uuid5(EDUCATIONS, f"{int(researcher_id)}:{ordinal}")
 
 
 @dataclass
@@ -34,14 +50,14 @@ class Education:
     fields: list[StudyField]
 
     advisor: str | None
-    id: uuid.UUID = field(default_factory=uuid.uuid1)
+    id: uuid.UUID
 
     @property
     def as_table(self) -> tables.Education:
         """Itself as Database Table."""
         return tables.Education(
             id=self.id,
-            researcher_id=self.researcher_id,
+            researcher_id=int(self.researcher_id),
             institution_id=self.institution.lattes_id,
             category=self.category,
             course=self.course,
@@ -51,13 +67,13 @@ class Education:
 
     @property
     def advisor_as_table(self) -> tables.Advising | None:
-        if not self.advisor:
+        if not self.advisor or not self.advisor.isdigit():
             return None
 
         return tables.Advising(
             education_id=self.id,
-            student_id=self.researcher_id,
-            advisor_id=self.advisor,
+            student_id=int(self.researcher_id),
+            advisor_id=int(self.advisor),
         )
 
     @property
@@ -68,7 +84,7 @@ class Education:
     @property
     def fields_as_table(self) -> Iterable[tables.StudyField]:
         """Its Study Field as Database Table."""
-        return (field.as_table(str(self.id)) for field in self.fields)
+        return (field.as_table(self.id) for field in self.fields)
 
 
 @dataclass
@@ -80,7 +96,7 @@ class StudyField:
     sub: str | None
     specialty: str | None
 
-    def as_table(self, education_id: str) -> tables.StudyField:
+    def as_table(self, education_id: uuid.UUID) -> tables.StudyField:
         """Itself as Database Table."""  # noqa: DOC201
         return tables.StudyField(
             education_id=education_id,
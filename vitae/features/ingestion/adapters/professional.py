@@ -31,7 +31,7 @@ class Address:
     def as_table(self) -> tables.Address:
         """Itself as a Database Schema."""
         return tables.Address(
-            researcher_id=self.researcher_id,
+            researcher_id=int(self.researcher_id),
             institution_id=self.institution.lattes_id,
             country=self.country,
             state=self.state,
@@ -56,7 +56,7 @@ class Experience:
     def as_table(self) -> tables.Experience:
         """Itself as Database Schema."""
         return tables.Experience(
-            researcher_id=self.researcher_id,
+            researcher_id=int(self.researcher_id),
             institution_id=self.institution.lattes_id,
             relationship=self.relationship,
             start=self.start,
@@ -6,9 +6,11 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from vitae.infra.database import tables
+from vitae.infra.database.tables.text_search import folded
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from datetime import datetime
 
 __all__ = ["Expertise", "Nationality", "Researcher"]
 
@@ -26,16 +28,37 @@ class Researcher:
     nationality: Nationality
     expertise: list[Expertise]
 
+    updated_at: datetime | None = None
+
     @property
     def as_table(self) -> tables.Researcher:
         """Itself as database table."""
         return tables.Researcher(
-            lattes_id=self.lattes_id,
+            lattes_id=int(self.lattes_id),
             full_name=self.full_name,
+            search_name=folded(self.full_name),
             quotes_names=self.quotes_names,
             orcid=self.orcid,
             abstract=self.abstract,
+            updated_at=self.updated_at,
+            expertise_areas=self.expertise_areas,
+        )
+
+    @property
+    def expertise_areas(self) -> str | None:
+        """Every area of its expertise, once, as searched by full-text."""
+        areas = dict.fromkeys(
+            area
+            for expertise in self.expertise
+            for area in (
+                expertise.major,
+                expertise.area,
+                expertise.sub,
+                expertise.speciality,
+            )
+            if area
         )
+        return "; ".join(areas) or None
 
     @property
     def nationality_table(self) -> tables.Nationality:
@@ -60,7 +83,7 @@ class Nationality:
     def as_table(self, researcher_id: str) -> tables.Nationality:
         """Itself as database table."""  # noqa: DOC201
         return tables.Nationality(
-            researcher_id=researcher_id,
+            researcher_id=int(researcher_id),
             born_country=self.born_country,
             nationality=self.nationality,
         )
@@ -78,7 +101,7 @@ class Expertise:
     def as_table(self, researcher_id: str) -> tables.Expertise:
         """Itself as database table."""  # noqa: DOC201
         return tables.Expertise(
-            researcher_id=researcher_id,
+            researcher_id=int(researcher_id),
             major=self.major,
             area=self.area,
             sub=self.sub,
@@ -0,0 +1,187 @@
+"""Resume checkpoint of processed Curricula.
+
+Millions of Lattes IDs as a set of strings costs hundreds of MB and a
+long startup, just to know which curricula to skip. Instead, the IDs are
+kept as sorted unsigned 64-bit integers on a binary file, which is
+memory-mapped and binary-searched, so nothing is loaded up-front.
+
+Newly processed IDs are appended to a small journal, kept in memory,
+which is merged into the sorted file once it grows, and when closed.
+
+Usage
+-----
+    with Checkpoint(Path("logs/ingestion/processed.ids")) as processed:
+        if "0000000000000001" not in processed:
+            ...
+            processed.add(["0000000000000001"])
+
+"""
+
+from __future__ import annotations
+
+from array import array
+import bisect
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import mmap
+import os
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+    from types import TracebackType
+
+__all__ = ["Checkpoint"]
+
+TYPECODE = "Q"
+COMPACT_AFTER = 100_000
+WRITE_EVERY = 65_536
+
+
+@dataclass
+class Checkpoint:
+    """Lattes IDs of the Curricula already stored.
+
+    Notes
+    -----
+    - ``path`` holds the sorted IDs, as native unsigned 64-bit integers.
+    - ``<path>.journal`` holds the IDs added since the last compaction.
+    - IDs that are not integers are never contained.
+
+    """
+
+    path: Path
+    compact_after: int = COMPACT_AFTER
+
+    _recent: set[int] = field(init=False, repr=False)
+    _map: mmap.mmap | None = field(default=None, init=False, repr=False)
+    _ids: memoryview = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch()
+        self.journal.touch()
+
+        recent = array(TYPECODE)
+        recent.frombytes(self.journal.read_bytes())
+        self._recent = set(recent)
+
+        self._open()
+
+    @classmethod
+    def from_log(cls, log: Path, path: Path) -> Self:
+        """Convert a log of processed Lattes IDs, one per line.
+
+        Returns
+        -------
+        The Checkpoint, with every ID of the log.
+
+        """
+        with log.open("r") as file:
+            ids = sorted({int(line) for line in file if line.strip()})
+
+        _write(path, ids)
+        return cls(path)
+
+    @property
+    def journal(self) -> Path:
+        """IDs added since the last compaction, unsorted."""
+        return self.path.with_name(self.path.name + ".journal")
+
+    def __contains__(self, lattes_id: object) -> bool:
+        try:
+            key = int(lattes_id)  # type: ignore[call-overload]
+        except (TypeError, ValueError):
+            return False
+
+        return key in self._recent or self._is_sorted(key)
+
+    def __len__(self) -> int:
+        journaled = sum(not self._is_sorted(key) for key in self._recent)
+        return len(self._ids) + journaled
+
+    def __iter__(self) -> Iterator[int]:
+        return _unique(heapq.merge(self._ids, sorted(self._recent)))
+
+    def add(self, lattes_ids: Iterable[str]) -> None:
+        """Append processed Lattes IDs, durable once this returns."""
+        new = array(TYPECODE, (int(lattes_id) for lattes_id in lattes_ids))
+        if not new:
+            return
+
+        with self.journal.open("ab") as file:
+            new.tofile(file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        self._recent.update(new)
+        if len(self._recent) >= self.compact_after:
+            self.compact()
+
+    def compact(self) -> None:
+        """Merge the journal into the sorted IDs."""
+        if not self._recent:
+            return
+
+        merged = iter(self)
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        _write(temporary, merged)
+
+        self._close()
+        temporary.replace(self.path)
+        self.journal.write_bytes(b"")
+        self._recent = set()
+        self._open()
+
+    def close(self) -> None:
+        """Compact and release the memory-mapped file."""
+        self.compact()
+        self._close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _is_sorted(self, key: int) -> bool:
+        index = bisect.bisect_left(self._ids, key)
+        return index < len(self._ids) and self._ids[index] == key
+
+    def _open(self) -> None:
+        if self.path.stat().st_size == 0:
+            self._map = None
+            self._ids = memoryview(b"").cast(TYPECODE)
+            return
+
+        with self.path.open("rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._ids = memoryview(self._map).cast(TYPECODE)
+
+    def _close(self) -> None:
+        self._ids.release()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+def _unique(ids: Iterable[int]) -> Iterator[int]:
+    return (key for key, _ in itertools.groupby(ids))
+
+
+def _write(path: Path, sorted_ids: Iterable[int]) -> None:
+    """Write sorted IDs, in chunks, so they are never all in memory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as file:
+        ids = iter(sorted_ids)
+        while chunk := array(TYPECODE, itertools.islice(ids, WRITE_EVERY)):
+            chunk.tofile(file)
+        file.flush()
+        os.fsync(file.fileno())
@@ -1,3 +1,5 @@
+from contextlib import nullcontext
+import csv
 from pathlib import Path
 from typing import Annotated
 
@@ -5,15 +7,27 @@ import cyclopts
 from cyclopts import Parameter
 
 from vitae.infra.database import Database
+from vitae.infra.database.backfilling import BATCH, backfill_search_names
+from vitae.infra.database.staging import load_staging, loaded_files
+from vitae.infra.database.tables import Researcher
 from vitae.settings.logging import logging_into
 from vitae.settings.vitae import Vitae
 
+from .checkpoint import Checkpoint
+from .curricula_cache import CurriculaCache
+from .manifest import Manifest
+from .metrics import Metrics
+from .profiling import ProfileKind, profiler_from
 from .repository import Researchers
+from .sinks import SinkName, sink_from
+from .sources import SOURCES, SourceName
 from .usecase import Ingestion
 
-__all__ = ["app", "ingest"]
+__all__ = ["app", "backfill", "backfill_app", "ingest", "load", "load_app"]
 
 app = cyclopts.App(name="ingest")
+load_app = cyclopts.App(name="load")
+backfill_app = cyclopts.App(name="backfill")
 
 type Indexes = frozenset[int]
 type SelectedIndexes = list[int] | None
@@ -29,6 +43,22 @@ def ingest(
     ] = None,
     _range: Annotated[IndexRange, Parameter(name=["--range", "-r"])] = None,
     buffer: Annotated[int, Parameter(name=["--buffer", "-b"])] = 50,
+    streaming: Annotated[bool, Parameter(name=["--streaming"])] = True,
+    source: Annotated[SourceName, Parameter(name=["--source", "-s"])] = "xml",
+    workers: Annotated[int, Parameter(name=["--workers", "-w"])] = 1,
+    upsert: Annotated[bool, Parameter(name=["--upsert"])] = False,
+    incremental: Annotated[bool, Parameter(name=["--incremental"])] = False,
+    profile: Annotated[
+        ProfileKind | None,  # noqa: FA102
+        Parameter(name=["--profile"]),
+    ] = None,
+    dry_run: Annotated[bool, Parameter(name=["--dry-run"])] = False,
+    sink: Annotated[
+        SinkName | None,  # noqa: FA102
+        Parameter(name=["--sink"]),
+    ] = None,
+    cache: Annotated[bool, Parameter(name=["--cache"])] = True,
+    cache_size: Annotated[float, Parameter(name=["--cache-size"])] = 10.0,
 ) -> None:
     """Ingest XML documents into the database.
 
@@ -46,31 +76,193 @@ def ingest(
         Number of researchers to buffer before committing to the database.
         Use higher numbers on production.
 
+    streaming : bool, default=True
+        Parse each XML incrementally, discarding the sections
+        that are not ingested instead of loading the whole tree.
+        Use `--no-streaming` to parse the whole document at once.
+
+    source : "xml" | "zip", default="xml"
+        Which files of each sub-directory are ingested.
+        `xml` reads pre-processed XML files, while `zip` reads them
+        straight from the original `<id>.zip` archives, in memory.
+
+    workers : int, default=1
+        Number of processes parsing curricula, while this one writes
+        them into the database. Use up to the number of available cores.
+
+    upsert : bool, default=False
+        Replace curricula already stored, instead of failing on them.
+        Use it when runs overlap, e.g. on the same `--range`,
+        so batches with stored curricula are not rolled back.
+
+    incremental : bool, default=False
+        Refresh the database from a newer dump, instead of resuming.
+        Curricula already stored are upserted, with all of their data,
+        only if updated since, according to their `DATA-ATUALIZACAO`.
+
+    profile : "cpu" | "memory" | None = None
+        Profile each group with cProfile or tracemalloc, writing reports
+        under `logs/profiles/`. Combine with `--indexes` or `--range`
+        to profile a single group, and with `--workers 1` to also
+        profile the parsing, which is done by the workers otherwise.
+
+    dry_run : bool, default=False
+        Read, parse and convert every curriculum, without storing them,
+        to measure throughput or validate a dump with no database.
+        Same as `--sink null`.
+
+    sink : "database" | "null" | "jsonl" | "staging" | None = None
+        Where curricula are written, the database by default.
+        `null` discards them, while `jsonl` writes each row into
+        `logs/dry-run/curricula.jsonl`, and `staging` into a CSV file
+        per table and group, under `paths.staging`, to be loaded later
+        by `vitae load`. Except for the database, this is a dry run:
+        nothing is skipped nor checkpointed,
+        and logs are written under `logs/dry-run/`.
+
+    cache : bool, default=True
+        Keep parsed curricula under `paths.cache`, by their content,
+        so unchanged files are not parsed again on later runs,
+        e.g. after `vitae bootstrap`. Use `--no-cache` to always parse.
+
+    cache_size : float, default=10.0
+        Size limit of the cache, in GiB. Once over it, the least
+        recently used curricula are evicted every 10 groups, and when
+        the run ends, even if it fails.
+
     """
     logging_into(Path("logs/vitae.log"))
 
     vitae = Vitae.from_toml(Path("vitae.toml"))
-    database = Database(vitae.postgres.engine)
+    database = Database(vitae.postgres.engine, vitae.postgres.db.loader)
+
+    sink = sink or ("null" if dry_run else "database")
+    dry = sink != "database"
+    logs = vitae.paths.logs / "dry-run" if dry else vitae.paths.logs
 
     root_directory = vitae.paths.curricula
     scan_only = merge_indexes(root_directory, indexes, _range)
-    repository = Researchers(
-        log_directory=vitae.paths.logs,
-        db=database,
-        every=buffer,
-    )
-    processed_curricula = curricula_xml_from(
-        Path("logs/ingestion/processed.log"),
+    metrics = Metrics(directory=logs / "ingestion")
+    checkpoint = nullcontext() if dry else checkpoint_from(logs / "ingestion")
+    curricula_cache = (
+        CurriculaCache(
+            vitae.paths.cache / "curricula",
+            max_bytes=int(cache_size * 2**30),
+        )
+        if cache
+        else None
     )
 
-    ingestion = Ingestion(
-        researchers=repository,
-        files=root_directory,
-        to_skip=processed_curricula,
-        scan_only=scan_only,
-    )
+    with (
+        checkpoint as processed,
+        profiler_from(profile, logs / "profiles") as profiler,
+        sink_from(
+            sink,
+            vitae.paths.staging if sink == "staging" else logs,
+        ) as writer,
+    ):
+        repository = Researchers(
+            log_directory=logs,
+            db=database,
+            every=buffer,
+            checkpoint=processed,
+            upsert=upsert or incremental,
+            metrics=metrics,
+            sink=writer,
+        )
 
-    ingestion.ingest()
+        ingestion = Ingestion(
+            researchers=repository,
+            files=root_directory,
+            to_skip=(
+                frozenset() if incremental or processed is None else processed
+            ),
+            scan_only=scan_only,
+            streaming=streaming,
+            source=SOURCES[source],
+            manifest=Manifest(root_directory, vitae.paths.cache / "manifest"),
+            workers=workers,
+            incremental=incremental,
+            metrics=metrics,
+            profiler=profiler,
+            cache=curricula_cache,
+        )
+
+        ingestion.ingest()
+
+
+@load_app.default
+def load(
+    workers: Annotated[int, Parameter(name=["--workers", "-w"])] = 4,
+) -> None:
+    """Load curricula staged by `vitae ingest --sink staging`.
+
+    Files already loaded are skipped, so a failed load is resumed by
+    running it again. Researchers are added to the checkpoint only once
+    every table is loaded, so `vitae ingest` never skips researchers
+    with rows still to be loaded.
+
+    Parameters
+    ----------
+    workers : int, default=4
+        Number of staging files loaded at once, each one on its own
+        connection. Tables are loaded following their foreign keys.
+
+    """
+    logging_into(Path("logs/vitae.log"))
+
+    vitae = Vitae.from_toml(Path("vitae.toml"))
+    staging = vitae.paths.staging
+    loaded = load_staging(vitae.postgres.engine, staging, workers)
+
+    for outcome in loaded:
+        print(
+            f"{outcome.table}/{outcome.path.name}:"
+            f" {outcome.error or f'{outcome.rows:,} rows'}"
+            f" in {outcome.seconds:.2f}s",
+        )
+
+    failed = [outcome for outcome in loaded if outcome.error is not None]
+    rows = sum(outcome.rows for outcome in loaded)
+    print(f"Loaded {rows:,} rows from {len(loaded) - len(failed)} files")
+    for outcome in failed:
+        print(f"Failed {outcome.table}/{outcome.path.name}: {outcome.error}")
+    if failed:
+        print("Researchers are checkpointed once every file is loaded,")
+        print("run `vitae load` again to resume.")
+        return
+
+    researcher = Researcher.__table__  # type: ignore[attr-defined]
+    with checkpoint_from(vitae.paths.logs / "ingestion") as processed:
+        for path in loaded_files(staging, researcher):
+            processed.add(
+                lattes_id
+                for lattes_id in staged_ids(path)
+                if lattes_id not in processed
+            )
+
+
+@backfill_app.default
+def backfill(
+    batch: Annotated[int, Parameter(name=["--batch", "-b"])] = BATCH,
+) -> None:
+    """Store the folded name of every researcher, as searched by name.
+
+    Adds the ``search_name`` column, and its index, to databases
+    bootstrapped before it, and stores the folded name of each
+    researcher, so they're found by name without a new ingestion.
+
+    Parameters
+    ----------
+    batch : int, default=10_000
+        Number of researchers folded on each transaction.
+
+    """
+    logging_into(Path("logs/vitae.log"))
+
+    vitae = Vitae.from_toml(Path("vitae.toml"))
+    updated = backfill_search_names(vitae.postgres.engine, batch)
+    print(f"Folded the names of {updated:,} researchers")
 
 
 # =~=~=~=~=~=~ Helper Functions ~=~=~=~=~=~=
@@ -103,18 +295,35 @@ def merge_indexes(
     return as_directories(root_path, indices)
 
 
-def curricula_xml_from(log: Path) -> set[str]:
-    """Load curricula from log file.
+def checkpoint_from(directory: Path) -> Checkpoint:
+    """Open the checkpoint of processed curricula.
 
     Note:
     ----
-    Its expected that each line contains only one Researcher's ID.
+    Logs from previous versions have no checkpoint,
+    so it is converted from `processed.log`, where each line contains
+    only one Researcher's ID.
 
     Returns:
     -------
-    All processed Curricula's ID into a set as `<id>.xml` strings.
+    The checkpoint at `<directory>/processed.ids`.
+
+    """
+    path = directory / "processed.ids"
+    log = directory / "processed.log"
+
+    if not path.exists() and log.exists():
+        return Checkpoint.from_log(log, path)
+    return Checkpoint(path)
+
+
+def staged_ids(path: Path) -> list[str]:
+    """Lattes IDs of a researcher's staging file.
+
+    Returns
+    -------
+    Every ID on its `lattes_id` column.
 
     """
-    with log.open("r") as file:
-        result: set[str] = {line.strip("\n") + ".xml" for line in file}
-    return result
+    with path.open(encoding="utf-8", newline="") as file:
+        return [row["lattes_id"] for row in csv.DictReader(file)]
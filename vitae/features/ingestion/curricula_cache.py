@@ -0,0 +1,146 @@
+"""Content-addressed cache of parsed Curricula.
+
+Bootstrapping drops every table, so a rebuild used to parse again
+millions of curricula that did not change. Instead, each parsed
+`Curriculum` is kept on disk, pickled and compressed, keyed by a hash of
+its file's name and content, so only new or changed files are parsed:
+
+    <directory>/
+        <2 first hex digits>/
+            <hash>.pickle.z
+
+Entries are written atomically, by a rename, so the cache can be shared
+by every parsing process, and a hit refreshes the entry's modification
+time. Once the cache is larger than ``max_bytes``, the least recently
+used entries are evicted, until it fits on ``LOW_WATERMARK`` of it.
+Entries are written by every parsing process, so there's no running
+total of their size: evicting scans the whole cache, so the ingestion
+does it every few groups, not after each one.
+
+Notes
+-----
+Bump ``VERSION`` whenever the adapters or the parsing change,
+so entries of previous versions are never hit, and get evicted.
+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import os
+from pathlib import Path
+import pickle
+from typing import TYPE_CHECKING
+import zlib
+
+if TYPE_CHECKING:
+    from vitae.features.ingestion.adapters import Curriculum
+
+__all__ = ["CurriculaCache"]
+
+VERSION = 2
+LOW_WATERMARK = 0.9
+SUFFIX = ".pickle.z"
+
+
+@dataclass(frozen=True)
+class CurriculaCache:
+    """Parsed Curricula on disk, by their content.
+
+    Only its settings are kept, so it's cheap to send to other processes.
+    """
+
+    directory: Path
+    max_bytes: int = 10 * 2**30
+
+    @staticmethod
+    def key(name: str, content: bytes) -> str:
+        """Address of a curriculum file.
+
+        Returns
+        -------
+        Hash of the cache's version, and the file's name and content.
+
+        """
+        digest = hashlib.blake2b(f"{VERSION}:{name}:".encode(), digest_size=16)
+        digest.update(content)
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{SUFFIX}"
+
+    def get(self, key: str) -> Curriculum | None:
+        """Load a cached curriculum, marking it as recently used.
+
+        Returns
+        -------
+        The cached curriculum, or nothing if not cached or unreadable.
+
+        """
+        path = self.path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            return pickle.loads(zlib.decompress(data))  # noqa: S301
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError):
+            return None
+
+    def put(self, key: str, curriculum: Curriculum) -> None:
+        """Store a curriculum, replacing it atomically if cached."""
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temporary.write_bytes(
+            zlib.compress(
+                pickle.dumps(curriculum, protocol=pickle.HIGHEST_PROTOCOL),
+                level=1,
+            ),
+        )
+        temporary.replace(path)
+
+    def evict(self) -> int:
+        """Remove the least recently used entries, if over ``max_bytes``.
+
+        Returns
+        -------
+        How many bytes were freed.
+
+        """
+        entries = list(self._entries())
+        size = sum(size for _, size, _ in entries)
+        if size <= self.max_bytes:
+            return 0
+
+        freed = 0
+        target = size - int(self.max_bytes * LOW_WATERMARK)
+        for _, entry_size, path in sorted(entries):
+            if freed >= target:
+                break
+            Path(path).unlink(missing_ok=True)
+            freed += entry_size
+        return freed
+
+    def _entries(self) -> list[tuple[int, int, str]]:
+        """Every entry, as its modification time, size and path."""
+        if not self.directory.exists():
+            return []
+
+        entries = []
+        with os.scandir(self.directory) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as files:
+                    for file in files:
+                        if not file.name.endswith(SUFFIX):
+                            continue
+                        try:
+                            stat = file.stat()
+                        except FileNotFoundError:
+                            continue
+                        entries.append(
+                            (stat.st_mtime_ns, stat.st_size, file.path),
+                        )
+        return entries
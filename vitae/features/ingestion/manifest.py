@@ -0,0 +1,217 @@
+"""Cached listing of the Curricula repository.
+
+Listing millions of curricula takes minutes on network volumes,
+before any work starts. The manifest lists each group's directory once,
+using ``os.scandir``, and persists it under a cache directory.
+
+On the next runs, only the groups whose directory's modification time
+changed are listed again, since adding, removing or renaming a file
+changes it, while the others are read from the cache.
+
+Notes
+-----
+Files rewritten in-place do not change their directory's modification
+time, so their cached size and modification time may be outdated.
+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import os
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = ["File", "Manifest"]
+
+
+@dataclass(frozen=True, slots=True)
+class File:
+    """A file of a group, as listed on the manifest."""
+
+    name: str
+    size: int
+    mtime_ns: int
+
+    @property
+    def lattes_id(self) -> str:
+        """Lattes ID, derived from names such as ``<id>.xml``."""
+        return self.name.partition(".")[0]
+
+
+@dataclass
+class Manifest:
+    """Groups of the Curricula repository and their files.
+
+    Notes
+    -----
+    Without a ``cache`` directory, nothing is persisted,
+    but each group is still listed only once. Otherwise, it looks like:
+
+        <cache>/
+            index.json      # modification time of each group
+            <group>.tsv     # name, size and modification time of each file
+
+    """
+
+    root: Path
+    cache: Path | None = None
+
+    _index: dict[str, Any] = field(init=False, repr=False)
+    _files: dict[str, list[File]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    _refreshed: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._index = self._cached_index()
+
+    def groups(self) -> list[Path]:
+        """Refresh and list the group's directories, sorted by name.
+
+        Groups whose directory changed are listed again once their files
+        are requested, so the ones not requested are never scanned.
+
+        Returns
+        -------
+        The directories under ``root``.
+
+        """
+        with os.scandir(self.root) as entries:
+            current = {
+                entry.name: entry.stat().st_mtime_ns
+                for entry in entries
+                if entry.is_dir() and not entry.name.startswith(".")
+            }
+
+        cached: dict[str, int] = self._index["groups"]
+        for name in list(cached):
+            if cached[name] != current.get(name):
+                del cached[name]
+                self._files.pop(name, None)
+
+        self._save_index()
+        self._refreshed = True
+        return [self.root / name for name in sorted(current)]
+
+    def files(self, group: Path, suffix: str | None = None) -> list[Path]:
+        """Paths of a group's files, without touching the filesystem.
+
+        Unless the group changed since it was cached.
+
+        Returns
+        -------
+        Paths of the listed files, ending with ``suffix`` if given.
+
+        """
+        return [
+            group / file.name
+            for file in self.records(group)
+            if suffix is None or file.name.endswith(suffix)
+        ]
+
+    def records(self, group: Path) -> list[File]:
+        """Listed files of a group, scanning it only if it changed.
+
+        Returns
+        -------
+        Every file of ``group``.
+
+        """
+        if not self._refreshed:
+            self.groups()
+
+        name = group.name
+        if name in self._files:
+            return self._files[name]
+
+        if name in self._index["groups"]:
+            cached = self._cached_files(name)
+            if cached is not None:
+                self._files[name] = cached
+                return cached
+
+        self._scan(name)
+        return self._files[name]
+
+    def _scan(self, name: str) -> None:
+        """List a group from the filesystem, caching it.
+
+        The directory's modification time is taken before listing it,
+        so changes made while listing are caught on the next refresh.
+        """
+        directory = self.root / name
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._files[name] = []
+            return
+
+        with os.scandir(directory) as entries:
+            files = [
+                File(entry.name, stat.st_size, stat.st_mtime_ns)
+                for entry in entries
+                if entry.is_file() and (stat := entry.stat())
+            ]
+        files.sort(key=lambda file: file.name)
+        self._files[name] = files
+
+        if self.cache is not None:
+            _write_atomically(
+                self.cache / f"{name}.tsv",
+                "".join(
+                    f"{file.name}\t{file.size}\t{file.mtime_ns}\n"
+                    for file in files
+                ),
+            )
+            self._index["groups"][name] = mtime_ns
+            self._save_index()
+
+    def _cached_files(self, name: str) -> list[File] | None:
+        if self.cache is None:
+            return None
+
+        try:
+            with (self.cache / f"{name}.tsv").open("r") as tsv:
+                return [_file_from(line) for line in tsv]
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _cached_index(self) -> dict[str, Any]:
+        root = str(self.root.absolute())
+        empty = {"root": root, "groups": {}}
+        if self.cache is None:
+            return empty
+
+        try:
+            index = json.loads((self.cache / "index.json").read_text())
+        except (FileNotFoundError, ValueError):
+            return empty
+
+        if index.get("root") != root:
+            return empty
+        return index
+
+    def _save_index(self) -> None:
+        if self.cache is not None:
+            _write_atomically(
+                self.cache / "index.json",
+                json.dumps(self._index),
+            )
+
+
+def _file_from(line: str) -> File:
+    name, size, mtime_ns = line.rstrip("\n").split("\t")
+    return File(name, int(size), int(mtime_ns))
+
+
+def _write_atomically(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(content)
+    temporary.replace(path)
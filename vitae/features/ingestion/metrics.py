@@ -0,0 +1,259 @@
+"""Throughput metrics of an ingestion run.
+
+Each curriculum goes through four stages, timed separately, so a slow
+run can be told apart as I/O, XML parsing, conversion or database bound:
+
+- ``read``: reading the file, including decompressing ``.zip`` members.
+- ``parse``: parsing the XML into adapters, without reading it.
+- ``convert``: converting adapters into database tables.
+- ``commit``: writing batches into the database, until committed.
+
+Reading and parsing happen where curricula are parsed, even on worker
+processes, so their ``Sample`` is sent back with each curriculum.
+Curricula loaded from the cache are counted as ``cached``,
+and loading them is timed as parsing.
+Their seconds are summed over all workers, so they may exceed
+the run's elapsed time.
+
+At the end of each group, a JSON report and a Prometheus textfile,
+for node exporter's textfile collector, are written:
+
+    <directory>/
+        report.json
+        ingestion.prom
+
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+import json
+import time
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+__all__ = ["STAGES", "Metered", "Metrics", "Sample"]
+
+STAGES = ("read", "parse", "convert", "commit")
+PREFIX = "vitae_ingestion"
+
+
+@dataclass(slots=True)
+class Sample:
+    """Measures of a single curriculum, taken where it is parsed."""
+
+    bytes: int = 0
+    read: float = 0.0
+    parse: float = 0.0
+    parsed: bool = True
+    cached: bool = False
+
+    @contextmanager
+    def timing(self) -> Iterator[None]:
+        """Time reading and parsing, telling one from the other."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.parse += time.perf_counter() - start - self.read
+
+
+class Metered:
+    """Binary stream that times and counts what is read from it."""
+
+    def __init__(self, stream: IO[bytes], sample: Sample) -> None:
+        self.stream = stream
+        self.sample = sample
+        self.name = getattr(stream, "name", "")
+
+    def read(self, size: int = -1) -> bytes:
+        start = time.perf_counter()
+        data = self.stream.read(size)
+        self.sample.read += time.perf_counter() - start
+        self.sample.bytes += len(data)
+        return data
+
+
+@dataclass
+class Metrics:
+    """Counters and stage timers of an ingestion run.
+
+    Notes
+    -----
+    ``expected`` is the number of curricula to go through,
+    used to estimate when the run ends.
+    Without a ``directory``, reports are not written.
+
+    """
+
+    directory: Path | None = None
+    expected: int | None = None
+
+    seconds: Counter[str] = field(default_factory=Counter)
+    counts: Counter[str] = field(default_factory=Counter)
+    rows: Counter[str] = field(default_factory=Counter)
+    slowest_commit: float = 0.0
+    groups: list[str] = field(default_factory=list)
+
+    started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def add(self, sample: Sample) -> None:
+        """Account for a curriculum read on its own, parsed or not."""
+        self.counts["files"] += 1
+        self.counts["bytes"] += sample.bytes
+        self.counts["documents" if sample.parsed else "unchanged"] += 1
+        self.counts["cached"] += sample.cached
+        self.seconds["read"] += sample.read
+        self.seconds["parse"] += sample.parse
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counts[name] += amount
+
+    @contextmanager
+    def timing(self, stage: str) -> Iterator[None]:
+        """Time a stage of the writer process."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.seconds[stage] += elapsed
+            if stage == "commit":
+                self.counts["transactions"] += 1
+                self.slowest_commit = max(self.slowest_commit, elapsed)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def handled(self) -> int:
+        """Curricula gone through, whether stored, skipped or not."""
+        return sum(
+            self.counts[name] for name in ("documents", "unchanged", "skipped")
+        )
+
+    @property
+    def eta(self) -> timedelta | None:
+        """Estimated time left, from the rate of handled curricula."""
+        handled = self.handled
+        if not self.expected or not handled:
+            return None
+
+        remaining = max(self.expected - handled, 0)
+        return timedelta(seconds=round(remaining * self.elapsed / handled))
+
+    def progress(self) -> str:
+        """Single line summary of the run so far.
+
+        Returns
+        -------
+        Handled curricula, throughput and estimated time left.
+
+        """
+        expected = f"/{self.expected:,}" if self.expected else ""
+        rate = self.counts["documents"] / max(self.elapsed, 1e-9)
+        eta = self.eta
+
+        return (
+            f"{self.handled:,}{expected} curricula"
+            f" ({self.counts['documents']:,} parsed, {rate:,.1f}/s)"
+            f" | ETA {eta if eta is not None else '?'}"
+        )
+
+    def report(self) -> dict[str, Any]:
+        """Everything measured so far.
+
+        Returns
+        -------
+        JSON serializable report.
+
+        """
+        elapsed = self.elapsed
+        transactions = self.counts["transactions"]
+
+        return {
+            "elapsed": elapsed,
+            "expected": self.expected,
+            "groups": self.groups,
+            "counts": dict(self.counts),
+            "rows": dict(self.rows),
+            "seconds": {stage: self.seconds[stage] for stage in STAGES},
+            "documents_per_second": self.counts["documents"] / elapsed,
+            "bytes_per_second": self.counts["bytes"] / elapsed,
+            "commit_latency": {
+                "mean": self.seconds["commit"] / transactions
+                if transactions
+                else 0.0,
+                "max": self.slowest_commit,
+            },
+        }
+
+    def prometheus(self) -> str:
+        """Metrics on Prometheus' text exposition format.
+
+        Returns
+        -------
+        Every counter and timer as a Prometheus metric.
+
+        """
+        lines = [
+            *_metric("elapsed_seconds", "gauge", self.elapsed),
+            *_metric("expected_curricula", "gauge", self.expected or 0),
+            *_metric("groups_total", "counter", len(self.groups)),
+            *_metric(
+                "commit_latency_max_seconds",
+                "gauge",
+                self.slowest_commit,
+            ),
+        ]
+        for name in sorted(self.counts):
+            lines += _metric(f"{name}_total", "counter", self.counts[name])
+        lines += _labeled(
+            "stage_seconds_total",
+            "stage",
+            {stage: self.seconds[stage] for stage in STAGES},
+        )
+        lines += _labeled("rows_total", "table", self.rows)
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, group: Path) -> None:
+        """Record a finished group, writing the reports if configured."""
+        self.groups.append(f"{group.parent.name}/{group.name}")
+        if self.directory is None:
+            return
+
+        _write_atomically(
+            self.directory / "report.json",
+            json.dumps(self.report(), indent=2),
+        )
+        _write_atomically(self.directory / "ingestion.prom", self.prometheus())
+
+
+def _metric(name: str, kind: str, value: float) -> list[str]:
+    return [f"# TYPE {PREFIX}_{name} {kind}", f"{PREFIX}_{name} {value}"]
+
+
+def _labeled(name: str, label: str, values: dict[str, float]) -> list[str]:
+    return [
+        f"# TYPE {PREFIX}_{name} counter",
+        *(
+            f'{PREFIX}_{name}{{{label}="{key}"}} {value}'
+            for key, value in sorted(values.items())
+        ),
+    ]
+
+
+def _write_atomically(path: Path, content: str) -> None:
+    """Write into a temporary file first, so readers never see it partial."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(content)
+    temporary.replace(path)
@@ -1,22 +1,39 @@
 from __future__ import annotations
 
-from pathlib import Path
-from typing import TYPE_CHECKING
+from functools import cached_property
+from pathlib import Path, PurePath
+from typing import IO, TYPE_CHECKING
 
 from vitae.features.ingestion import adapters
 
 from . import _xml as xml
-from .academic import education_from_xml
-from .professional import address_from_xml, experience_from_xml
-from .researcher import researcher_from_xml
+from . import academic, professional, researcher
+from ._extraction import Record, rule, visit
+from .academic import education_from
+from .index import DocumentIndex
+from .professional import address_from, experience_from
+from .researcher import researcher_from, updated_at_from
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from datetime import datetime
 
 __all__ = [
     "CurriculumDocument",
+    "last_update",
 ]
 
+SECTIONS = ("dados gerais", "dados complementares")
+
+GENERAL = rule(
+    "general",
+    "dados gerais",
+    *researcher.RULES,
+    *academic.RULES,
+    *professional.RULES,
+    **researcher.ATTRIBUTES,
+)
+
 
 class CurriculumDocument:
     """Parser for XML Curriculum files.
@@ -24,14 +41,31 @@ class CurriculumDocument:
     Notes
     -----
     - The filename is the ID of the researcher.
+      Binary streams, such as members of a `.zip` archive, are named too.
+    - Files are parsed as raw bytes, honouring the encoding declared
+      by the XML itself, so curricula can be ingested as delivered by CNPq.
+    - On streaming mode, only the ``SECTIONS`` used by the extractors are
+      kept in memory, everything else (e.g. ``PRODUCAO-BIBLIOGRAFICA``)
+      is discarded while the file is read.
+    - `DADOS-GERAIS` is walked only once, following the ``GENERAL`` rules
+      composed from each extractor, and all adapters are built from it.
 
     """
 
-    def __init__(self, file: Path) -> None:
-        content = file.read_text(encoding="utf-8")
-
-        self.id = file.name.removesuffix(".xml")
-        self.document = xml.parse(content)
+    def __init__(
+        self,
+        file: Path | IO[bytes],
+        *,
+        streaming: bool = False,
+    ) -> None:
+        self.id = PurePath(file.name).name.removesuffix(".xml")
+
+        if streaming:
+            self.document = xml.stream(file, keep=SECTIONS)
+        elif isinstance(file, Path):
+            self.document = xml.parse(file.read_bytes())
+        else:
+            self.document = xml.parse(file.read())
 
     @property
     def as_schema(self) -> adapters.Curriculum:
@@ -42,18 +76,46 @@ class CurriculumDocument:
             experience=list(self.experience),
         )
 
+    @cached_property
+    def index(self) -> DocumentIndex:
+        """Complementary data index, shared by all extractors."""
+        return DocumentIndex.of(self.document)
+
+    @cached_property
+    def general(self) -> Record:
+        """`DADOS-GERAIS` extracted at once, shared by all extractors."""
+        return visit(self.document.first("dados gerais").element, GENERAL)
+
+    @property
+    def updated_at(self) -> datetime | None:
+        return updated_at_from(self.document)
+
     @property
     def researcher(self) -> adapters.Researcher:
-        return researcher_from_xml(self.id, self.document)
+        return researcher_from(self.id, self.general, self.updated_at)
 
     @property
     def address(self) -> adapters.Address | None:
-        return address_from_xml(self.id, self.document)
+        return address_from(self.id, self.general, self.index)
 
     @property
     def academic(self) -> Iterator[adapters.Education]:
-        return education_from_xml(self.id, self.document)
+        return education_from(self.id, self.general, self.index)
 
     @property
     def experience(self) -> Iterator[adapters.Experience]:
-        return experience_from_xml(self.id, self.document)
+        return experience_from(self.id, self.general, self.index)
+
+
+def last_update(file: Path | IO[bytes]) -> datetime | None:
+    """Read when a curriculum was last updated, without parsing it.
+
+    Only the root's start tag is read, so this is much cheaper than
+    parsing the whole document to compare it with a stored one.
+
+    Returns
+    -------
+    When the curriculum was last updated, if declared.
+
+    """
+    return updated_at_from(xml.root(file))
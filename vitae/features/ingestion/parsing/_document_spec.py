@@ -0,0 +1,112 @@
+from pathlib import Path
+
+import pytest
+
+from vitae.features.ingestion.parsing import CurriculumDocument
+
+from ._test_utils import Document
+
+
+@pytest.fixture
+def file(tmp_path: Path) -> Path:
+    path = tmp_path / "123456789.xml"
+    path.write_text(
+        str(
+            Document.of("""
+            <DADOS-GERAIS NOME-COMPLETO="Alan Mathison Turing">
+                <ENDERECO>
+                    <ENDERECO-PROFISSIONAL
+                        CODIGO-INSTITUICAO-EMPRESA="UNI001"
+                        NOME-INSTITUICAO-EMPRESA="Tech University"
+                        CEP="123"
+                    />
+                </ENDERECO>
+                <FORMACAO-ACADEMICA-TITULACAO>
+                    <GRADUACAO CODIGO-CURSO="101" NOME-CURSO="Computer Science"
+                        CODIGO-INSTITUICAO="UNI001" NOME-INSTITUICAO="Tech University"
+                    />
+                </FORMACAO-ACADEMICA-TITULACAO>
+                <ATUACOES-PROFISSIONAIS>
+                    <ATUACAO-PROFISSIONAL CODIGO-INSTITUICAO="UNI001" NOME-INSTITUICAO="Tech University">
+                        <VINCULOS TIPO-DE-VINCULO="LIVRE" ANO-INICIO="2015" />
+                    </ATUACAO-PROFISSIONAL>
+                </ATUACOES-PROFISSIONAIS>
+            </DADOS-GERAIS>
+            <PRODUCAO-BIBLIOGRAFICA>
+                <ARTIGOS-PUBLICADOS>
+                    <ARTIGO-PUBLICADO SEQUENCIA-PRODUCAO="1">
+                        <DADOS-BASICOS-DO-ARTIGO TITULO-DO-ARTIGO="On Computable Numbers"/>
+                    </ARTIGO-PUBLICADO>
+                </ARTIGOS-PUBLICADOS>
+            </PRODUCAO-BIBLIOGRAFICA>
+            <DADOS-COMPLEMENTARES>
+                <INFORMACOES-ADICIONAIS-INSTITUICOES>
+                    <INFORMACAO-ADICIONAL-INSTITUICAO
+                        CODIGO-INSTITUICAO="UNI001"
+                        SIGLA-INSTITUICAO="TU"
+                        SIGLA-UF-INSTITUICAO="SP"
+                        NOME-PAIS-INSTITUICAO="Brasil"
+                    />
+                </INFORMACOES-ADICIONAIS-INSTITUICOES>
+                <INFORMACOES-ADICIONAIS-CURSOS>
+                    <INFORMACAO-ADICIONAL-CURSO CODIGO-CURSO="101"
+                        NOME-GRANDE-AREA-DO-CONHECIMENTO="Ciências Exatas"
+                        NOME-DA-AREA-DO-CONHECIMENTO="Ciência da Computação"
+                    />
+                </INFORMACOES-ADICIONAIS-CURSOS>
+            </DADOS-COMPLEMENTARES>
+            """),
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+class DescribeStreamedDocument:
+    def its_id_is_the_filename(self, file):
+        assert CurriculumDocument(file, streaming=True).id == "123456789"
+
+    def has_no_bibliographic_production(self, file):
+        document = CurriculumDocument(file, streaming=True).document
+        assert not document.first("producao bibliografica").exists
+
+    def has_general_and_complementary_data(self, file):
+        document = CurriculumDocument(file, streaming=True).document
+        assert document.first("dados gerais").exists
+        assert document.first("dados complementares").exists
+
+    def is_the_same_curriculum_as_the_whole_document(self, file):
+        streamed = CurriculumDocument(file, streaming=True).as_schema
+        whole = CurriculumDocument(file).as_schema
+
+        assert streamed.researcher == whole.researcher
+        assert streamed.address == whole.address
+        assert streamed.experience == whole.experience
+        assert [edu.institution for edu in streamed.education] == [
+            edu.institution for edu in whole.education
+        ]
+        assert [edu.fields for edu in streamed.education] == [
+            edu.fields for edu in whole.education
+        ]
+
+
+@pytest.fixture
+def latin(tmp_path: Path) -> Path:
+    path = tmp_path / "987654321.xml"
+    path.write_bytes(
+        b'<?xml version="1.0" encoding="ISO-8859-1"?>'
+        b"<CURRICULO-VITAE>"
+        b'<DADOS-GERAIS NOME-COMPLETO="Jo\xe3o Ant\xf4nio" PAIS-DE-NASCIMENTO="Brasil"/>'
+        b"</CURRICULO-VITAE>",
+    )
+    return path
+
+
+class DescribeIsoLatinDocument:
+    def is_parsed_from_its_declared_encoding(self, latin):
+        researcher = CurriculumDocument(latin).researcher
+        assert researcher.full_name == "João Antônio"
+
+    def is_streamed_from_its_declared_encoding(self, latin):
+        researcher = CurriculumDocument(latin, streaming=True).researcher
+        assert researcher.full_name == "João Antônio"
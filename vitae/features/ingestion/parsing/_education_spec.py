@@ -102,6 +102,17 @@ class DescribeEducationFromXml:
         )
         assert len(educations) == 4
 
+    def has_the_same_ids_when_parsed_again(self, researcher, document):
+        ids = [e.id for e in education_from_xml(researcher, document)]
+        again = [e.id for e in education_from_xml(researcher, document)]
+        assert ids == again
+        assert len(set(ids)) == 4
+
+    def has_other_ids_for_other_researchers(self, researcher, document):
+        ids = {e.id for e in education_from_xml(researcher, document)}
+        others = {e.id for e in education_from_xml("987654321", document)}
+        assert ids.isdisjoint(others)
+
 
 class DescribeGraduationOfEducation:
     def is_graduation(self, researcher, document):
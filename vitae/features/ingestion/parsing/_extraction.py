@@ -0,0 +1,139 @@
+"""Declarative extraction of XML elements.
+
+Each extractor declares which elements and attributes it needs as a tree of
+``Rule``s. Tags and attribute keys are normalized once, when the rule is
+created (at import), so the XML is walked a single time with plain
+dictionary lookups, producing ``Record``s that only hold the declared data.
+
+Examples
+--------
+    ADDRESSES = rule(
+        "addresses", "endereco",
+        rule("address", "endereco profissional", cep="cep", city="cidade"),
+    )
+    GENERAL = rule("general", "dados gerais", ADDRESSES, name="nome completo")
+
+    general = visit(element, GENERAL)
+    general["name"]
+    general.first("addresses").first("address")["cep"]
+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from . import _xml as xml
+
+if TYPE_CHECKING:
+    from xml.etree import ElementTree as ET
+
+__all__ = ["ANY", "Record", "Rule", "rule", "visit"]
+
+ANY = "*"
+
+
+class Rule:
+    """Compiled extraction rule of an element.
+
+    Parameters
+    ----------
+    name
+        Name under which its records are grouped in the parent's record.
+    tag
+        Element's tag, or ``ANY`` to match any tag not matched by a sibling.
+    children
+        Rules of the children elements to extract.
+    attributes
+        Map of record's fields to element's attributes.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tag: str,
+        children: tuple[Rule, ...],
+        attributes: dict[str, str],
+    ) -> None:
+        self.name = name
+        self.tag = tag if tag == ANY else xml.normalized(tag)
+        self.attributes = tuple(
+            (field, xml.normalized(key)) for field, key in attributes.items()
+        )
+        self.children = {child.tag: child for child in children}
+        self.fallback = self.children.pop(ANY, None)
+
+    def child(self, tag: str) -> Rule | None:
+        return self.children.get(tag, self.fallback)
+
+
+def rule(name: str, tag: str, *children: Rule, **attributes: str) -> Rule:
+    """Declare an extraction rule.
+
+    Returns
+    -------
+    Compiled rule.
+
+    """
+    return Rule(name, tag, children, attributes)
+
+
+@dataclass(slots=True)
+class Record:
+    """Data extracted from an element by a ``Rule``.
+
+    Note:
+    ----
+    Just like ``_xml.attribute``, empty attributes are stored as None.
+
+    """
+
+    tag: str
+    fields: dict[str, str | None]
+    children: dict[str, list[Record]] = field(default_factory=dict)
+
+    def __getitem__(self, field: str) -> str | None:
+        return self.fields[field]
+
+    def all(self, name: str) -> list[Record]:
+        return self.children.get(name, [])
+
+    def first(self, name: str) -> Record | None:
+        found = self.children.get(name)
+        return found[0] if found else None
+
+
+def visit(element: ET.Element | None, rule: Rule) -> Record:
+    """Extract a ``Record`` from ``element`` in a single pass.
+
+    If there is no element, an empty record is returned.
+
+    Returns
+    -------
+    Record of the element.
+
+    """
+    if element is None:
+        return Record(
+            tag=rule.tag,
+            fields=dict.fromkeys(field for field, _ in rule.attributes),
+        )
+
+    attrib = element.attrib
+    record = Record(
+        tag=element.tag,
+        fields={
+            field: value.strip() if (value := attrib.get(key)) else None
+            for field, key in rule.attributes
+        },
+    )
+
+    if rule.children or rule.fallback:
+        children = record.children
+        for child in element:
+            if (found := rule.child(child.tag)) is not None:
+                children.setdefault(found.name, []).append(visit(child, found))
+
+    return record
@@ -0,0 +1,58 @@
+import pytest
+
+from vitae.features.ingestion.parsing._extraction import (
+    ANY,
+    Record,
+    rule,
+    visit,
+)
+
+from ._test_utils import Document
+
+GENERAL = rule(
+    "general",
+    "dados gerais",
+    rule("resume", "resumo cv", abstract="texto resumo CV RH"),
+    rule("education", ANY, course="nome curso"),
+    full_name="nome completo",
+    orcid="ORCID ID",
+)
+
+
+@pytest.fixture
+def general() -> Record:
+    document = Document.of("""
+    <DADOS-GERAIS NOME-COMPLETO="  Alan Mathison Turing " ORCID-ID="">
+        <RESUMO-CV TEXTO-RESUMO-CV-RH="Pioneering computer scientist"/>
+        <GRADUACAO NOME-CURSO="Mathematics"/>
+        <DOUTORADO NOME-CURSO="Mathematics"/>
+    </DADOS-GERAIS>
+    """).as_node
+    return visit(document.first("dados gerais").element, GENERAL)
+
+
+class DescribeVisit:
+    def has_stripped_attributes(self, general):
+        assert general["full_name"] == "Alan Mathison Turing"
+
+    def has_empty_attributes_as_none(self, general):
+        assert general["orcid"] is None
+
+    def has_children_by_rule_name(self, general):
+        resume = general.first("resume")
+        assert resume is not None
+        assert resume["abstract"] == "Pioneering computer scientist"
+
+    def has_any_tag_when_not_matched_by_siblings(self, general):
+        educations = general.all("education")
+        assert [edu.tag for edu in educations] == ["GRADUACAO", "DOUTORADO"]
+
+    def when_element_is_missing_should_be_empty(self):
+        empty = visit(None, GENERAL)
+        assert empty["full_name"] is None
+        assert empty.first("resume") is None
+        assert empty.all("education") == []
+
+    def raises_key_error_for_undeclared_fields(self, general):
+        with pytest.raises(KeyError):
+            general["nome completo"]
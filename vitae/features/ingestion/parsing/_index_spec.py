@@ -0,0 +1,45 @@
+import pytest
+
+from vitae.features.ingestion.parsing._xml import Node
+from vitae.features.ingestion.parsing.index import DocumentIndex
+
+from ._test_utils import Document
+
+
+@pytest.fixture
+def document() -> Node:
+    return Document.of("""
+    <DADOS-COMPLEMENTARES>
+        <INFORMACOES-ADICIONAIS-INSTITUICOES>
+            <INFORMACAO-ADICIONAL-INSTITUICAO CODIGO-INSTITUICAO="UNI001" SIGLA-INSTITUICAO="TU"/>
+            <INFORMACAO-ADICIONAL-INSTITUICAO CODIGO-INSTITUICAO="UNI002" SIGLA-INSTITUICAO="IT"/>
+            <INFORMACAO-ADICIONAL-INSTITUICAO CODIGO-INSTITUICAO="UNI001" SIGLA-INSTITUICAO="DUP"/>
+        </INFORMACOES-ADICIONAIS-INSTITUICOES>
+        <INFORMACOES-ADICIONAIS-CURSOS>
+            <INFORMACAO-ADICIONAL-CURSO CODIGO-CURSO="101" NOME-DA-AREA-DO-CONHECIMENTO="Ciência da Computação"/>
+        </INFORMACOES-ADICIONAIS-CURSOS>
+    </DADOS-COMPLEMENTARES>
+    """).as_node
+
+
+class DescribeDocumentIndex:
+    def has_2_institutions(self, document):
+        assert len(DocumentIndex.of(document).institutions) == 2
+
+    def its_first_occurrence_wins(self, document):
+        index = DocumentIndex.of(document)
+        assert index.institution("UNI001")["abbr"] == "TU"
+
+    def has_course_by_code(self, document):
+        index = DocumentIndex.of(document)
+        assert index.course("101")["area"] == "Ciência da Computação"
+
+    def when_code_is_unknown_should_not_exist(self, document):
+        index = DocumentIndex.of(document)
+        assert index.institution("UNI999") is None
+        assert index.course("999") is None
+
+    def when_there_is_no_complementary_data_should_be_empty(self):
+        index = DocumentIndex.of(Document.of("<DADOS-GERAIS/>").as_node)
+        assert not index.institutions
+        assert not index.courses
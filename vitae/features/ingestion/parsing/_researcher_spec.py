@@ -1,8 +1,15 @@
+from datetime import datetime
+import io
+
 import pytest
 
 from vitae.features.ingestion.adapters import Researcher
-from vitae.features.ingestion.parsing._xml import Node
-from vitae.features.ingestion.parsing.researcher import researcher_from_xml
+from vitae.features.ingestion.parsing import last_update
+from vitae.features.ingestion.parsing._xml import Node, parse
+from vitae.features.ingestion.parsing.researcher import (
+    researcher_from_xml,
+    updated_at_from,
+)
 
 from ._test_utils import Document
 
@@ -143,4 +150,40 @@ class DescribeTuringExpertise:
             assert expertise.sub == sub
             assert expertise.speciality == speciality
 
+    def has_each_area_once_for_full_text(self, researcher, document):
+        turing = researcher_from_xml(researcher, document)
+        areas = turing.expertise_areas.split("; ")
+
+        assert areas.count("Ciências Exatas") == 1
+        assert "Redes Neurais" in areas
+        assert turing.as_table.expertise_areas == turing.expertise_areas
+
+
+
+
+class DescribeUpdatedAt:
+    def is_read_from_the_root(self):
+        root = parse(
+            '<CURRICULO-VITAE DATA-ATUALIZACAO="18102026"'
+            ' HORA-ATUALIZACAO="093015"/>',
+        )
+        expected = datetime(2026, 10, 18, 9, 30, 15)  # noqa: DTZ001
+        assert updated_at_from(root) == expected
+
+    def when_without_time_should_be_at_midnight(self):
+        root = parse('<CURRICULO-VITAE DATA-ATUALIZACAO="18102026"/>')
+        assert updated_at_from(root) == datetime(2026, 10, 18)  # noqa: DTZ001
+
+    def when_missing_should_be_none(self):
+        assert updated_at_from(parse("<CURRICULO-VITAE/>")) is None
+
+    def when_invalid_should_be_none(self):
+        root = parse('<CURRICULO-VITAE DATA-ATUALIZACAO="31022026"/>')
+        assert updated_at_from(root) is None
 
+    def can_be_read_without_parsing_the_document(self):
+        stream = io.BytesIO(
+            b'<CURRICULO-VITAE DATA-ATUALIZACAO="18102026">'
+            b"<DADOS-GERAIS>" + b"<!-- truncated",
+        )
+        assert last_update(stream) == datetime(2026, 10, 18)  # noqa: DTZ001
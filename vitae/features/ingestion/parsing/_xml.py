@@ -10,11 +10,24 @@ Instead, explicitly check if this is ``None``.
 
 from __future__ import annotations
 
+from typing import IO, TYPE_CHECKING
 from xml.etree import ElementTree as ET
 
 from vitae.lib.result import catch
 
-__all__ = ["Node", "ParsingError", "as_int", "attribute", "find"]
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+__all__ = [
+    "Node",
+    "ParsingError",
+    "as_int",
+    "attribute",
+    "find",
+    "root",
+    "stream",
+]
 
 
 class ParsingError(ET.ParseError):
@@ -84,7 +97,86 @@ class Node:
         return [Node(e) for e in self.element.findall(normalized(tag))]
 
 
-def parse(content: str) -> Node:
+def parse(content: str | bytes) -> Node:
+    """Parse a whole document.
+
+    Prefer passing ``bytes``, so the encoding is the one declared
+    by the document itself (e.g. ISO-8859-1), with no decoding step before.
+
+    Returns
+    -------
+    Root's Node.
+
+    """
     if result := catch(lambda: ET.fromstring(content)):
         return Node(result.value)
     raise ParsingError(result.error) from result.error
+
+
+def stream(source: Path | IO[bytes], keep: Iterable[str]) -> Node:
+    """Incrementally parse ``source``, keeping only some root's children.
+
+    Every subtree under the root whose tag is not in ``keep`` is cleared
+    while it is being read and then detached from the root,
+    so the whole document is never held in memory at once.
+
+    Returns
+    -------
+    Root's Node with only the kept subtrees.
+
+    """
+    kept = frozenset(normalized(tag) for tag in keep)
+
+    if result := catch(lambda: _streamed(source, kept)):
+        return Node(result.value)
+    raise ParsingError(result.error) from result.error
+
+
+def root(source: Path | IO[bytes]) -> Node:
+    """Parse only the root's start tag, for its attributes.
+
+    Reading stops as soon as the root element is opened,
+    so only the beginning of ``source`` is read.
+
+    Returns
+    -------
+    Root's Node, whose children must not be relied upon.
+
+    """
+    if result := catch(lambda: _root(source)):
+        return Node(result.value)
+    raise ParsingError(result.error) from result.error
+
+
+def _root(source: Path | IO[bytes]) -> ET.Element:
+    for _, element in ET.iterparse(source, events=("start",)):
+        return element
+
+    message = "no element found"
+    raise ParsingError(message)
+
+
+def _streamed(source: Path | IO[bytes], kept: frozenset[str]) -> ET.Element:
+    root: ET.Element | None = None
+    depth: int = 0
+    skipping: bool = False
+
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if root is None:
+                root = element
+            elif depth == 2:  # noqa: PLR2004
+                skipping = element.tag not in kept
+            continue
+
+        depth -= 1
+        if skipping and depth > 0:
+            element.clear()
+            if depth == 1:
+                root.remove(element)
+
+    if root is None:
+        message = "no element found"
+        raise ParsingError(message)
+    return root
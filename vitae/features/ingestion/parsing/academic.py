@@ -1,97 +1,139 @@
 """Academic related parsing."""
 
 from collections.abc import Iterator
-import uuid
 
 from vitae.features.ingestion.adapters import Education
-from vitae.features.ingestion.adapters.academic import StudyField
+from vitae.features.ingestion.adapters.academic import StudyField, education_id
 
 from . import _xml as xml
+from ._extraction import ANY, Record, rule, visit
+from .index import DocumentIndex
 from .institution import institution_from_xml
 
-__all__ = ["education_from_xml"]
+__all__ = ["RULES", "education_from", "education_from_xml"]
+
+RULES = (
+    rule(
+        "educations",
+        "formacao academica titulacao",
+        rule(
+            "education",
+            ANY,
+            rule(
+                "areas",
+                "areas do conhecimento",
+                rule(
+                    "area",
+                    ANY,
+                    major="nome grande area do conhecimento",
+                    area="nome da area do conhecimento",
+                    sub="nome da sub area do conhecimento",
+                    specialty="nome da especialidade",
+                ),
+            ),
+            course="nome curso",
+            course_id="codigo curso",
+            start="ano de inicio",
+            end="ano de conclusao",
+            institution_id="codigo instituicao",
+            institution_name="nome instituicao",
+            advisor="numero id orientador",
+        ),
+    ),
+)
+
+GENERAL = rule("general", "dados gerais", *RULES)
 
 
 def education_from_xml(
     researcher_id: str,
     document: xml.Node,
+    index: DocumentIndex | None = None,
 ) -> Iterator[Education]:
     """Extract education information from a Lattes curriculum XML.
 
+    Pass the document's ``index`` when it's shared with other extractors,
+    otherwise this is built from ``document``.
+
+    Yields
+    ------
+    Researcher's Education Background.
+
+    """
+    data = visit(document.first("dados gerais").element, GENERAL)
+    yield from education_from(
+        researcher_id,
+        data,
+        index or DocumentIndex.of(document),
+    )
+
+
+def education_from(
+    researcher_id: str,
+    data: Record,
+    index: DocumentIndex,
+) -> Iterator[Education]:
+    """Build the Education Background from the `DADOS-GERAIS` record.
+
     Yields
     ------
     Researcher's Education Background.
 
     """
-    data = document.first("dados gerais")
-    education_summary = data.first("formacao academica titulacao").element
-
-    if education_summary is not None:
-        for edu in education_summary:
-            education = xml.Node(edu)
-            if edu.tag != "FORMACAO-ACADEMICA-TITULACAO":
-                yield Education(
-                    id=uuid.uuid1(),
-                    researcher_id=researcher_id,
-                    category=edu.tag,
-                    course=education["nome curso"],
-                    start=xml.as_int(education["ano de inicio"]),
-                    end=xml.as_int(education["ano de conclusao"]),
-                    institution=institution_from_xml(
-                        education["codigo instituicao"],
-                        education["nome instituicao"],
-                        document,
-                    ),
-                    advisor=education["numero id orientador"],
-                    fields=list(fields_from_education(education, document)),
-                )
+    if (education_summary := data.first("educations")) is None:
+        return
+
+    for ordinal, education in enumerate(education_summary.all("education")):
+        if education.tag != "FORMACAO-ACADEMICA-TITULACAO":
+            yield Education(
+                id=education_id(researcher_id, ordinal),
+                researcher_id=researcher_id,
+                category=education.tag,
+                course=education["course"],
+                start=xml.as_int(education["start"]),
+                end=xml.as_int(education["end"]),
+                institution=institution_from_xml(
+                    education["institution_id"],
+                    education["institution_name"],
+                    index,
+                ),
+                advisor=education["advisor"],
+                fields=list(fields_from_education(education, index)),
+            )
 
 
 def fields_from_education(
-    education: xml.Node,
-    document: xml.Node,
+    education: Record,
+    index: DocumentIndex,
 ) -> Iterator[StudyField]:
-    areas = education.first("areas do conhecimento").element
+    areas = education.first("areas")
 
     if areas is None:
-        if (course_id := education["codigo curso"]) is not None:  # noqa: SIM102
-            if (found := field_from_complementary(course_id, document)) is not None:
+        if (course_id := education["course_id"]) is not None:  # noqa: SIM102
+            if (
+                found := field_from_complementary(course_id, index)
+            ) is not None:
                 yield found
     else:
-        for a in areas:
-            area = xml.Node(a)
+        for area in areas.all("area"):
             yield StudyField(
-                major=area["nome grande area do conhecimento"],
-                area=area["nome da area do conhecimento"],
-                sub=area["nome da sub area do conhecimento"],
-                specialty=area["nome da especialidade"],
+                major=area["major"],
+                area=area["area"],
+                sub=area["sub"],
+                specialty=area["specialty"],
             )
 
 
 def field_from_complementary(
     course_id: str,
-    document: xml.Node,
+    index: DocumentIndex,
 ) -> StudyField | None:
-    default_value = None
-
-    found: xml.Node = xml.Node(None)
-
-    if not (extra := document.first("dados complementares")).exists:
-        return default_value
-
-    if not (courses := extra.first("informacoes adicionais cursos")).exists:
-        return default_value
-
-    for course in courses.all("informacao adicional curso"):
-        if course["codigo curso"] == course_id:
-            found = course
-            break
-    else:
-        return default_value
+    if (found := index.course(course_id)) is None:
+        return None
 
     return StudyField(
-        major=found["nome grande area do conhecimento"],
-        area=found["nome da area do conhecimento"],
-        sub=found["nome da sub area do conhecimento"],
-        specialty=found["nome da especialidade"],
+        major=found["major"],
+        area=found["area"],
+        sub=found["sub"],
+        specialty=found["specialty"],
     )
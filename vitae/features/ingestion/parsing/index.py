@@ -0,0 +1,101 @@
+"""Document-level lookup index for complementary data."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ._extraction import Record, rule, visit
+
+if TYPE_CHECKING:
+    from . import _xml as xml
+
+__all__ = ["COMPLEMENTARY", "DocumentIndex"]
+
+COMPLEMENTARY = rule(
+    "complementary",
+    "dados complementares",
+    rule(
+        "institutions",
+        "informacoes adicionais instituicoes",
+        rule(
+            "institution",
+            "informacao adicional instituicao",
+            code="codigo instituicao",
+            country="nome pais instituicao",
+            state="sigla uf instituicao",
+            abbr="sigla instituicao",
+        ),
+    ),
+    rule(
+        "courses",
+        "informacoes adicionais cursos",
+        rule(
+            "course",
+            "informacao adicional curso",
+            code="codigo curso",
+            major="nome grande area do conhecimento",
+            area="nome da area do conhecimento",
+            sub="nome da sub area do conhecimento",
+            specialty="nome da especialidade",
+        ),
+    ),
+)
+
+
+@dataclass(frozen=True)
+class DocumentIndex:
+    """Complementary data of a document indexed by its Lattes' codes.
+
+    Institutions and courses referenced along the curriculum are detailed
+    only once at `DADOS-COMPLEMENTARES`. Instead of scanning them for each
+    reference, this is built once per document and shared by all extractors.
+
+    Note:
+    ----
+    If a code is repeated, the first occurrence wins,
+    just like a linear scan would do.
+
+    """
+
+    institutions: dict[str | None, Record]
+    courses: dict[str | None, Record]
+
+    @classmethod
+    def of(cls, document: xml.Node) -> DocumentIndex:
+        """Build the index from a whole document.
+
+        Returns
+        -------
+        The document's index.
+
+        """
+        extra = visit(
+            document.first("dados complementares").element,
+            COMPLEMENTARY,
+        )
+
+        institutions = extra.first("institutions")
+        courses = extra.first("courses")
+
+        return cls(
+            institutions=by_code(
+                institutions.all("institution") if institutions else [],
+            ),
+            courses=by_code(courses.all("course") if courses else []),
+        )
+
+    def institution(self, code: str | None) -> Record | None:
+        """Complementary data of an Institution, if any."""  # noqa: DOC201
+        return self.institutions.get(code)
+
+    def course(self, code: str | None) -> Record | None:
+        """Complementary data of a Course, if any."""  # noqa: DOC201
+        return self.courses.get(code)
+
+
+def by_code(records: list[Record]) -> dict[str | None, Record]:
+    indexed: dict[str | None, Record] = {}
+    for record in records:
+        indexed.setdefault(record["code"], record)
+    return indexed
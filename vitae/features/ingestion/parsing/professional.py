@@ -7,17 +7,65 @@ from typing import TYPE_CHECKING
 from vitae.features.ingestion.adapters import Address, Experience
 
 from . import _xml as xml
+from ._extraction import Record, rule, visit
+from .index import DocumentIndex
 from .institution import institution_from_xml
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
-__all__ = ["address_from_xml", "experience_from_xml"]
+__all__ = [
+    "RULES",
+    "address_from",
+    "address_from_xml",
+    "experience_from",
+    "experience_from_xml",
+]
+
+RULES = (
+    rule(
+        "experiences",
+        "atuacoes profissionais",
+        rule(
+            "experience",
+            "atuacao profissional",
+            rule(
+                "link",
+                "vinculos",
+                kind="tipo de vinculo",
+                other_kind="outro vinculo informado",
+                start="ano inicio",
+                end="ano fim",
+            ),
+            institution_id="codigo instituicao",
+            institution_name="nome instituicao",
+        ),
+    ),
+    rule(
+        "addresses",
+        "endereco",
+        rule(
+            "address",
+            "endereco profissional",
+            country="pais",
+            state="uf",
+            city="cidade",
+            neighborhood="bairro",
+            cep="cep",
+            public_place="logradouro complemento",
+            institution_id="codigo instituicao empresa",
+            institution_name="nome instituicao empresa",
+        ),
+    ),
+)
+
+GENERAL = rule("general", "dados gerais", *RULES)
 
 
 def experience_from_xml(
     researcher_id: str,
     document: xml.Node,
+    index: DocumentIndex | None = None,
 ) -> Iterator[Experience]:
     """Extract professional experience from the Lattes curriculum.
 
@@ -29,29 +77,49 @@ def experience_from_xml(
     Researcher's Professional Experience.
 
     """
-    data = document.first("dados gerais")
+    data = visit(document.first("dados gerais").element, GENERAL)
+    yield from experience_from(
+        researcher_id,
+        data,
+        index or DocumentIndex.of(document),
+    )
 
-    if not (experiences := data.first("atuacoes profissionais")).exists:
-        return
 
-    for experience in experiences.all("atuacao profissional"):
-        links: list[xml.Node] = experience.all("vinculos")
+def experience_from(
+    researcher_id: str,
+    data: Record,
+    index: DocumentIndex,
+) -> Iterator[Experience]:
+    """Build the Professional Experience from the `DADOS-GERAIS` record.
+
+    Yields
+    ------
+    Researcher's Professional Experience.
+
+    """
+    if (experiences := data.first("experiences")) is None:
+        return
 
-        for link in links:
+    for experience in experiences.all("experience"):
+        for link in experience.all("link"):
             yield Experience(
                 researcher_id=researcher_id,
                 relationship=relationship_from_link(link),
                 institution=institution_from_xml(
-                    experience["codigo instituicao"],
-                    experience["nome instituicao"],
-                    document,
+                    experience["institution_id"],
+                    experience["institution_name"],
+                    index,
                 ),
-                start=xml.as_int(link["ano inicio"]),
-                end=xml.as_int(link["ano fim"]),
+                start=xml.as_int(link["start"]),
+                end=xml.as_int(link["end"]),
             )
 
 
-def address_from_xml(researcher_id: str, document: xml.Node) -> Address | None:
+def address_from_xml(
+    researcher_id: str,
+    document: xml.Node,
+    index: DocumentIndex | None = None,
+) -> Address | None:
     """Extract Researcher's Professional Address from XML.
 
     Returns
@@ -59,10 +127,30 @@ def address_from_xml(researcher_id: str, document: xml.Node) -> Address | None:
     Researcher's Address.
 
     """
-    data = document.first("dados gerais")
-    addr = data.first("endereco").first("endereco profissional")
+    data = visit(document.first("dados gerais").element, GENERAL)
+    return address_from(
+        researcher_id,
+        data,
+        index or DocumentIndex.of(document),
+    )
+
+
+def address_from(
+    researcher_id: str,
+    data: Record,
+    index: DocumentIndex,
+) -> Address | None:
+    """Build the Professional Address from the `DADOS-GERAIS` record.
+
+    Returns
+    -------
+    Researcher's Address.
+
+    """
+    if (addresses := data.first("addresses")) is None:
+        return None
 
-    if addr is None:
+    if (addr := addresses.first("address")) is None:
         return None
 
     if not addr["cep"]:
@@ -70,21 +158,21 @@ def address_from_xml(researcher_id: str, document: xml.Node) -> Address | None:
 
     return Address(
         researcher_id=researcher_id,
-        country=addr["pais"],
-        state=addr["uf"],
-        city=addr["cidade"],
-        neighborhood=addr["bairro"],
+        country=addr["country"],
+        state=addr["state"],
+        city=addr["city"],
+        neighborhood=addr["neighborhood"],
         cep=addr["cep"],
-        public_place=addr["logradouro complemento"],
+        public_place=addr["public_place"],
         institution=institution_from_xml(
-            addr["codigo instituicao empresa"],
-            addr["nome instituicao empresa"],
-            document,
+            addr["institution_id"],
+            addr["institution_name"],
+            index,
         ),
     )
 
 
-def relationship_from_link(link: xml.Node) -> str | None:
+def relationship_from_link(link: Record) -> str | None:
     """Determine the type of professional link.
 
     If the researcher has a 'LIVRE' (free) link
@@ -95,8 +183,8 @@ def relationship_from_link(link: xml.Node) -> str | None:
     The type of professional link as a string, or None if not available.
 
     """
-    link_kind: str | None = link["tipo de vinculo"]
-    other_link_kind: str | None = link["outro vinculo informado"]
+    link_kind: str | None = link["kind"]
+    other_link_kind: str | None = link["other_kind"]
 
     if link_kind == "LIVRE" and other_link_kind:
         return other_link_kind
@@ -1,6 +1,7 @@
 """Researcher's related parsing."""
 
 from collections.abc import Iterator
+from datetime import datetime
 
 from vitae.features.ingestion.adapters import (
     Expertise,
@@ -9,8 +10,41 @@ from vitae.features.ingestion.adapters import (
 )
 
 from . import _xml as xml
+from ._extraction import Record, rule, visit
 
-__all__ = ["researcher_from_xml"]
+__all__ = [
+    "ATTRIBUTES",
+    "RULES",
+    "researcher_from",
+    "researcher_from_xml",
+    "updated_at_from",
+]
+
+ATTRIBUTES = {
+    "full_name": "nome completo",
+    "quotes_names": "nome em citacoes bibliograficas",
+    "orcid": "ORCID ID",
+    "born_country": "pais-de-nascimento",
+    "nationality": "nacionalidade",
+}
+
+RULES = (
+    rule("resume", "resumo CV", abstract="texto resumo CV RH"),
+    rule(
+        "areas",
+        "areas-de-atuacao",
+        rule(
+            "area",
+            "area-de-atuacao",
+            major="nome-grande-area-do-conhecimento",
+            area="nome-da-area-do-conhecimento",
+            sub="nome-da-sub-area-do-conhecimento",
+            speciality="nome-da-especialidade",
+        ),
+    ),
+)
+
+GENERAL = rule("general", "dados gerais", *RULES, **ATTRIBUTES)
 
 
 def researcher_from_xml(researcher_id: str, document: xml.Node) -> Researcher:
@@ -25,36 +59,72 @@ def researcher_from_xml(researcher_id: str, document: xml.Node) -> Researcher:
     Researcher's general data.
 
     """
-    data = document.first("dados gerais")
-    resume = data.first("resumo CV")
+    data = visit(document.first("dados gerais").element, GENERAL)
+    return researcher_from(researcher_id, data)
+
+
+def researcher_from(
+    researcher_id: str,
+    data: Record,
+    updated_at: datetime | None = None,
+) -> Researcher:
+    """Build the Researcher from the `DADOS-GERAIS` record.
+
+    Returns
+    -------
+    Researcher's general data.
+
+    """
+    resume = data.first("resume")
 
     return Researcher(
         lattes_id=researcher_id,
-        full_name=data["nome completo"] or "Invalid Name",
-        quotes_names=data["nome em citacoes bibliograficas"],
-        orcid=data["ORCID ID"],
-        abstract=resume["texto resumo CV RH"],
-        nationality=nationality_from_xml(data),
-        expertise=list(expertise_from_xml(data)),
+        full_name=data["full_name"] or "Invalid Name",
+        quotes_names=data["quotes_names"],
+        orcid=data["orcid"],
+        abstract=resume["abstract"] if resume else None,
+        nationality=nationality_from(data),
+        expertise=list(expertise_from(data)),
+        updated_at=updated_at,
     )
 
 
-def nationality_from_xml(data: xml.Node) -> Nationality:
+def updated_at_from(root: xml.Node) -> datetime | None:
+    """Last update of the curriculum, from `CURRICULO-VITAE`'s attributes.
+
+    `DATA-ATUALIZACAO` is formatted as ``DDMMYYYY``,
+    and `HORA-ATUALIZACAO`, when present, as ``HHMMSS``.
+
+    Returns
+    -------
+    When the curriculum was last updated, if valid.
+
+    """
+    date = root["data atualizacao"]
+    time = root["hora atualizacao"] or "000000"
+
+    try:
+        return datetime.strptime(date + time, "%d%m%Y%H%M%S")  # noqa: DTZ007
+    except (TypeError, ValueError):
+        return None
+
+
+def nationality_from(data: Record) -> Nationality:
     return Nationality(
-        born_country=data["pais-de-nascimento"],
-        nationality=data["nacionalidade"],
+        born_country=data["born_country"],
+        nationality=data["nationality"],
     )
 
 
-def expertise_from_xml(data: xml.Node) -> Iterator[Expertise]:
-    areas = data.first("areas-de-atuacao").all("area-de-atuacao")
+def expertise_from(data: Record) -> Iterator[Expertise]:
+    areas = data.first("areas")
 
     return (
         Expertise(
-            major=area["nome-grande-area-do-conhecimento"],
-            area=area["nome-da-area-do-conhecimento"],
-            sub=area["nome-da-sub-area-do-conhecimento"],
-            speciality=area["nome-da-especialidade"],
+            major=area["major"],
+            area=area["area"],
+            sub=area["sub"],
+            speciality=area["speciality"],
         )
-        for area in areas
+        for area in (areas.all("area") if areas else [])
     )
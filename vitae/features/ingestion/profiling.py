@@ -0,0 +1,194 @@
+"""Profiling of the ingestion, group by group.
+
+Each group is profiled on its own, so a slow one can be found
+and then profiled in isolation, selecting it by ``--indexes``.
+Reports are written as each group ends:
+
+    <directory>/
+        <group>.cpu.prof    # cProfile's stats, to be sorted by pstats
+        <group>.cpu.txt     # the slowest functions, by cumulative time
+        <group>.memory.txt  # top allocations, and growth since last group
+
+Notes
+-----
+Only this process is profiled, so when parsing with ``workers``,
+the parsing itself is not. Use a single worker to profile it too.
+
+"""
+
+from __future__ import annotations
+
+import cProfile
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+import pstats
+import tracemalloc
+from typing import TYPE_CHECKING, Literal, Protocol, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+    from types import TracebackType
+
+__all__ = [
+    "PROFILERS",
+    "CpuProfiler",
+    "MemoryProfiler",
+    "ProfileKind",
+    "Profiler",
+    "profiler_from",
+]
+
+type ProfileKind = Literal["cpu", "memory"]
+
+TOP = 50
+FRAMES = 10
+
+
+class Profiler(Protocol):
+    """Profiles each group, while open."""
+
+    def group(self, directory: Path) -> AbstractContextManager[None]:
+        """Profile a group, writing its report once it ends."""
+        ...
+
+    def __enter__(self) -> Self: ...
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None: ...
+
+
+@dataclass
+class _Profiler:
+    directory: Path
+    top: int = TOP
+
+    def __enter__(self) -> Self:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        pass
+
+    def report(self, directory: Path, kind: str) -> Path:
+        return self.directory / f"{directory.name}.{kind}"
+
+
+@dataclass
+class CpuProfiler(_Profiler):
+    """Deterministic profiling, by cProfile."""
+
+    @contextmanager
+    def group(self, directory: Path) -> Iterator[None]:
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            profile.dump_stats(self.report(directory, "cpu.prof"))
+
+            with self.report(directory, "cpu.txt").open("w") as report:
+                stats = pstats.Stats(profile, stream=report)
+                stats.sort_stats(pstats.SortKey.CUMULATIVE)
+                stats.print_stats(self.top)
+
+
+@dataclass
+class MemoryProfiler(_Profiler):
+    """Allocations tracing, by tracemalloc.
+
+    Tracing starts once this is open and stops when closed,
+    so the growth of each group is compared with the previous one's.
+    """
+
+    frames: int = FRAMES
+
+    _previous: tracemalloc.Snapshot | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+
+    def __enter__(self) -> Self:
+        super().__enter__()
+        tracemalloc.start(self.frames)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        tracemalloc.stop()
+        self._previous = None
+
+    @contextmanager
+    def group(self, directory: Path) -> Iterator[None]:
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [
+                    tracemalloc.Filter(
+                        inclusive=False,
+                        filename_pattern=pattern,
+                    )
+                    for pattern in (tracemalloc.__file__, "<frozen *>")
+                ],
+            )
+            self._write(directory, snapshot)
+            self._previous = snapshot
+
+    def _write(self, directory: Path, snapshot: tracemalloc.Snapshot) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+
+        with self.report(directory, "memory.txt").open("w") as report:
+            print(f"Traced: {current / 2**20:.1f} MiB", file=report)
+            print(f"Peak: {peak / 2**20:.1f} MiB", file=report)
+
+            print(f"\nTop {self.top} allocations, by line:", file=report)
+            for stat in snapshot.statistics("lineno")[: self.top]:
+                print(stat, file=report)
+
+            if self._previous is None:
+                return
+
+            print(f"\nTop {self.top} growths, since last group:", file=report)
+            growths = snapshot.compare_to(self._previous, "lineno")
+            for stat in growths[: self.top]:
+                print(stat, file=report)
+
+
+PROFILERS: dict[ProfileKind, Callable[[Path], Profiler]] = {
+    "cpu": CpuProfiler,
+    "memory": MemoryProfiler,
+}
+
+
+def profiler_from(
+    kind: ProfileKind | None,
+    directory: Path,
+) -> AbstractContextManager[Profiler | None]:
+    """Create the profiler of a kind, if any, writing into ``directory``.
+
+    Returns
+    -------
+    The profiler, to be open while ingesting, or nothing.
+
+    """
+    if kind is None:
+        return nullcontext()
+    return PROFILERS[kind](directory)
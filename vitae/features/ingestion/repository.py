@@ -1,16 +1,25 @@
 """Repository pattern for the Ingestion feature."""
 
-from collections.abc import Iterable
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
+from datetime import datetime
 import itertools
 from pathlib import Path
 
 import loguru
+from sqlmodel import col, select
 
 from vitae.features.ingestion.adapters import Curriculum
-from vitae.infra.database import Database
+from vitae.features.ingestion.checkpoint import Checkpoint
+from vitae.features.ingestion.metrics import Metrics
+from vitae.features.ingestion.sinks import Sink
+from vitae.infra.database import Database, tables
 from vitae.infra.database.transactions import bulk
 
+IDS_PER_QUERY = 5_000
+
 
 def flatten[T](xs: Iterable[Iterable[T]]) -> Iterable[T]:
     """Unnest nested iterable.
@@ -56,11 +65,26 @@ def log_with(into: Path, logger, logfile: str, level: str) -> None:  # noqa: ANN
 
 @dataclass
 class Researchers:
-    """Researcher's Curriculum Repository."""
+    """Researcher's Curriculum Repository.
+
+    When ``upsert`` is set, curricula already stored are replaced,
+    instead of rolling back their whole group as duplicates,
+    so they can be ingested on top of a previous or overlapping run.
+
+    Conversion into tables and commits are timed by ``metrics``, if any,
+    which also count stored rows and rolled back transactions.
+
+    Batches are written into the ``sink``, if any, instead of ``db``,
+    which is then never touched, e.g. to validate a dump on a dry run.
+    """
 
     db: Database
     log_directory: Path
     every: int = 50
+    checkpoint: Checkpoint | None = None
+    upsert: bool = False
+    metrics: Metrics | None = None
+    sink: Sink | None = None
 
     def __post_init__(self) -> None:
         """Setups logging.
@@ -69,6 +93,9 @@ class Researchers:
         - INFO: logs stored data.
         - WARN: logs rolledback groups.
         - ERROR: logs failed individual commits.
+
+        Stored data is also added to the `checkpoint`, if any,
+        so the next runs can skip it.
         """
         self.log = loguru.logger
         log_with(self.log_directory, self.log, "processed", "INFO")
@@ -80,7 +107,7 @@ class Researchers:
 
         This function tries to store them in batch each `every` researcher.
         When this is not possible to put them at once, this will rollback and
-        try to put one by one, to log the defected one.
+        bisect the group, to find and log the defected ones.
         """
         for group in itertools.batched(researchers, self.every):
             if self._try_put_at_once(group):
@@ -88,17 +115,82 @@ class Researchers:
             else:
                 self._re_insert(group)
 
+            if self.metrics is not None:
+                print(self.metrics.progress())
+
+    def last_updates(
+        self,
+        lattes_ids: Iterable[str],
+    ) -> dict[str, datetime | None]:
+        """Query when each stored Researcher was last updated.
+
+        Returns
+        -------
+        Last update of each Researcher of ``lattes_ids`` already stored.
+        Those stored before updates were tracked have it as `None`.
+        IDs that aren't numbers are never stored, so they're skipped.
+        Nothing is stored on a ``sink``, so it's empty then.
+
+        """
+        updates: dict[str, datetime | None] = {}
+        if self.sink is not None:
+            return updates
+
+        with self.db.session as session:
+            for chunk in itertools.batched(lattes_ids, IDS_PER_QUERY):
+                by_number = {
+                    int(lattes_id): lattes_id
+                    for lattes_id in chunk
+                    if lattes_id.isdigit()
+                }
+                query = select(
+                    tables.Researcher.lattes_id,
+                    tables.Researcher.updated_at,
+                ).where(col(tables.Researcher.lattes_id).in_(by_number))
+                updates.update(
+                    (by_number[number], updated_at)
+                    for number, updated_at in session.exec(query)
+                )
+
+        return updates
+
     def _log_success(self, batch: Iterable[Curriculum]) -> None:
         for curriculum in batch:
             self.log.info(curriculum.id)
 
-    def _re_insert(self, batch: Iterable[Curriculum]) -> None:
+        if self.checkpoint is not None:
+            self.checkpoint.add(curriculum.id for curriculum in batch)
+
+    def _re_insert(self, batch: Sequence[Curriculum]) -> None:
         self._log_fail(batch)
-        self._put_each_from(batch)
+        self._bisect(batch)
 
     def _log_fail(self, batch: Iterable[Curriculum]) -> None:
         ids_to_log: str = ",".join(curriculum.id for curriculum in batch)
         self.log.warning(ids_to_log)
+        self._count("rolledback_groups")
+
+    def _bisect(self, group: Sequence[Curriculum]) -> None:
+        """Put each half of a rolledback group on database.
+
+        Halves that can not be put at once are split again,
+        until the defected Researchers are isolated and logged.
+        So, each defected Researcher costs about `log2(len(group))`
+        transactions, instead of a transaction per Researcher of the group.
+        """
+        middle = len(group) // 2
+
+        for half in (group[:middle], group[middle:]):
+            if not half:
+                continue
+
+            if self._try_put_at_once(half):
+                self._log_success(half)
+            elif len(half) == 1:
+                self.log.error(half[0].id)
+                self._count("failed")
+            else:
+                self._bisect(half)
 
     def _try_put_at_once(self, batch: Iterable[Curriculum]) -> bool:
         """Put all Researchers at once on database.
@@ -110,22 +202,57 @@ class Researchers:
         """
         curricula = list(batch)
 
+        with self._timing("convert"):
+            institutions, transaction = self._as_tables(curricula)
+
+        sink = self.db.put if self.sink is None else self.sink
+        with self._timing("commit"):
+            stored = sink.batch_transaction(
+                institutions,
+                transaction,
+                upsert=self.upsert,
+            )
+
+        if not stored:
+            self._count("rollbacks")
+        elif self.metrics is not None:
+            self.metrics.rows.update(
+                Counter(table.__tablename__ for table in transaction),
+            )
+
+        return stored
+
+    @staticmethod
+    def _as_tables(
+        curricula: list[Curriculum],
+    ) -> tuple[bulk.Institutions, bulk.Curricula]:
+        """Convert curricula into the tables of a batch transaction.
+
+        Every table is listed up-front, so they can be counted once stored.
+
+        Returns
+        -------
+        The batch's institutions and the remaining tables.
+
+        """
         researchers = bulk.Researchers(
             researchers=[cv.researcher.as_table for cv in curricula],
             nationality=[cv.researcher.nationality_table for cv in curricula],
-            expertise=flatten(
-                [cv.researcher.expertise_tables for cv in curricula],
+            expertise=list(
+                flatten([cv.researcher.expertise_tables for cv in curricula]),
             ),
         )
 
         academic = bulk.Academic(
-            education=(
+            education=[
                 edu.as_table
                 for edu in flatten([cv.education for cv in curricula])
-            ),
-            fields=flatten(
-                edu.fields_as_table
-                for edu in flatten([cv.education for cv in curricula])
+            ],
+            fields=list(
+                flatten(
+                    edu.fields_as_table
+                    for edu in flatten([cv.education for cv in curricula])
+                ),
             ),
             advisoring=existent(
                 [
@@ -136,10 +263,10 @@ class Researchers:
         )
 
         professional = bulk.Professional(
-            experience=(
+            experience=[
                 xp.as_table
                 for xp in flatten([cv.experience for cv in curricula])
-            ),
+            ],
             address=[
                 cv.address.as_table
                 for cv in curricula
@@ -153,57 +280,17 @@ class Researchers:
             if inst.lattes_id is not None
         ]
 
-        return self.db.put.batch_transaction(
-            bulk.Institutions(institutions),
-            bulk.Curricula(
-                researchers=researchers,
-                academic=academic,
-                professional=professional,
-            ),
-        )
-
-    def _put_each_from(self, group: Iterable[Curriculum]) -> None:
-        """Put Researchers one by one on database."""
-        for researcher in group:
-            if self._put_single(researcher):
-                self.log.info(researcher.id)
-            else:
-                self.log.error(researcher.id)
-
-    def _put_single(self, cv: Curriculum) -> bool:
-        """Put a single Researcher on database.
-
-        Returns
-        -------
-        If the researcher was sucessfully stored.
-
-        """
-        researchers = bulk.Researchers(
-            researchers=[cv.researcher.as_table],
-            nationality=[cv.researcher.nationality_table],
-            expertise=cv.researcher.expertise_tables,
-        )
-
-        academic = bulk.Academic(
-            education=(edu.as_table for edu in cv.education),
-            fields=flatten(edu.fields_as_table for edu in cv.education),
-            advisoring=existent(
-                [edu.advisor_as_table for edu in cv.education],
-            ),
+        return bulk.Institutions(institutions), bulk.Curricula(
+            researchers=researchers,
+            academic=academic,
+            professional=professional,
         )
 
-        professional = bulk.Experience(
-            experience=(xp.as_table for xp in cv.experience),
-            address=[cv.address],
-        )
+    def _count(self, name: str) -> None:
+        if self.metrics is not None:
+            self.metrics.count(name)
 
-        return self.db.put.batch_transaction(
-            institutions=bulk.Institutions(
-                inst.as_table for inst in cv.all_institutions
-            ),
-            curricula=bulk.Curricula(
-                researchers=researchers,
-                academic=academic,
-                professional=professional,
-            ),
-        )
+    def _timing(self, stage: str) -> AbstractContextManager[None]:
+        if self.metrics is None:
+            return nullcontext()
+        return self.metrics.timing(stage)
@@ -0,0 +1,298 @@
+"""Sinks where ingested batches are written, instead of the database.
+
+Curricula go through the whole pipeline, from reading to the conversion
+into tables, but nothing is stored, so a dump can be validated and
+parsing throughput measured with no database at all:
+
+- ``null``: discards every batch.
+- ``jsonl``: writes each row as a JSON line, tagged by its table,
+  into ``<directory>/curricula.jsonl``.
+- ``staging``: writes each row into the CSV file of its table and group,
+  under ``<directory>``, to be loaded later, see `staging`.
+
+The database is the default sink, where ``Researchers`` write through
+`PutOperations`, which is a `Sink` by itself.
+"""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+import json
+from typing import IO, TYPE_CHECKING, Literal, Protocol, Self
+
+from vitae.infra.database import staging
+from vitae.infra.database.tables import Researcher
+
+if TYPE_CHECKING:
+    from _csv import _writer
+    from collections.abc import Callable, Iterable
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+    from types import TracebackType
+
+    from sqlalchemy import Column, Table
+    from sqlmodel import SQLModel
+
+    from vitae.infra.database.tables import Institution
+    from vitae.infra.database.transactions.bulk import Curricula, Institutions
+
+__all__ = [
+    "SINKS",
+    "JsonLinesSink",
+    "NullSink",
+    "Sink",
+    "SinkName",
+    "StagingSink",
+    "sink_from",
+]
+
+type SinkName = Literal["database", "null", "jsonl", "staging"]
+
+
+class Sink(Protocol):
+    """Where batches of curricula are written."""
+
+    def batch_transaction(
+        self,
+        institutions: Institutions,
+        curricula: Curricula,
+        *,
+        upsert: bool = False,
+    ) -> bool:
+        """Write a batch at once.
+
+        Returns
+        -------
+        If the whole batch was written.
+
+        """
+        ...
+
+
+@dataclass
+class NullSink:
+    """Discards every batch, as if it was stored."""
+
+    def batch_transaction(
+        self,
+        institutions: Institutions,  # noqa: ARG002
+        curricula: Curricula,  # noqa: ARG002
+        *,
+        upsert: bool = False,  # noqa: ARG002
+    ) -> bool:
+        return True
+
+
+@dataclass
+class JsonLinesSink:
+    """Writes every row as a JSON line, while open.
+
+    Each line holds the row's ``table`` and its columns as ``row``,
+    with values such as UUIDs as strings, so rows can be told apart,
+    e.g. with ``jq 'select(.table == "x")'``.
+    Institutions are written only once, as they would be stored.
+    The file is truncated once opened.
+    """
+
+    directory: Path
+
+    _file: IO[str] | None = field(default=None, init=False, repr=False)
+    _institutions: set[str] = field(
+        default_factory=set,
+        init=False,
+        repr=False,
+    )
+
+    @property
+    def path(self) -> Path:
+        return self.directory / "curricula.jsonl"
+
+    def __enter__(self) -> Self:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("w", encoding="utf-8")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def batch_transaction(
+        self,
+        institutions: Institutions,
+        curricula: Curricula,
+        *,
+        upsert: bool = False,  # noqa: ARG002
+    ) -> bool:
+        if self._file is None:
+            message = "JSON lines sink is not open"
+            raise RuntimeError(message)
+
+        new = unseen(institutions, self._institutions)
+        self._file.writelines(
+            json.dumps(
+                {
+                    "table": row.__tablename__,
+                    "row": {
+                        column.name: getattr(row, column.name)
+                        for column in staging.columns_of(row.__table__)
+                    },
+                },
+                ensure_ascii=False,
+                default=str,
+            )
+            + "\n"
+            for row in (*new, *curricula)
+        )
+        return True
+
+
+@dataclass
+class StagingSink:
+    """Writes every row into staging files, a CSV per table and group.
+
+    Batches never span groups, and groups are named by the prefix of
+    their Lattes IDs, so each batch is staged into its first
+    researcher's group. Files are written as ``<group>.csv.part``,
+    and renamed once their group ends, so partial ones are never loaded.
+    Institutions are written only once, as they would be stored.
+    """
+
+    directory: Path
+
+    _group: str | None = field(default=None, init=False, repr=False)
+    _files: dict[Table, tuple[IO[str], _writer, list[Column]]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    _institutions: set[str] = field(
+        default_factory=set,
+        init=False,
+        repr=False,
+    )
+
+    def __enter__(self) -> Self:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._end_group(complete=exc_type is None)
+
+    def batch_transaction(
+        self,
+        institutions: Institutions,
+        curricula: Curricula,
+        *,
+        upsert: bool = False,  # noqa: ARG002
+    ) -> bool:
+        group = next(
+            (
+                f"{row.lattes_id:016}"[:2]
+                for row in curricula
+                if isinstance(row, Researcher)
+            ),
+            None,
+        )
+        if group is None:
+            return True
+
+        if group != self._group:
+            self._end_group(complete=True)
+            self._start_group(group)
+
+        rows: Iterable[SQLModel] = (
+            *unseen(institutions, self._institutions),
+            *curricula,
+        )
+        for row in rows:
+            table = row.__table__  # type: ignore[attr-defined]
+            _, writer, columns = self._file_of(table)
+            writer.writerow([getattr(row, column.name) for column in columns])
+        return True
+
+    def path(self, table: Table, group: str) -> Path:
+        return self.directory / table.name / f"{group}.csv"
+
+    def _start_group(self, group: str) -> None:
+        """Remove what was staged for a group, so it's staged again."""
+        self._group = group
+        for level in staging.LEVELS:
+            for table in level:
+                self.path(table, group).unlink(missing_ok=True)
+
+    def _end_group(self, *, complete: bool) -> None:
+        for table, (file, _, _) in self._files.items():
+            file.close()
+            if complete and self._group is not None:
+                part = self.path(table, self._group).with_suffix(".csv.part")
+                part.replace(self.path(table, self._group))
+        self._files.clear()
+
+    def _file_of(
+        self,
+        table: Table,
+    ) -> tuple[IO[str], _writer, list[Column]]:
+        if table not in self._files and self._group is not None:
+            path = self.path(table, self._group).with_suffix(".csv.part")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            file = path.open("w", encoding="utf-8", newline="")
+            self._files[table] = (
+                file,
+                staging.writer_of(file, table),
+                staging.columns_of(table),
+            )
+        return self._files[table]
+
+
+def unseen(
+    institutions: Iterable[Institution],
+    seen: set[str],
+) -> list[Institution]:
+    """Institutions not seen yet, remembering them.
+
+    Returns
+    -------
+    The first occurrence of each institution not in ``seen``.
+
+    """
+    new = []
+    for institution in institutions:
+        if institution.lattes_id not in seen:
+            seen.add(institution.lattes_id)
+            new.append(institution)
+    return new
+
+
+SINKS: dict[SinkName, Callable[[Path], AbstractContextManager[Sink]]] = {
+    "null": lambda _: nullcontext(NullSink()),
+    "jsonl": JsonLinesSink,
+    "staging": StagingSink,
+}
+
+
+def sink_from(
+    name: SinkName,
+    directory: Path,
+) -> AbstractContextManager[Sink | None]:
+    """Create a sink by its name, writing into ``directory`` if needed.
+
+    Returns
+    -------
+    The sink, to be open while ingesting, or nothing for the database.
+
+    """
+    if name == "database":
+        return nullcontext()
+    return SINKS[name](directory)
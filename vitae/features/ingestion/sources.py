@@ -0,0 +1,142 @@
+"""Sources of Curricula to be ingested.
+
+A source picks the curricula among the files of a group's directory,
+as listed by the `Manifest`, as entries, which can be skipped by their
+Lattes IDs before anything is read, and opened as binary streams to be parsed.
+
+Entries are plain values, so they can be sent to other processes.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING, Literal, Protocol
+from zipfile import BadZipFile, ZipFile
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+
+__all__ = [
+    "SOURCES",
+    "Entry",
+    "Source",
+    "SourceName",
+    "UnreadableArchive",
+    "XmlFile",
+    "ZippedXml",
+]
+
+type SourceName = Literal["xml", "zip"]
+
+
+class Entry(Protocol):
+    """A single Curriculum from a Source."""
+
+    @property
+    def name(self) -> str:
+        """Curriculum's file name, as ``<id>.xml``."""
+        ...
+
+    @property
+    def lattes_id(self) -> str:
+        """Curriculum's Lattes ID."""
+        ...
+
+    def open(self) -> AbstractContextManager[IO[bytes]]:
+        """Open the Curriculum as a binary stream."""
+        ...
+
+
+type Source = Callable[[Iterable[Path]], Iterator[Entry]]
+
+
+class UnreadableArchive(Exception):  # noqa: N818
+    """Archive that is not a ZIP file, or that has no curriculum."""
+
+
+@dataclass(frozen=True)
+class XmlFile:
+    """Curriculum stored as a plain XML file."""
+
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def lattes_id(self) -> str:
+        return self.path.stem
+
+    def open(self) -> IO[bytes]:
+        return self.path.open("rb")
+
+
+@dataclass(frozen=True)
+class ZippedXml:
+    """Curriculum stored into a ``<id>.zip`` archive, as delivered by CNPq.
+
+    The archive is expected to hold a single ``<id>.xml`` member,
+    which is decompressed on demand while being read,
+    with no temporary files.
+    """
+
+    archive: Path
+
+    @property
+    def name(self) -> str:
+        return self.archive.name.removesuffix(".zip") + ".xml"
+
+    @property
+    def lattes_id(self) -> str:
+        return self.archive.stem
+
+    @contextmanager
+    def open(self) -> Iterator[IO[bytes]]:
+        """Open the archive's curriculum.
+
+        Raises
+        ------
+        UnreadableArchive
+            If the archive is corrupt, or has no ``.xml`` member.
+
+        """
+        try:
+            archive = ZipFile(self.archive)
+        except BadZipFile as err:
+            message = f"{self.archive} is not a valid ZIP archive"
+            raise UnreadableArchive(message) from err
+
+        with archive:
+            member = next(
+                (
+                    info
+                    for info in archive.infolist()
+                    if info.filename.endswith(".xml")
+                ),
+                None,
+            )
+            if member is None:
+                message = f"{self.archive} has no .xml curriculum"
+                raise UnreadableArchive(message)
+            with archive.open(member) as stream:
+                yield stream
+
+
+def xml_files(files: Iterable[Path]) -> Iterator[XmlFile]:
+    """Pick pre-processed curricula among files."""  # noqa: DOC402
+    return (XmlFile(path) for path in files if path.suffix == ".xml")
+
+
+def zipped_xml(files: Iterable[Path]) -> Iterator[ZippedXml]:
+    """Pick zipped curricula among files."""  # noqa: DOC402
+    return (ZippedXml(path) for path in files if path.suffix == ".zip")
+
+
+SOURCES: dict[SourceName, Source] = {
+    "xml": xml_files,
+    "zip": zipped_xml,
+}
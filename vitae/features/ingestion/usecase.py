@@ -2,49 +2,371 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections import deque
+from collections.abc import Container, Generator, Iterable, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from functools import partial
+import io
+from typing import IO, TYPE_CHECKING, Any
 
 from vitae.features.ingestion.adapters import Curriculum
-from vitae.features.ingestion.parsing import CurriculumDocument
+from vitae.features.ingestion.manifest import Manifest
+from vitae.features.ingestion.metrics import Metered, Metrics, Sample
+from vitae.features.ingestion.parsing import CurriculumDocument, last_update
+from vitae.features.ingestion.sources import xml_files
 from vitae.lib.panic import panic
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import datetime
     from pathlib import Path
 
+    from vitae.features.ingestion.curricula_cache import CurriculaCache
+    from vitae.features.ingestion.profiling import Profiler
     from vitae.features.ingestion.repository import Researchers
+    from vitae.features.ingestion.sources import Entry, Source
 
 
 @dataclass(kw_only=True)
 class Ingestion:
-    """Ingest documents to the database using Researchers's Repository."""
+    """Ingest documents to the database using Researchers's Repository.
+
+    Notes
+    -----
+    When ``workers`` is greater than one, curricula are parsed by a pool of
+    processes while this one keeps writing them through ``researchers``.
+    At most ``in_flight`` curricula are submitted ahead of the writer,
+    so memory stays bounded however slow the database is.
+
+    Groups and their files are listed by the ``manifest``,
+    which may be cached between runs.
+
+    On ``incremental`` mode, curricula already stored are ingested again
+    only when updated since, according to their `DATA-ATUALIZACAO`,
+    which is read before parsing the rest of the document.
+    ``researchers`` must upsert them, instead of failing as duplicates.
+
+    Throughput is measured by ``metrics``, if any,
+    which are reported at the end of each group.
+    Each group is profiled on its own by the ``profiler``, if any.
+
+    Parsed curricula are kept by the ``cache``, if any, so unchanged files
+    are not parsed again, e.g. when rebuilding the database.
+    It's trimmed to its size limit every ``evict_every`` groups, as each
+    trimming scans the whole cache, and once the run ends or fails.
+
+    """
 
     researchers: Researchers
     files: Path
 
     scan_only: frozenset[Path] | None = field(default_factory=frozenset)
-    to_skip: set[str] = field(default_factory=set)
+    to_skip: Container[str] = field(default_factory=frozenset)
+    streaming: bool = True
+    source: Source = xml_files
+    manifest: Manifest | None = None
+    workers: int = 1
+    in_flight: int | None = None
+    incremental: bool = False
+    metrics: Metrics | None = None
+    profiler: Profiler | None = None
+    cache: CurriculaCache | None = None
+    evict_every: int = 10
+
+    _pool: ProcessPoolExecutor | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+
+    def __post_init__(self) -> None:
+        if self.manifest is None:
+            self.manifest = Manifest(self.files)
 
     def ingest(self) -> None:
         """Ingest data using the configured path and filter."""
-        for id_group in self.files.iterdir():
-            if (not self.scan_only) or id_group in self.scan_only:
-                self.process_group(id_group)
+        groups = [
+            id_group
+            for id_group in self.manifest.groups()
+            if (not self.scan_only) or id_group in self.scan_only
+        ]
+
+        if self.metrics is not None:
+            self.metrics.expected = sum(
+                sum(1 for _ in self.source(self.manifest.files(id_group)))
+                for id_group in groups
+            )
+
+        evicted = False
+        try:
+            with self._parsing_pool():
+                for done, id_group in enumerate(groups, start=1):
+                    evicted = False
+                    with self._profiling(id_group):
+                        self.process_group(id_group)
+                    if done % self.evict_every == 0:
+                        self._evict()
+                        evicted = True
+        finally:
+            if not evicted:
+                self._evict()
 
     def process_group(self, directory: Path) -> None:
         """Process all curriculum files in a directory."""
         if not directory.exists():
             panic(f"Subdirectory does not exist: {directory}")
 
-        self.researchers.put(process_each(directory, self.to_skip))
+        entries = self.source(self.manifest.files(directory))
+        stored = self._stored_updates(directory) if self.incremental else None
+
+        if self._pool is None:
+            curricula = process_each(
+                entries,
+                self.to_skip,
+                streaming=self.streaming,
+                stored=stored,
+                metrics=self.metrics,
+                cache=self.cache,
+            )
+        else:
+            curricula = process_in_parallel(
+                entries,
+                self.to_skip,
+                self._pool,
+                streaming=self.streaming,
+                in_flight=self.in_flight or 4 * self.workers,
+                stored=stored,
+                metrics=self.metrics,
+                cache=self.cache,
+            )
+
+        self.researchers.put(curricula)
         print(f"Processed {directory.parent.name}/{directory.name}")
 
+        if self.metrics is not None:
+            self.metrics.write(directory)
+
+    def _stored_updates(self, directory: Path) -> dict[str, datetime | None]:
+        """Last update of the group's curricula already stored."""
+        return self.researchers.last_updates(
+            entry.lattes_id
+            for entry in self.source(self.manifest.files(directory))
+        )
+
+    def _evict(self) -> None:
+        """Trim the cache, if any, to its size limit."""
+        if self.cache is not None:
+            self.cache.evict()
+
+    def _profiling(self, directory: Path) -> AbstractContextManager[None]:
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.group(directory)
+
+    @contextmanager
+    def _parsing_pool(self) -> Iterator[None]:
+        """Share a single pool of parsing processes between all groups."""
+        if self.workers <= 1:
+            yield
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            self._pool = pool
+            try:
+                yield
+            finally:
+                self._pool = None
+
 
 def process_each(
-    directory: Path, to_skip: set) -> Generator[Curriculum, Any, None]:
-    for curriculum in directory.glob("*.xml"):
-        if curriculum.name not in to_skip:
-            yield CurriculumDocument(curriculum).as_schema
+    entries: Iterable[Entry],
+    to_skip: Container[str],
+    *,
+    streaming: bool = True,
+    stored: Mapping[str, datetime | None] | None = None,
+    metrics: Metrics | None = None,
+    cache: CurriculaCache | None = None,
+) -> Generator[Curriculum, Any, None]:
+    for entry in not_skipped(entries, to_skip, metrics):
+        since = stored.get(entry.lattes_id) if stored else None
+        curriculum, sample = sampled_curriculum_from(
+            entry,
+            since,
+            streaming=streaming,
+            cache=cache,
+        )
+        if changed(entry, curriculum, sample, metrics):
+            yield curriculum
+
+
+def process_in_parallel(  # noqa: PLR0913
+    entries: Iterable[Entry],
+    to_skip: Container[str],
+    pool: ProcessPoolExecutor,
+    *,
+    streaming: bool = True,
+    in_flight: int = 8,
+    stored: Mapping[str, datetime | None] | None = None,
+    metrics: Metrics | None = None,
+    cache: CurriculaCache | None = None,
+) -> Generator[Curriculum, Any, None]:
+    """Parse curricula on ``pool``, yielding them in the order of ``entries``.
+
+    Only entries are sent to the workers, which open and parse them by
+    themselves, and only the parsed curricula are sent back.
+    """
+    parse = partial(sampled_curriculum_from, streaming=streaming, cache=cache)
+    pending: deque[tuple[Entry, Future[Sampled]]] = deque()
+
+    for entry in not_skipped(entries, to_skip, metrics):
+        since = stored.get(entry.lattes_id) if stored else None
+        pending.append((entry, pool.submit(parse, entry, since)))
+        if len(pending) >= in_flight:
+            parsed, future = pending.popleft()
+            curriculum, sample = future.result()
+            if changed(parsed, curriculum, sample, metrics):
+                yield curriculum
+
+    while pending:
+        parsed, future = pending.popleft()
+        curriculum, sample = future.result()
+        if changed(parsed, curriculum, sample, metrics):
+            yield curriculum
+
+
+def not_skipped(
+    entries: Iterable[Entry],
+    to_skip: Container[str],
+    metrics: Metrics | None = None,
+) -> Generator[Entry, Any, None]:
+    for entry in entries:
+        if entry.lattes_id not in to_skip:
+            yield entry
         else:
-            print(f"Skipping: {curriculum}")
+            print(f"Skipping: {entry}")
+            if metrics is not None:
+                metrics.count("skipped")
+
+
+def changed(
+    entry: Entry,
+    curriculum: Curriculum | None,
+    sample: Sample,
+    metrics: Metrics | None = None,
+) -> bool:
+    if metrics is not None:
+        metrics.add(sample)
+
+    if curriculum is None:
+        print(f"Unchanged: {entry}")
+        return False
+    return True
+
+
+type Sampled = tuple[Curriculum | None, Sample]
+
+
+def sampled_curriculum_from(
+    entry: Entry,
+    since: datetime | None,
+    *,
+    streaming: bool = True,
+    cache: CurriculaCache | None = None,
+) -> Sampled:
+    """Read and parse a Curriculum, measuring how long each one takes.
+
+    Returns
+    -------
+    Parsed Curriculum, or None if not updated, and its measures.
+
+    """
+    sample = Sample()
+    with sample.timing():
+        curriculum = updated_curriculum_from(
+            entry,
+            since,
+            streaming=streaming,
+            sample=sample,
+            cache=cache,
+        )
+
+    sample.parsed = curriculum is not None
+    return curriculum, sample
+
+
+def updated_curriculum_from(
+    entry: Entry,
+    since: datetime | None,
+    *,
+    streaming: bool = True,
+    sample: Sample | None = None,
+    cache: CurriculaCache | None = None,
+) -> Curriculum | None:
+    """Read and parse a Curriculum, unless not updated ``since``.
+
+    Curricula without a valid last update are always parsed,
+    since they can not be told apart from updated ones.
+
+    Returns
+    -------
+    Parsed Curriculum, or None if not updated.
+
+    """
+    if since is not None:
+        with entry.open() as stream:
+            updated_at = last_update(metered(stream, sample))
+        if updated_at is not None and updated_at <= since:
+            return None
+
+    return curriculum_from(
+        entry,
+        streaming=streaming,
+        sample=sample,
+        cache=cache,
+    )
+
+
+def curriculum_from(
+    entry: Entry,
+    *,
+    streaming: bool = True,
+    sample: Sample | None = None,
+    cache: CurriculaCache | None = None,
+) -> Curriculum:
+    """Read and parse a single Curriculum.
+
+    With a ``cache``, the whole file is read to be hashed first,
+    and parsed only if not cached yet, from memory.
+
+    Returns
+    -------
+    Parsed Curriculum.
+
+    """
+    with entry.open() as stream:
+        if cache is None:
+            document = CurriculumDocument(
+                metered(stream, sample),  # type: ignore[arg-type]
+                streaming=streaming,
+            )
+            return document.as_schema
+
+        content = metered(stream, sample).read()
+
+    key = cache.key(entry.name, content)
+    if (cached := cache.get(key)) is not None:
+        if sample is not None:
+            sample.cached = True
+        return cached
+
+    buffer = io.BytesIO(content)
+    buffer.name = entry.name
+    curriculum = CurriculumDocument(buffer, streaming=streaming).as_schema
+    cache.put(key, curriculum)
+    return curriculum
+
+
+def metered(stream: IO[bytes], sample: Sample | None) -> IO[bytes] | Metered:
+    return stream if sample is None else Metered(stream, sample)
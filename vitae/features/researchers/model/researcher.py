@@ -75,7 +75,7 @@ class Researcher:
                 nationality=Nationality.from_table(some_or(nationality, lambda: researcher.nationality))
             ),
             links=ExternalLinks(
-                lattes=Lattes.from_id(researcher.lattes_id),
+                lattes=Lattes.from_id(f"{researcher.lattes_id:016}"),
                 orcid=optional(researcher.orcid, Orcid.from_url),
             ),
             professional=ProfessionalLink.from_table(
@@ -0,0 +1,220 @@
+from typing import cast
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlmodel import col, select
+
+from vitae.features.researchers.schemes import ChoosenFilters
+from vitae.infra.database import tables
+
+from .researchers import FILTERS, containing, filtered_by, searched
+
+
+def filters(**chosen: object) -> ChoosenFilters:
+    return cast("ChoosenFilters", chosen)
+
+
+def sql_of(statement) -> str:
+    return str(
+        statement.compile(
+            dialect=postgresql.dialect(paramstyle="named"),
+            compile_kwargs={"literal_binds": True},
+        ),
+    )
+
+
+# Only the columns filtered on, of researchers 1 to 4. The 4th has no
+# address, so the former joins never found them.
+WITHOUT_ADDRESS = 4
+RELATED = (
+    "CREATE TABLE researcher (lattes_id BIGINT)",
+    "INSERT INTO researcher VALUES (1), (2), (3), (4)",
+    'CREATE TABLE education (researcher_id BIGINT, category TEXT, "end" INT)',
+    (
+        "INSERT INTO education VALUES (1, 'DOUTORADO', 2010),"
+        " (1, 'MESTRADO', NULL), (2, 'MESTRADO', 2005),"
+        " (3, 'DOUTORADO', NULL), (4, 'DOUTORADO', 2015)"
+    ),
+    "CREATE TABLE address (researcher_id BIGINT, state VARCHAR)",
+    "INSERT INTO address VALUES (1, 'SP'), (2, 'MG'), (3, 'SP')",
+    "CREATE TABLE nationality (researcher_id BIGINT, born_country VARCHAR)",
+    (
+        "INSERT INTO nationality VALUES (1, 'Brasil'), (2, 'Brasil'),"
+        " (3, 'Portugal'), (4, 'Brasil')"
+    ),
+    "CREATE TABLE expertise (researcher_id BIGINT, area VARCHAR)",
+    (
+        "INSERT INTO expertise VALUES (1, 'Física'), (1, 'Química'),"
+        " (2, 'Física'), (3, 'Química'), (4, 'Física')"
+    ),
+)
+
+
+@pytest.fixture(scope="module")
+def related():
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        for statement in RELATED:
+            connection.exec_driver_sql(statement)
+    with engine.connect() as connection:
+        yield connection
+
+
+def found(related, chosen: ChoosenFilters, *, joining: bool = False):
+    """Lattes IDs filtered by `filtered_by`, or by the former joins."""
+    selected = select(col(tables.Researcher.lattes_id))
+    if joining:
+        selected = (
+            selected.join(tables.Education)
+            .join(tables.Address)
+            .join(tables.Nationality)
+            .join(tables.Expertise)
+            .where(
+                *(
+                    condition(chosen[key])
+                    for key, (_, condition) in FILTERS.items()
+                    if chosen.get(key)
+                ),
+            )
+            .distinct()
+        )
+    else:
+        selected = filtered_by(selected, chosen)
+    return sorted(related.execute(selected).scalars())
+
+
+class DescribeContaining:
+    def is_a_substring_pattern(self):
+        assert containing("silva") == "%silva%"
+
+    def has_wildcards_escaped(self):
+        assert containing("50%_off") == r"%50\%\_off%"
+
+    def has_its_escape_escaped(self):
+        assert containing("a\\b") == r"%a\\b%"
+
+
+class DescribeSearched:
+    def has_a_pattern_per_name(self):
+        sql = sql_of(searched("maria silva"))
+        assert "search_name LIKE '%maria%'" in sql
+        assert "search_name LIKE '%silva%'" in sql
+
+    def has_names_folded_as_stored(self):
+        sql = sql_of(searched("JOÃO  Conceição"))
+        assert "search_name LIKE '%joao%'" in sql
+        assert "search_name LIKE '%conceicao%'" in sql
+
+    def has_each_name_only_once(self):
+        sql = sql_of(searched("silva Silva sílva"))
+        assert sql.count(" LIKE ") == 1
+
+    def when_there_is_no_name_should_match_any(self):
+        assert " LIKE " not in sql_of(searched(""))
+        assert " LIKE " not in sql_of(searched("   "))
+
+    def has_patterns_escaped(self):
+        assert "ESCAPE" in sql_of(searched("%"))
+
+    def has_no_search_document_loaded(self):
+        columns = sql_of(searched("silva")).split("FROM")[0]
+        assert "search_document" not in columns
+
+
+class DescribeFilteredBy:
+    def is_what_the_former_joins_found_with_rows(self, related):
+        for chosen in (
+            filters(state="SP"),
+            filters(country="Brasil"),
+            filters(expertise="Física"),
+            filters(started="DOUTORADO", has_finished=True),
+            filters(started="MESTRADO", state="MG", expertise="Física"),
+            filters(state="SP", country="Portugal", expertise="Física"),
+        ):
+            with_rows = [
+                lattes_id
+                for lattes_id in found(related, chosen)
+                if lattes_id != WITHOUT_ADDRESS
+            ]
+            assert with_rows == found(related, chosen, joining=True), chosen
+
+    def has_each_researcher_once(self, related):
+        assert found(related, filters(state="SP")) == [1, 3]
+
+    def has_the_ones_without_rows_on_unfiltered_tables(self, related):
+        chosen = filters(country="Brasil", expertise="Física")
+        assert found(related, chosen) == [1, 2, WITHOUT_ADDRESS]
+        assert found(related, chosen, joining=True) == [1, 2]
+
+    def when_unfiltered_should_join_nothing(self):
+        sql = sql_of(searched("silva", filter_by=filters(state=None)))
+        assert "JOIN" not in sql
+        assert "EXISTS" not in sql
+        assert "DISTINCT" not in sql
+
+    def has_only_the_filtered_tables(self):
+        sql = sql_of(searched("", filter_by=filters(expertise="Física")))
+        assert sql.count("EXISTS") == 1
+        assert "expertise.area = 'Física'" in sql
+        assert "education" not in sql
+        assert "address" not in sql
+
+    def has_a_semi_join_per_table(self):
+        sql = sql_of(
+            searched(
+                "",
+                filter_by=filters(
+                    country="Brasil",
+                    state="MG",
+                    started="DOUTORADO",
+                    has_finished=True,
+                    expertise="Física",
+                ),
+            ),
+        )
+        assert sql.count("EXISTS") == 4
+        assert "DISTINCT" not in sql
+        assert "JOIN" not in sql
+
+    def has_the_started_education_finished(self):
+        sql = sql_of(
+            searched(
+                "",
+                filter_by=filters(started="MESTRADO", has_finished=True),
+            ),
+        )
+        assert sql.count("EXISTS") == 1
+        assert "education.category = 'MESTRADO'" in sql
+        assert 'education."end" IS NOT NULL' in sql
+
+    def is_correlated_to_each_researcher(self):
+        sql = sql_of(searched("", filter_by=filters(state="SP")))
+        assert "address.researcher_id = researcher.lattes_id" in sql
+
+
+class DescribeSearchedByText:
+    def has_a_full_text_match(self):
+        sql = sql_of(searched("redes neurais", full_text=True))
+        assert "@@ websearch_to_tsquery(CAST('vitae_pt' AS REGCONFIG)" in sql
+        assert " LIKE " not in sql
+
+    def is_ordered_by_rank(self):
+        sql = sql_of(searched("redes neurais", full_text=True))
+        assert "ORDER BY ts_rank(" in sql
+
+    def when_ordered_by_name_should_not_be_ranked(self):
+        sql = sql_of(searched("redes", order_by="asc", full_text=True))
+        assert "ts_rank" not in sql
+        assert "ORDER BY researcher.full_name ASC" in sql
+
+    def has_filters_applied_to_the_matching_ones(self):
+        sql = sql_of(
+            searched("redes", filter_by=filters(state="SP"), full_text=True),
+        )
+        assert sql.count("EXISTS") == 1
+        assert "address.state = 'SP'" in sql
+        assert "DISTINCT" not in sql
+
+    def when_there_is_no_text_should_match_any(self):
+        assert "@@" not in sql_of(searched("  ", full_text=True))
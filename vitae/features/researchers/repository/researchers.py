@@ -1,73 +1,95 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, Protocol, Sequence
+from typing import TYPE_CHECKING, Any, Literal, Protocol, Sequence
 
 import attrs
-from sqlalchemy import Select
-from sqlmodel import and_, col, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Select, cast, exists, func, literal
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlmodel import col, select
+from sqlalchemy.orm import defer, selectinload
 
 from vitae.features.researchers.model.researcher import Researcher
 from vitae.infra.database import Database, tables
+from vitae.infra.database.tables import text_search
+from vitae.infra.database.tables.text_search import folded
 from vitae.infra.database.tables.researcher import Expertise
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
+
+    from sqlalchemy import ColumnElement
 
     from vitae.features.researchers.schemes import ChoosenFilters
+    from vitae.infra.database.tables.orm import Orm
 
 
 type Order = Literal["asc", "desc"] | None
 INVALID_ORDER_LITERAL = "order_by must be 'asc', 'desc', or None"
+LIKE_ESCAPE = "\\"
 
 type SelectedResearchers = Select[tuple[tables.Researcher]]
 
 
-# fmt: off
-def using_filter(
+type Filtering = tuple[type[Orm], Callable[[Any], ColumnElement[bool]]]
+
+# Table and condition of each filter, by its key on ``ChoosenFilters``.
+FILTERS: dict[str, Filtering] = {
+    "started": (
+        tables.Education,
+        lambda category: col(tables.Education.category) == category,
+    ),
+    "has_finished": (
+        tables.Education,
+        lambda _: col(tables.Education.end).is_not(None),
+    ),
+    "state": (
+        tables.Address,
+        lambda state: col(tables.Address.state) == state,
+    ),
+    "country": (
+        tables.Nationality,
+        lambda country: col(tables.Nationality.born_country) == country,
+    ),
+    "expertise": (
+        tables.Expertise,
+        lambda area: col(tables.Expertise.area) == area,
+    ),
+}
+
+
+def filtered_by(
     selected: SelectedResearchers,
     filters: ChoosenFilters | None,
 ) -> SelectedResearchers:
-    """Add Filters to SQL Statement.
+    """Add the chosen filters, as an ``EXISTS`` of each filtered table.
+
+    Only the filters set are added, grouped by their table, so the
+    education started is the one finished. Being semi-joins, they
+    neither repeat researchers by their related rows, needing no
+    ``DISTINCT``, nor drop the ones without rows on unfiltered tables.
 
     Returns
     -------
     SQL Statement.
 
     """
-    def haskey(d, k):
-        try:
-            return bool(d[k])
-        except:
-            return False
-
-    return (
-        selected
-            .join(tables.Education)
-            .where(
-                tables.Education.category == filters["started"] 
-                if haskey(filters, "started") else True
-            )
-            .where(col(tables.Education.end).is_not(None)
-                if haskey(filters, "ended") else True
-            )
-            .join(tables.Address)
-            .where(col(tables.Address.state) == filters["state"]
-                if haskey(filters, "state") else True
-            )
-            .join(tables.Nationality)
-            .where(col(tables.Nationality.born_country) == filters["country"]
-                if haskey(filters, "country") else True
+    conditions: dict[type[Orm], list[ColumnElement[bool]]] = {}
+    for key, (table, condition) in FILTERS.items():
+        value = (filters or {}).get(key)
+        if value:
+            conditions.setdefault(table, []).append(condition(value))
+
+    researcher = col(tables.Researcher.lattes_id)
+    return selected.where(
+        *(
+            exists().where(
+                col(table.researcher_id) == researcher,  # type: ignore[attr-defined]
+                *filtered,
             )
-            .join(tables.Expertise)
-            .where(tables.Expertise.area == filters["expertise"]
-                if haskey(filters, "expertise") else True
-            )
-            .distinct()
+            for table, filtered in conditions.items()
+        ),
     )
 
-# fmt: on
-
 
 def ordered_by_name(
     selected: SelectedResearchers,
@@ -99,6 +121,100 @@ def ordered_by_name(
             raise ValueError(INVALID_ORDER_LITERAL)
 
 
+def containing(token: str) -> str:
+    """Pattern of names containing ``token``, matching it literally.
+
+    Wildcards typed by users, ``%`` and ``_``, are escaped by
+    ``LIKE_ESCAPE``, so they never match every name, and a substring
+    pattern is what the trigram index of folded names is used for.
+
+    Returns
+    -------
+    A ``LIKE`` pattern.
+
+    """
+    escaped = (
+        token.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+    return f"%{escaped}%"
+
+
+def matching(text: str) -> ColumnElement[Any]:
+    """Full-text query of ``text``, as typed on web search engines.
+
+    For instance, ``"redes neurais" -quântica`` matches documents
+    with the phrase, and without the word.
+
+    Returns
+    -------
+    A ``tsquery``, under the researchers' text search configuration.
+
+    """
+    return func.websearch_to_tsquery(
+        cast(literal(text_search.CONFIGURATION), REGCONFIG),
+        text,
+    )
+
+
+def searched(
+    name: str,
+    researchers: int = 50,
+    order_by: Order = None,
+    page: int | None = 1,
+    filter_by: ChoosenFilters | None = None,
+    *,
+    full_text: bool = False,
+) -> SelectedResearchers:
+    """Build the search of Researchers, as `by_name` and `by_text` run it.
+
+    Names are matched by each of their tokens, folded as the stored
+    ``search_name``, so ``joao`` matches ``João``. With ``full_text``,
+    researchers are matched by their name, expertise and abstract,
+    and ordered by rank, unless ordered by name.
+
+    Returns
+    -------
+    SQL Statement, loading the related rows shown on results.
+
+    """
+    selected = select(tables.Researcher).options(
+        defer(tables.Researcher.search_document),
+        selectinload(tables.Researcher.address),
+        selectinload(tables.Researcher.nationality),
+        selectinload(tables.Researcher.education),
+        selectinload(tables.Researcher.expertise),
+    )
+
+    if full_text and name.strip():
+        query = matching(name)
+        document = col(tables.Researcher.search_document)
+
+        matched = selected.where(document.bool_op("@@")(query))
+        filtered = filtered_by(matched, filter_by)
+        ordered = ordered_by_name(filtered, order_by)
+        if order_by is None:
+            ordered = ordered.order_by(
+                func.ts_rank(document, query).desc(),
+                col(tables.Researcher.full_name),
+            )
+    else:
+        has_names = [
+            col(tables.Researcher.search_name).like(
+                containing(name_token),
+                escape=LIKE_ESCAPE,
+            )
+            for name_token in dict.fromkeys(folded(name).split())
+        ]
+        filtered = filtered_by(selected.where(*has_names), filter_by)
+        ordered = ordered_by_name(filtered, order_by)
+
+    if page is None:
+        return ordered
+    return ordered.offset(researchers * (page - 1)).limit(researchers)
+
+
 class Researchers(Protocol):
     """Researchers's interface."""
 
@@ -128,6 +244,21 @@ class Researchers(Protocol):
         """
         ...
 
+    def by_text(
+        self,
+        text: str,
+        researchers: int,
+        order_by: Order,
+        page: int | None,
+        filter_by: ChoosenFilters | None,
+    ) -> list[Researcher]:
+        """Define a full-text search.
+
+        This one should match names, expertise and abstracts,
+        the most relevant first.
+        """
+        ...
+
 
 @attrs.frozen
 class ResearchersInDatabase(Researchers):
@@ -154,7 +285,7 @@ class ResearchersInDatabase(Researchers):
         with self.database.session as session:
             result = session.exec(
                 select(tables.Researcher).where(
-                    col(tables.Researcher.lattes_id) == lattes_id,
+                    col(tables.Researcher.lattes_id) == int(lattes_id),
                 ),
             ).first()
 
@@ -196,38 +327,44 @@ class ResearchersInDatabase(Researchers):
         Iterable[Researcher] of n researchers.
 
         """
-        each_name = name.split()
-        if page is None:
-            offset = 0
-        else:
-            offset = researchers * (page - 1)
+        return self._found(
+            searched(name, researchers, order_by, page, filter_by),
+        )
 
-        has_names = [
-            col(tables.Researcher.full_name).ilike(f"%{name_token}%")
-            for name_token in each_name
-        ]
-
-        with self.database.session as session:
-            selected = (
-                select(tables.Researcher)
-                .where(and_(*has_names) if name else True)
-                .options(
-                    selectinload(tables.Researcher.address),
-                    selectinload(tables.Researcher.nationality),
-                    selectinload(tables.Researcher.education),
-                    selectinload(tables.Researcher.expertise),
-                )
-            )
+    def by_text(
+        self,
+        text: str,
+        researchers: int = 50,
+        order_by: Order = None,
+        page: int | None = 1,
+        filter_by: ChoosenFilters | None = None,
+    ) -> list[Researcher]:
+        """Fetch Researchers by full-text search.
 
-            filtered = using_filter(selected, filter_by)
-            ordered = ordered_by_name(filtered, order_by)
+        Words are matched on names, expertise areas and abstracts,
+        regardless of accents and inflections, so "rede neural"
+        finds who works on "Redes Neurais". Unless ordered by name,
+        matches on names come first, then on expertise, then on abstracts.
 
-            if page is None:
-                limited = ordered
-            else:
-                limited = ordered.offset(offset).limit(researchers)
+        Returns
+        -------
+        Iterable[Researcher] of n researchers.
 
-            result = session.exec(limited).all()
+        """
+        return self._found(
+            searched(
+                text,
+                researchers,
+                order_by,
+                page,
+                filter_by,
+                full_text=True,
+            ),
+        )
+
+    def _found(self, statement: SelectedResearchers) -> list[Researcher]:
+        with self.database.session as session:
+            result = session.exec(statement).all()
 
             return [
                 Researcher.from_table(
@@ -70,6 +70,7 @@ def show_search(
     started: str | None = None,
     has_finished: bool = False,
     expertise: str | None = None,
+    full_text: bool = False,
 ):
 
     # Feature Setup
@@ -87,6 +88,7 @@ def show_search(
         order_by=SortingOrder(sort) if sort else None,
         filter_by=choosen_filters,
         page=page,
+        full_text=full_text,
     )
 
     return templates.TemplateResponse(
@@ -109,6 +111,7 @@ def export_all(
     started: str | None = None,
     has_finished: bool = False,
     expertise: str | None = None,
+    full_text: bool = False,
 ) -> JSONResponse:
     search = SearchResearchers(ResearchersInDatabase(database))
     choosen_filters = ChoosenFilters(
@@ -124,6 +127,7 @@ def export_all(
         order_by=None,
         filter_by=choosen_filters,
         page=None,
+        full_text=full_text,
     )
 
     result = {
@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+
+from . import search
+from .search import SearchResearchers
+
+
+@dataclass
+class Searched:
+    by: list[str] = field(default_factory=list)
+
+    def by_id(self, lattes_id):
+        self.by.append("id")
+
+    def by_name(self, name, **_):
+        self.by.append("name")
+        return []
+
+    def by_text(self, text, **_):
+        self.by.append("text")
+        return []
+
+
+class DescribeIsLattesId:
+    def is_a_number(self):
+        assert search.is_lattes_id("0123456789012345")
+
+    def when_longer_than_a_lattes_id_should_not_be(self):
+        assert not search.is_lattes_id("1" * 17)
+        assert not search.is_lattes_id("9" * 20)
+
+    def when_not_ascii_digits_should_not_be(self):
+        assert not search.is_lattes_id("²")
+        assert not search.is_lattes_id("١٢٣")
+
+    def when_empty_should_not_be(self):
+        assert not search.is_lattes_id("")
+
+
+class DescribeSearchResearchers:
+    def has_lattes_ids_searched_by_id(self):
+        researchers = Searched()
+        assert SearchResearchers(researchers).query("0123456789012345") == []
+        assert researchers.by == ["id"]
+
+    def when_out_of_range_should_be_searched_by_name(self):
+        researchers = Searched()
+        assert SearchResearchers(researchers).query("9" * 20) == []
+        assert SearchResearchers(researchers).query("²") == []
+        assert researchers.by == ["name", "name"]
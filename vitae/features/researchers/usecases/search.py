@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import enum
+import re
 from typing import TYPE_CHECKING
 
 import attrs
@@ -33,12 +34,23 @@ class SearchResearchers:
         order_by: SortingOrder | None = None,
         filter_by: ChoosenFilters | None = None,
         page: int | None = 1,
+        full_text: bool = False,
     ) -> list[Researcher]:
+        """Search by Lattes ID, by name, or by full-text with ``full_text``.
+
+        Returns
+        -------
+        A page of Researchers, or all of them if ``page`` is None.
+
+        """
         if is_lattes_id(query):
             result = self.researchers.by_id(query)
             return [result] if result else []
 
-        return self.researchers.by_name(
+        search = (
+            self.researchers.by_text if full_text else self.researchers.by_name
+        )
+        return search(
             query,
             researchers=50,
             order_by=order_by.value if order_by else None,
@@ -47,5 +59,9 @@ class SearchResearchers:
         )
 
 
+# Lattes IDs have 16 ASCII digits, and fit in the bigint they're stored as.
+LATTES_ID = re.compile(r"[0-9]{1,16}")
+
+
 def is_lattes_id(query: str) -> bool:
-    return query.isdigit()
+    return LATTES_ID.fullmatch(query) is not None
@@ -1,14 +1,22 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from sqlalchemy.engine import Engine
 from sqlmodel import Session
 
-from .put import PutOperations
+from .institutions import InstitutionRegistry
+from .put import Loader, PutOperations
+
+__all__ = ["Database", "InstitutionRegistry", "Loader"]
 
 
 @dataclass
 class Database:
     engine: Engine
+    loader: Loader = "orm"
+    institutions: InstitutionRegistry = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.institutions = InstitutionRegistry(self.engine)
 
     @property
     def session(self) -> Session:
@@ -17,4 +25,4 @@ class Database:
 
     @property
     def put(self) -> PutOperations:
-        return PutOperations(self.engine)
+        return PutOperations(self.engine, self.institutions, self.loader)
@@ -0,0 +1,14 @@
+from vitae.infra.database.backfilling import refolded
+
+
+class DescribeRefolded:
+    def has_the_names_never_folded(self):
+        rows = [(1, "João Silva", None)]
+        assert refolded(rows) == [{"researcher": 1, "folded": "joao silva"}]
+
+    def has_the_names_folded_otherwise(self):
+        rows = [(1, "João Silva", "joão silva")]
+        assert refolded(rows) == [{"researcher": 1, "folded": "joao silva"}]
+
+    def has_no_names_already_folded(self):
+        assert refolded([(1, "João Silva", "joao silva")]) == []
@@ -0,0 +1,41 @@
+import uuid
+
+from vitae.infra.database import tables
+from vitae.infra.database.copying import coerced, generated, type_name
+
+
+def columns_of(table) -> dict:
+    return {column.name: column for column in table.__table__.columns}
+
+
+class DescribeGenerated:
+    def is_serial_ids(self):
+        assert generated(columns_of(tables.Experience)["id"])
+
+    def when_a_required_key_should_not_be(self):
+        assert not generated(columns_of(tables.Researcher)["lattes_id"])
+
+    def when_a_foreign_primary_key_should_not_be(self):
+        assert not generated(columns_of(tables.Address)["researcher_id"])
+
+    def is_computed_columns(self):
+        assert generated(columns_of(tables.Researcher)["search_document"])
+
+
+class DescribeCoerced:
+    def is_the_column_type(self):
+        education_id = uuid.uuid1()
+        assert coerced(education_id, str) == str(education_id)
+
+    def when_none_should_be_none(self):
+        assert coerced(None, str) is None
+
+    def when_already_the_column_type_should_be_the_same(self):
+        assert coerced(2010, int) == 2010
+
+
+class DescribeTypeName:
+    def is_a_postgres_type(self):
+        columns = columns_of(tables.Education)
+        assert type_name(columns["course"]) == "varchar"
+        assert type_name(columns["start"]) == "integer"
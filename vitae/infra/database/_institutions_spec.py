@@ -0,0 +1,59 @@
+import pytest
+
+from vitae.infra.database import InstitutionRegistry, tables
+
+
+def institution(lattes_id: str, name: str | None = None) -> tables.Institution:
+    return tables.Institution(
+        lattes_id=lattes_id,
+        name=name,
+        country=None,
+        state=None,
+        abbr=None,
+    )
+
+
+class Connection:
+    def __init__(self) -> None:
+        self.statements = []
+
+    def execute(self, statement) -> None:
+        self.statements.append(statement)
+
+
+@pytest.fixture
+def registry() -> InstitutionRegistry:
+    return InstitutionRegistry(engine=None, known={"UFBA"})
+
+
+class DescribeInstitutionRegistry:
+    def has_only_unknown_institutions(self, registry):
+        new = registry.new([institution("UFBA"), institution("UEFS")])
+        assert [inst.lattes_id for inst in new] == ["UEFS"]
+
+    def has_the_first_occurrence_of_each_institution(self, registry):
+        new = registry.new(
+            [
+                institution("UEFS", "First"),
+                institution("UEFS", "Second"),
+            ],
+        )
+        assert [inst.name for inst in new] == ["First"]
+
+    def when_remembered_should_not_be_new_anymore(self, registry):
+        registry.remember([institution("UEFS")])
+        assert registry.new([institution("UEFS")]) == []
+
+    def when_not_remembered_should_still_be_new(self, registry):
+        registry.new([institution("UEFS")])
+        assert len(registry.new([institution("UEFS")])) == 1
+
+    def is_put_by_a_single_statement(self, registry):
+        connection = Connection()
+        registry.put(connection, [institution("UEFS"), institution("UFRB")])
+        assert len(connection.statements) == 1
+
+    def when_nothing_is_new_should_put_nothing(self, registry):
+        connection = Connection()
+        registry.put(connection, [])
+        assert connection.statements == []
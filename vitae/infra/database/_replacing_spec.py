@@ -0,0 +1,106 @@
+from vitae.infra.database import tables
+from vitae.infra.database.replacing import (
+    UPSERTED,
+    delete_children,
+    deletions,
+    upserted,
+)
+
+
+class Connection:
+    def __init__(self) -> None:
+        self.statements = []
+
+    def execute(self, statement) -> None:
+        self.statements.append(statement)
+
+
+def researcher(lattes_id: int) -> tables.Researcher:
+    return tables.Researcher(
+        lattes_id=lattes_id,
+        full_name=f"Researcher {lattes_id}",
+        quotes_names=None,
+        orcid=None,
+        abstract=None,
+    )
+
+
+def nationality(lattes_id: int) -> tables.Nationality:
+    return tables.Nationality(
+        researcher_id=lattes_id,
+        born_country="Brasil",
+        nationality="B",
+    )
+
+
+def address(lattes_id: int) -> tables.Address:
+    return tables.Address(researcher_id=lattes_id, country="Brasil")
+
+
+def expertise(lattes_id: int) -> tables.Expertise:
+    return tables.Expertise(
+        researcher_id=lattes_id,
+        major=None,
+        area=None,
+        sub=None,
+        specialty=None,
+    )
+
+
+class DescribeDeletions:
+    def has_only_the_tables_not_upserted(self):
+        deleted = {statement.table for statement in deletions([1])}
+
+        assert deleted.isdisjoint(UPSERTED)
+        assert {table.name for table in deleted} == {
+            "advising",
+            "study_field",
+            "education",
+            "expertise",
+            "experience",
+            "address",
+        }
+
+    def when_there_are_no_researchers_should_delete_nothing(self):
+        connection = Connection()
+        delete_children(connection, [])
+        assert connection.statements == []
+
+
+class DescribeUpserted:
+    def has_the_address_inserted_again(self):
+        models = [researcher(1), nationality(1), address(1)]
+        assert upserted(Connection(), models) == models[2:]
+
+    def when_the_address_is_dropped_should_delete_the_stored_one(self):
+        connection = Connection()
+        upserted(connection, [researcher(1), nationality(1)])
+
+        [deleted] = [
+            statement
+            for statement in connection.statements
+            if statement.table.name == "address"
+        ]
+        assert deleted.is_delete
+        assert "address.researcher_id IN" in str(deleted)
+
+    def has_only_the_models_not_upserted(self):
+        models = [researcher(1), nationality(1), expertise(1)]
+        assert upserted(Connection(), models) == models[2:]
+
+    def is_an_upsert_per_table_after_the_deletions(self):
+        connection = Connection()
+        upserted(
+            connection,
+            [
+                researcher(1),
+                researcher(2),
+                nationality(1),
+                nationality(2),
+            ],
+        )
+
+        *deleted, researchers, nationalities = connection.statements
+        assert len(deleted) == len(deletions([1, 2]))
+        assert researchers.table.name == "researcher"
+        assert nationalities.table.name == "nationality"
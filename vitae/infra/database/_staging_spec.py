@@ -0,0 +1,81 @@
+import io
+
+from vitae.infra.database import tables
+from vitae.infra.database.staging import (
+    LEVELS,
+    columns_of,
+    loaded_files,
+    staged_files,
+    writer_of,
+)
+
+
+def names(level) -> set[str]:
+    return {table.name for table in level}
+
+
+class DescribeLevels:
+    def has_every_table_after_the_ones_it_references(self):
+        depth = {
+            table: number
+            for number, level in enumerate(LEVELS)
+            for table in level
+        }
+
+        for table, number in depth.items():
+            for key in table.foreign_keys:
+                assert depth[key.column.table] < number
+
+    def has_the_unreferencing_tables_first(self):
+        assert names(LEVELS[0]) == {"institution", "researcher"}
+
+    def has_the_education_children_last(self):
+        assert names(LEVELS[-1]) == {"advising", "study_field"}
+
+
+class DescribeColumnsOf:
+    def when_a_serial_key_should_leave_it_to_the_database(self):
+        columns = columns_of(tables.Experience.__table__)
+        assert "id" not in {column.name for column in columns}
+
+
+class DescribeWriterOf:
+    def has_a_header_of_the_columns(self):
+        file = io.StringIO()
+        writer_of(file, tables.Institution.__table__)
+
+        assert file.getvalue().splitlines() == [
+            '"lattes_id","name","country","state","abbr"',
+        ]
+
+    def is_null_unquoted_and_empty_strings_quoted(self):
+        file = io.StringIO()
+        writer = writer_of(file, tables.Institution.__table__)
+        writer.writerow(["I1", "", None, "SP", None])
+
+        assert file.getvalue().splitlines()[1] == '"I1","",,"SP",'
+
+
+class DescribeStagedFiles:
+    def has_only_the_complete_ones_sorted(self, tmp_path):
+        directory = tmp_path / "researcher"
+        directory.mkdir()
+        for name in ("01.csv", "00.csv", "02.csv.part", "03.csv.loaded"):
+            (directory / name).touch()
+
+        files = staged_files(tmp_path, tables.Researcher.__table__)
+        assert [file.name for file in files] == ["00.csv", "01.csv"]
+
+
+class DescribeLoadedFiles:
+    def has_only_the_loaded_ones_sorted(self, tmp_path):
+        directory = tmp_path / "researcher"
+        directory.mkdir()
+        for name in ("02.csv.loaded", "00.csv.loaded", "01.csv"):
+            (directory / name).touch()
+
+        files = loaded_files(tmp_path, tables.Researcher.__table__)
+        assert [file.name for file in files] == [
+            "00.csv.loaded",
+            "02.csv.loaded",
+        ]
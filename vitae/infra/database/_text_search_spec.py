@@ -0,0 +1,15 @@
+from vitae.infra.database.tables.text_search import folded
+
+
+class DescribeFolded:
+    def has_no_accents(self):
+        assert folded("João Conceição") == "joao conceicao"
+
+    def is_case_folded(self):
+        assert folded("MARIA Straße") == "maria strasse"
+
+    def has_whitespace_collapsed(self):
+        assert folded("  ana\t maria\n") == "ana maria"
+
+    def is_folded_once(self):
+        assert folded(folded("Ângela Müller")) == folded("Ângela Müller")
@@ -0,0 +1,95 @@
+"""Backfill of the folded names of researchers ingested before them.
+
+Researchers ingested before ``search_name`` was added have no folded
+name, so they're never found by name. Instead of a new ingestion,
+`backfill_search_names` adds the column and its trigram index, when
+missing, in place of the one of full names, and folds the name of
+every researcher, a batch of them per transaction, keeping the ones
+already folded as they are.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import bindparam, select, update
+
+from vitae.infra.database.tables import Researcher
+from vitae.infra.database.tables.text_search import folded
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from sqlalchemy import Connection, Row, Table
+    from sqlalchemy.engine import Engine
+
+__all__ = ["BATCH", "backfill_search_names", "refolded"]
+
+BATCH = 10_000
+
+RESEARCHER: Table = Researcher.__table__  # type: ignore[attr-defined]
+MIGRATION = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "ALTER TABLE researcher ADD COLUMN IF NOT EXISTS search_name VARCHAR",
+    "DROP INDEX IF EXISTS ix_researcher_full_name_trgm",  # replaced by it
+)
+
+
+def refolded(rows: Iterable[Row[Any]]) -> list[dict[str, Any]]:
+    """Folded names of researchers, for the ones stored otherwise.
+
+    Returns
+    -------
+    Parameters of the ``UPDATE`` of each researcher to fold.
+
+    """
+    return [
+        {"researcher": lattes_id, "folded": folded(full_name)}
+        for lattes_id, full_name, search_name in rows
+        if folded(full_name) != search_name
+    ]
+
+
+def migrate(connection: Connection) -> None:
+    """Add ``search_name`` and its index, unless they exist already."""
+    for statement in MIGRATION:
+        connection.exec_driver_sql(statement)
+    for index in RESEARCHER.indexes:
+        if "search_name" in index.columns:
+            index.create(connection, checkfirst=True)
+
+
+def backfill_search_names(engine: Engine, batch: int = BATCH) -> int:
+    """Fold the name of every researcher, ``batch`` researchers at a time.
+
+    Returns
+    -------
+    Number of researchers whose folded name was updated.
+
+    """
+    with engine.begin() as connection:
+        migrate(connection)
+
+    lattes_id = RESEARCHER.c.lattes_id
+    names = select(lattes_id, RESEARCHER.c.full_name, RESEARCHER.c.search_name)
+    folding = (
+        update(RESEARCHER)
+        .where(lattes_id == bindparam("researcher"))
+        .values(search_name=bindparam("folded"))
+    )
+
+    updated = 0
+    last = -1  # below every Lattes ID
+    while True:
+        with engine.begin() as connection:
+            rows: Sequence[Row[Any]] = connection.execute(
+                names.where(lattes_id > last).order_by(lattes_id).limit(batch),
+            ).all()
+            if not rows:
+                return updated
+
+            changed = refolded(rows)
+            if changed:
+                connection.execute(folding, changed)
+            updated += len(changed)
+            last = rows[-1].lattes_id
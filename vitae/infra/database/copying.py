@@ -0,0 +1,164 @@
+"""COPY based bulk loading.
+
+Instead of going through the ORM's unit of work, row by row,
+each table of a transaction is streamed at once using PostgreSQL's
+``COPY ... FROM STDIN`` on binary format.
+
+``COPY`` can not update conflicting rows, so tables being upserted are
+copied into a temporary staging table first, then merged at once.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from psycopg import sql
+from sqlalchemy import Integer
+from sqlalchemy.dialects import postgresql
+
+if TYPE_CHECKING:
+    from collections.abc import Container, Iterable
+
+    from psycopg import Cursor
+    from sqlalchemy import Column, Table
+    from sqlmodel import SQLModel
+
+__all__ = [
+    "coerced",
+    "copy_into",
+    "copy_transaction",
+    "generated",
+    "type_name",
+    "upsert_into",
+]
+
+
+def copy_transaction(
+    cursor: Cursor,
+    models: Iterable[SQLModel],
+    upserting: Container[Table] = frozenset(),
+) -> None:
+    """Copy every model of a transaction, table by table.
+
+    Tables are copied in the order they first appear on ``models``,
+    so the insertion order defined by `Transaction`s is kept.
+    Conflicting rows of the tables on ``upserting`` are updated.
+    """
+    by_table: dict[Table, list[SQLModel]] = defaultdict(list)
+    for model in models:
+        by_table[model.__table__].append(model)  # type: ignore[attr-defined]
+
+    for table, rows in by_table.items():
+        if table in upserting:
+            upsert_into(cursor, table, rows)
+        else:
+            copy_into(cursor, table, rows)
+
+
+def copy_into(
+    cursor: Cursor,
+    table: Table,
+    rows: Iterable[SQLModel],
+    name: str | None = None,
+) -> None:
+    """Copy ``rows`` into ``table``, or into a table like it, by ``name``.
+
+    Generated columns, such as serial IDs, are left to the database.
+    Values are coerced to their column's type, as the binary format
+    is strict about them, e.g. ``UUID``s put into ``VARCHAR`` columns.
+    """
+    columns = [column for column in table.columns if not generated(column)]
+    python_types = [python_type(column) for column in columns]
+    statement = sql.SQL("COPY {} ({}) FROM STDIN (FORMAT BINARY)").format(
+        sql.Identifier(name or table.name),
+        identifiers(columns),
+    )
+
+    with cursor.copy(statement) as copy:
+        copy.set_types([type_name(column) for column in columns])
+        for row in rows:
+            copy.write_row(
+                [
+                    coerced(getattr(row, column.name), type_)
+                    for column, type_ in zip(
+                        columns,
+                        python_types,
+                        strict=True,
+                    )
+                ],
+            )
+
+
+def upsert_into(
+    cursor: Cursor,
+    table: Table,
+    rows: Iterable[SQLModel],
+) -> None:
+    """Copy ``rows`` into a staging table, then merge them into ``table``.
+
+    The staging table is dropped once the transaction ends.
+    """
+    staging = f"{table.name}_staging"
+    columns = [column for column in table.columns if not generated(column)]
+    keys = list(table.primary_key.columns)
+
+    cursor.execute(
+        sql.SQL(
+            "CREATE TEMPORARY TABLE {} (LIKE {} INCLUDING DEFAULTS)"
+            " ON COMMIT DROP",
+        ).format(sql.Identifier(staging), sql.Identifier(table.name)),
+    )
+    copy_into(cursor, table, rows, name=staging)
+    cursor.execute(
+        sql.SQL(
+            "INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging}"
+            " ON CONFLICT ({keys}) DO UPDATE SET {updates}",
+        ).format(
+            table=sql.Identifier(table.name),
+            columns=identifiers(columns),
+            staging=sql.Identifier(staging),
+            keys=identifiers(keys),
+            updates=sql.SQL(", ").join(
+                sql.SQL("{0} = EXCLUDED.{0}").format(
+                    sql.Identifier(column.name),
+                )
+                for column in columns
+                if not column.primary_key
+            ),
+        ),
+    )
+
+
+def identifiers(columns: Iterable[Column]) -> sql.Composed:
+    return sql.SQL(", ").join(sql.Identifier(column.name) for column in columns)
+
+
+def generated(column: Column) -> bool:
+    """Whether the database computes a column, so it's never written.
+
+    Returns
+    -------
+    If it's a serial ID, or a generated column, e.g. a search document.
+
+    """
+    serial = (
+        column.primary_key
+        and column.autoincrement in {True, "auto"}
+        and isinstance(column.type, Integer)
+    )
+    return serial or column.computed is not None
+
+
+def python_type(column: Column) -> type:
+    return getattr(column.type, "impl_instance", column.type).python_type
+
+
+def coerced[T](value: object, python_type: type[T]) -> T | None:
+    if value is None or isinstance(value, python_type):
+        return value  # type: ignore[return-value]
+    return python_type(value)  # type: ignore[call-arg]
+
+
+def type_name(column: Column) -> str:
+    return column.type.compile(dialect=postgresql.dialect()).lower()
@@ -0,0 +1,86 @@
+"""Run-wide registry of stored Institutions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import itertools
+from typing import TYPE_CHECKING
+
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, select
+
+from vitae.infra.database.tables.institution import Institution
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.engine import Connection, Engine
+
+__all__ = ["InstitutionRegistry"]
+
+ROWS_PER_STATEMENT = 5_000
+
+
+@dataclass
+class InstitutionRegistry:
+    """Institutions known to be stored on database.
+
+    The same institutions are referenced by almost every curriculum,
+    so only the ones never seen during this run are sent to the database,
+    at once, instead of a statement per reference.
+
+    Notes
+    -----
+    - ``known`` is preloaded from the ``institution`` table on first use.
+    - Institutions are only remembered once their transaction is committed,
+      so a rolled back batch will send them again.
+    - Conflicts are still ignored by the database,
+      since other runs may be writing the same institutions.
+
+    """
+
+    engine: Engine
+    known: set[str] | None = None
+
+    def new(self, institutions: Iterable[Institution]) -> list[Institution]:
+        """Deduplicate institutions, keeping only the unknown ones.
+
+        Returns
+        -------
+        Unknown institutions, the first occurrence of each one.
+
+        """
+        known = self._known
+        unique: dict[str, Institution] = {}
+
+        for institution in institutions:
+            if institution.lattes_id in known:
+                continue
+            unique.setdefault(institution.lattes_id, institution)
+
+        return list(unique.values())
+
+    def put(
+        self,
+        connection: Connection | Session,
+        institutions: Iterable[Institution],
+    ) -> None:
+        """Insert institutions with multi-row statements, ignoring conflicts."""
+        for chunk in itertools.batched(institutions, ROWS_PER_STATEMENT):
+            statement = postgresql.insert(Institution).values(
+                [institution.model_dump() for institution in chunk],
+            )
+            connection.execute(statement.on_conflict_do_nothing())
+
+    def remember(self, institutions: Iterable[Institution]) -> None:
+        """Mark institutions as stored, once their transaction is committed."""
+        self._known.update(
+            institution.lattes_id for institution in institutions
+        )
+
+    @property
+    def _known(self) -> set[str]:
+        if self.known is None:
+            with Session(self.engine) as session:
+                self.known = set(session.exec(select(Institution.lattes_id)))
+        return self.known
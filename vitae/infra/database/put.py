@@ -3,30 +3,59 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
-from sqlalchemy.dialects import postgresql
+import psycopg
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import SQLModel, Session
 
-from vitae.infra.database.tables.institution import Institution
+from .copying import copy_transaction
+from .replacing import UPSERTED, delete_children, lattes_ids_of, upserted
 
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine
 
+    from .institutions import InstitutionRegistry
+    from .tables import Institution
     from .transactions.bulk import Curricula, Institutions
 
+__all__ = ["Loader", "PutOperations"]
+
+type Loader = Literal["orm", "copy"]
+
 
 @dataclass
 class PutOperations:
-    """Operations that put data into the database."""
+    """Operations that put data into the database.
+
+    Notes
+    -----
+    The ``loader`` defines how curricula are written:
+
+    - ``orm``: adds each row through the session.
+    - ``copy``: streams each table with ``COPY``, skipping the ORM.
+
+    In both cases the new ``institutions`` are inserted first,
+    and the whole batch is a single transaction.
+
+    When upserting, curricula already stored are replaced instead of
+    failing the batch, so it is never rolled back because of them:
+    researchers and nationalities are updated in place, while the other
+    rows of each researcher, addresses included, are deleted and inserted
+    again.
+
+    """
 
     engine: Engine
+    institutions: InstitutionRegistry
+    loader: Loader = "orm"
 
     def batch_transaction(
         self,
         institutions: Institutions,
         curricula: Curricula,
+        *,
+        upsert: bool = False,
     ) -> bool:
         """Put a batch of Curriulum into database.
 
@@ -37,22 +66,71 @@ class PutOperations:
         -------
         If could put every single value into database.
 
+        """
+        new_institutions = self.institutions.new(institutions)
+        models = [table for table in curricula if isinstance(table, SQLModel)]
+
+        if self.loader == "copy":
+            stored = self._copy_transaction(new_institutions, models, upsert)
+        else:
+            stored = self._orm_transaction(new_institutions, models, upsert)
+
+        if stored:
+            self.institutions.remember(new_institutions)
+        return stored
+
+    def _orm_transaction(
+        self,
+        institutions: list[Institution],
+        models: list[SQLModel],
+        upserting: bool,  # noqa: FBT001
+    ) -> bool:
+        """Put a batch of Curriculum into database using the ORM.
+
+        Returns
+        -------
+        If could put every single value into database.
+
         """
         with Session(self.engine) as session:
             try:
-                for institution in institutions:
-                    dump = institution.model_dump()
-                    statement = postgresql.insert(Institution).values(**dump)
-                    session.execute(
-                        statement.on_conflict_do_nothing(),
-                    )
-
-                session.add_all(
-                    table for table in curricula if isinstance(table, SQLModel)
-                )
+                self.institutions.put(session, institutions)
+                if upserting:
+                    models = upserted(session, models)
+                session.add_all(models)
                 session.commit()
             except SQLAlchemyError:
                 session.rollback()
                 return False
 
         return True
+
+    def _copy_transaction(
+        self,
+        institutions: list[Institution],
+        models: list[SQLModel],
+        upserting: bool,  # noqa: FBT001
+    ) -> bool:
+        """Put a batch of Curriculum into database using ``COPY``.
+
+        Returns
+        -------
+        If could put every single value into database.
+
+        """
+        try:
+            with self.engine.begin() as connection:
+                self.institutions.put(connection, institutions)
+                if upserting:
+                    delete_children(connection, lattes_ids_of(models))
+                raw = connection.connection.driver_connection
+                with raw.cursor() as cursor:  # type: ignore[union-attr]
+                    copy_transaction(
+                        cursor,
+                        models,
+                        UPSERTED if upserting else frozenset(),
+                    )
+        except (SQLAlchemyError, psycopg.Error):
+            return False
+
+        return True
@@ -0,0 +1,158 @@
+"""Replacement of stored Curricula, so they can be ingested again.
+
+Researchers and their nationality are a single row per researcher,
+always present, so they are updated in place, with ``ON CONFLICT DO
+UPDATE``. Every other row of theirs, such as education and experience,
+may change in number, so they are deleted in bulk and inserted again.
+So is their address, which is gone from curricula that no longer have
+one, and would be kept if upserted.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+import itertools
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete, or_
+from sqlalchemy.dialects import postgresql
+from sqlmodel import col, select
+
+from vitae.infra.database.copying import generated
+from vitae.infra.database.tables import (
+    Address,
+    Advising,
+    Education,
+    Experience,
+    Expertise,
+    Nationality,
+    Researcher,
+    StudyField,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from sqlalchemy import Table
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.sql import Delete
+    from sqlmodel import SQLModel, Session
+
+__all__ = [
+    "UPSERTED",
+    "delete_children",
+    "lattes_ids_of",
+    "upsert",
+    "upserted",
+]
+
+UPSERTED: frozenset[Table] = frozenset(
+    model.__table__  # type: ignore[attr-defined]
+    for model in (Researcher, Nationality)
+)
+ROWS_PER_STATEMENT = 5_000
+
+
+def delete_children(
+    connection: Connection | Session,
+    lattes_ids: Collection[int],
+) -> None:
+    """Delete every row of Researchers that is not upserted.
+
+    Institutions are shared between curricula, so they are kept.
+    Researchers not stored are ignored, so this is a no-op for new ones.
+    """
+    if not lattes_ids:
+        return
+
+    for statement in deletions(list(lattes_ids)):
+        connection.execute(statement)
+
+
+def deletions(lattes_ids: list[int]) -> list[Delete]:
+    """Build the deletion of Researchers' rows, children before parents.
+
+    Returns
+    -------
+    A statement per table, each deleting every row of ``lattes_ids``.
+
+    """
+    educations = select(Education.id).where(
+        col(Education.researcher_id).in_(lattes_ids),
+    )
+
+    return [
+        delete(Advising).where(
+            or_(
+                col(Advising.education_id).in_(educations),
+                col(Advising.student_id).in_(lattes_ids),
+            ),
+        ),
+        delete(StudyField).where(
+            col(StudyField.education_id).in_(educations),
+        ),
+        *(
+            delete(table).where(col(table.researcher_id).in_(lattes_ids))
+            for table in (Education, Expertise, Experience, Address)
+        ),
+    ]
+
+
+def upsert(
+    connection: Connection | Session,
+    table: Table,
+    rows: Iterable[SQLModel],
+) -> None:
+    """Insert rows with multi-row statements, updating conflicting ones."""
+    columns = [column for column in table.columns if not generated(column)]
+    for chunk in itertools.batched(rows, ROWS_PER_STATEMENT):
+        statement = postgresql.insert(table).values(
+            [
+                {column.name: getattr(row, column.name) for column in columns}
+                for row in chunk
+            ],
+        )
+        connection.execute(
+            statement.on_conflict_do_update(
+                index_elements=list(table.primary_key.columns),
+                set_={
+                    column.name: statement.excluded[column.name]
+                    for column in columns
+                    if not column.primary_key
+                },
+            ),
+        )
+
+
+def upserted(
+    connection: Connection | Session,
+    models: list[SQLModel],
+) -> list[SQLModel]:
+    """Replace the stored rows of ``models``'s Researchers.
+
+    Returns
+    -------
+    Models still to be added, the ones not upserted.
+
+    """
+    delete_children(connection, lattes_ids_of(models))
+
+    by_table: dict[Table, list[SQLModel]] = defaultdict(list)
+    for model in models:
+        by_table[model.__table__].append(model)  # type: ignore[attr-defined]
+
+    for table, rows in by_table.items():
+        if table in UPSERTED:
+            upsert(connection, table, rows)
+
+    return [
+        model
+        for model in models
+        if model.__table__ not in UPSERTED  # type: ignore[attr-defined]
+    ]
+
+
+def lattes_ids_of(models: list[SQLModel]) -> list[int]:
+    return [
+        model.lattes_id for model in models if isinstance(model, Researcher)
+    ]
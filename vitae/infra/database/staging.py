@@ -0,0 +1,261 @@
+"""Staging of ingested tables into CSV files, and their parallel load.
+
+Parsing is CPU-bound, while loading is bound to the database.
+Instead of interleaving them, curricula are parsed once into staging
+files, a CSV per table and group, which are then loaded at once:
+
+    <staging>/
+        researcher/
+            00.csv
+            01.csv
+        education/
+            00.csv
+        ...
+
+Each file starts with a header of its columns, which is used as the
+column list of its ``COPY``, so files staged before a column is added
+can still be loaded. ``NULL`` is an unquoted empty field, while every
+other value is quoted, so empty strings are kept apart from it.
+
+Files are loaded table by table, following their ``LEVELS`` of foreign
+keys, and the files of each level are loaded in parallel,
+each one on its own connection and transaction.
+Once committed, a file is renamed as ``<group>.csv.loaded``, so loading
+again resumes from the files not loaded yet.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import csv
+from dataclasses import dataclass
+import time
+from typing import IO, TYPE_CHECKING
+
+import psycopg
+from psycopg import sql
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import SQLModel
+
+from vitae.infra.database.copying import generated
+from vitae.infra.database.tables import Institution
+
+if TYPE_CHECKING:
+    from _csv import _writer
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from psycopg import Cursor
+    from sqlalchemy import Column, Table
+    from sqlalchemy.engine import Engine
+
+__all__ = [
+    "LEVELS",
+    "Loaded",
+    "columns_of",
+    "load_file",
+    "load_staging",
+    "loaded_files",
+    "staged_files",
+    "writer_of",
+]
+
+SHARED: frozenset[Table] = frozenset(
+    {Institution.__table__},  # type: ignore[attr-defined]
+)
+CHUNK = 2**20
+LOADED = ".loaded"
+
+
+def levels_of(tables: Iterable[Table]) -> list[list[Table]]:
+    """Group tables by how deep their foreign keys go.
+
+    Returns
+    -------
+    Tables referencing no other table first, then the ones
+    referencing only them, and so on.
+
+    """
+    depths: dict[Table, int] = {}
+    for table in tables:  # sorted by dependency, so parents come first
+        depths[table] = 1 + max(
+            (
+                depths[key.column.table]
+                for key in table.foreign_keys
+                if key.column.table is not table
+            ),
+            default=-1,
+        )
+
+    levels: list[list[Table]] = [[] for _ in range(max(depths.values()) + 1)]
+    for table, depth in depths.items():
+        levels[depth].append(table)
+    return levels
+
+
+LEVELS = levels_of(SQLModel.metadata.sorted_tables)
+
+
+def columns_of(table: Table) -> list[Column]:
+    """Columns staged for a table, leaving generated ones to the database.
+
+    Returns
+    -------
+    The table's columns, in order.
+
+    """
+    return [column for column in table.columns if not generated(column)]
+
+
+def writer_of(file: IO[str], table: Table) -> _writer:
+    """Start a staging file of ``table``, writing its header.
+
+    Returns
+    -------
+    A writer of rows, as lists of values ordered as `columns_of`.
+
+    """
+    writer = csv.writer(file, quoting=csv.QUOTE_NOTNULL)
+    writer.writerow([column.name for column in columns_of(table)])
+    return writer
+
+
+def staged_files(directory: Path, table: Table) -> list[Path]:
+    """Complete staging files of a table, not loaded yet, sorted by group.
+
+    Returns
+    -------
+    Paths of its ``.csv`` files, if any.
+
+    """
+    return sorted((directory / table.name).glob("*.csv"))
+
+
+def loaded_files(directory: Path, table: Table) -> list[Path]:
+    """Staging files of a table already loaded, sorted by group.
+
+    Returns
+    -------
+    Paths of its ``.csv.loaded`` files, if any.
+
+    """
+    return sorted((directory / table.name).glob(f"*.csv{LOADED}"))
+
+
+@dataclass(frozen=True)
+class Loaded:
+    """Outcome of loading a staging file."""
+
+    table: str
+    path: Path
+    rows: int
+    seconds: float
+    error: str | None = None
+
+
+def load_staging(
+    engine: Engine,
+    directory: Path,
+    workers: int = 4,
+) -> list[Loaded]:
+    """Load every staging file, level by level, in parallel.
+
+    Levels are loaded only once the previous ones are loaded,
+    so a failing file stops the load before its dependents.
+    Files loaded by previous runs are skipped, so every level was
+    loaded when no file failed.
+
+    Returns
+    -------
+    Outcome of each file tried.
+
+    """
+    outcomes: list[Loaded] = []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for level in LEVELS:
+            files = [
+                (table, path)
+                for table in level
+                for path in staged_files(directory, table)
+            ]
+            loaded = list(
+                pool.map(lambda file: load_file(engine, *file), files),
+            )
+
+            outcomes += loaded
+            if any(outcome.error for outcome in loaded):
+                break
+
+    return outcomes
+
+
+def load_file(engine: Engine, table: Table, path: Path) -> Loaded:
+    """Stream a staging file into its table, on a single transaction.
+
+    Shared rows, such as institutions, may already be stored by other
+    files or runs, so conflicting ones are ignored.
+    Once committed, the file is renamed with the ``LOADED`` suffix.
+
+    Returns
+    -------
+    How many rows were loaded, or why it failed.
+
+    """
+    start = time.perf_counter()
+    try:
+        with engine.begin() as connection:
+            raw = connection.connection.driver_connection
+            with raw.cursor() as cursor:  # type: ignore[union-attr]
+                rows = _copy(cursor, table, path)
+    except (SQLAlchemyError, psycopg.Error, OSError) as error:
+        return Loaded(
+            table.name,
+            path,
+            0,
+            time.perf_counter() - start,
+            str(error).strip().splitlines()[0],
+        )
+
+    path.replace(path.with_name(path.name + LOADED))
+    return Loaded(table.name, path, rows, time.perf_counter() - start)
+
+
+def _copy(cursor: Cursor, table: Table, path: Path) -> int:
+    with path.open("rb") as file:
+        header = next(csv.reader([file.readline().decode("utf-8")]))
+        columns = sql.SQL(", ").join(sql.Identifier(name) for name in header)
+
+        target = table.name
+        if table in SHARED:
+            target = f"{table.name}_staging"
+            cursor.execute(
+                sql.SQL(
+                    "CREATE TEMPORARY TABLE {} (LIKE {} INCLUDING DEFAULTS)"
+                    " ON COMMIT DROP",
+                ).format(sql.Identifier(target), sql.Identifier(table.name)),
+            )
+
+        statement = sql.SQL("COPY {} ({}) FROM STDIN (FORMAT CSV)").format(
+            sql.Identifier(target),
+            columns,
+        )
+        with cursor.copy(statement) as copy:
+            while chunk := file.read(CHUNK):
+                copy.write(chunk)
+        rows = cursor.rowcount
+
+        if table in SHARED:
+            cursor.execute(
+                sql.SQL(
+                    "INSERT INTO {} ({columns}) SELECT {columns} FROM {}"
+                    " ON CONFLICT DO NOTHING",
+                ).format(
+                    sql.Identifier(table.name),
+                    sql.Identifier(target),
+                    columns=columns,
+                ),
+            )
+            rows = cursor.rowcount
+
+    return rows
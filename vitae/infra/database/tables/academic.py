@@ -3,8 +3,12 @@
 # ruff: noqa: FA102, D101
 
 from typing import TYPE_CHECKING, Optional
+import uuid
 
-from .orm import Orm, foreign, key, link, required_key
+from sqlalchemy import BigInteger, Index
+from sqlmodel import Field
+
+from .orm import Orm, foreign, key, link, required_key, researcher_key
 
 if TYPE_CHECKING:
     from .researcher import Researcher
@@ -13,9 +17,18 @@ __all__ = ["Education", "StudyField"]
 
 
 class Education(Orm, table=True):
-    id: str = required_key()
-    researcher_id: str = foreign("researcher.lattes_id")
-    institution_id: str | None = foreign("institution.lattes_id")
+    __table_args__ = (
+        Index(
+            "ix_education_category_researcher_id",
+            "category",
+            "researcher_id",
+            postgresql_include=["end"],
+        ),
+    )
+
+    id: uuid.UUID = required_key()
+    researcher_id: int = researcher_key(index=True)
+    institution_id: str | None = foreign("institution.lattes_id", index=True)
 
     category: str
     course: str | None
@@ -29,7 +42,7 @@ class Education(Orm, table=True):
 
 class StudyField(Orm, table=True):
     id: int | None = key()
-    education_id: str = foreign("education.id")
+    education_id: uuid.UUID = foreign("education.id", index=True)
 
     major: str | None
     area: str | None
@@ -40,9 +53,9 @@ class StudyField(Orm, table=True):
 
 
 class Advising(Orm, table=True):
-    education_id: str = foreign("education.id", primary_key=True)
-    student_id: str = foreign("researcher.lattes_id")
-    advisor_id: str  # = foreign("researcher.lattes_id")
+    education_id: uuid.UUID = foreign("education.id", primary_key=True)
+    student_id: int = researcher_key(index=True)
+    advisor_id: int = Field(sa_type=BigInteger, index=True)  # not a foreign key
 
     education: "Education" = link("advisoring")
     student: "Researcher" = link("student_of", viewonly=True)
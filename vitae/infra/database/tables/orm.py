@@ -1,9 +1,19 @@
 import re
 from typing import Any
 
+from sqlalchemy import BigInteger
 from sqlmodel import Field, Relationship, SQLModel
 
-__all__ = ["Orm", "foreign", "index", "key", "link", "required_key"]
+__all__ = [
+    "Orm",
+    "foreign",
+    "index",
+    "key",
+    "lattes_key",
+    "link",
+    "required_key",
+    "researcher_key",
+]
 
 
 def to_snake(name: str) -> str:
@@ -37,5 +47,25 @@ def foreign(key: str, **kargs) -> Any:
     return Field(foreign_key=key, **kargs)
 
 
+def lattes_key() -> Any:
+    """Lattes ID of 16 digits, as a ``bigint`` never generated."""
+    return Field(
+        primary_key=True,
+        nullable=False,
+        sa_type=BigInteger,
+        sa_column_kwargs={"autoincrement": False},
+    )
+
+
+def researcher_key(**kargs) -> Any:
+    """Reference to a Researcher, by its `lattes_key`."""
+    return foreign(
+        "researcher.lattes_id",
+        sa_type=BigInteger,
+        sa_column_kwargs={"autoincrement": False},
+        **kargs,
+    )
+
+
 def index() -> Any:
     return Field(nullable=False, index=True)
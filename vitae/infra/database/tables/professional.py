@@ -4,7 +4,9 @@
 
 from typing import TYPE_CHECKING, Optional
 
-from .orm import Orm, foreign, key, link
+from sqlalchemy import Index
+
+from .orm import Orm, foreign, key, link, researcher_key
 
 if TYPE_CHECKING:
     from .researcher import Researcher
@@ -14,8 +16,12 @@ __all__ = ["Address", "Experience"]
 
 
 class Address(Orm, table=True):
-    researcher_id: str = foreign("researcher.lattes_id", primary_key=True)
-    institution_id: str | None = foreign("institution.lattes_id")
+    __table_args__ = (
+        Index("ix_address_state_researcher_id", "state", "researcher_id"),
+    )
+
+    researcher_id: int = researcher_key(primary_key=True)
+    institution_id: str | None = foreign("institution.lattes_id", index=True)
 
     country: str | None
     state: str | None
@@ -29,8 +35,8 @@ class Address(Orm, table=True):
 
 class Experience(Orm, table=True):
     id: int | None = key()
-    researcher_id: str = foreign("researcher.lattes_id")
-    institution_id: str | None = foreign("institution.lattes_id")
+    researcher_id: int = researcher_key(index=True)
+    institution_id: str | None = foreign("institution.lattes_id", index=True)
 
     relationship: str | None
     start: int | None
@@ -2,9 +2,15 @@
 
 # ruff: noqa: FA102, D101
 
+from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from .orm import Orm, foreign, key, link, required_key
+from sqlalchemy import Column, Computed, Index, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlmodel import Field
+
+from . import text_search
+from .orm import Orm, index, key, lattes_key, link, researcher_key
 
 __all__ = ["Expertise", "Nationality", "Researcher"]
 
@@ -14,12 +20,37 @@ if TYPE_CHECKING:
 
 
 class Researcher(Orm, table=True):
-    lattes_id: str = required_key()
-
-    full_name: str
+    __table_args__ = (
+        Index(
+            "ix_researcher_search_name_trgm",
+            "search_name",
+            postgresql_using="gin",
+            postgresql_ops={"search_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_researcher_search_document",
+            "search_document",
+            postgresql_using="gin",
+        ),
+    )
+
+    lattes_id: int = lattes_key()
+
+    full_name: str = index()
+    search_name: str | None = None  # `text_search.folded` full name
     quotes_names: str | None
     orcid: str | None
     abstract: str | None
+    updated_at: datetime | None = None
+    expertise_areas: str | None = None
+
+    search_document: str | None = Field(
+        default=None,
+        sa_column=Column(
+            TSVECTOR,
+            Computed(text_search.DOCUMENT, persisted=True),
+        ),
+    )
 
     address: "Address" = link("researcher")
     nationality: "Nationality" = link("researcher")
@@ -31,8 +62,22 @@ class Researcher(Orm, table=True):
     advisor_of: list["Advising"] = link("advisor", viewonly=True)
 
 
+for ddl in text_search.SETUP:
+    event.listen(Researcher.__table__, "before_create", ddl)  # type: ignore
+for ddl in text_search.TEARDOWN:
+    event.listen(Researcher.__table__, "after_drop", ddl)  # type: ignore
+
+
 class Nationality(Orm, table=True):
-    researcher_id: str = foreign("researcher.lattes_id", primary_key=True)
+    __table_args__ = (
+        Index(
+            "ix_nationality_born_country_researcher_id",
+            "born_country",
+            "researcher_id",
+        ),
+    )
+
+    researcher_id: int = researcher_key(primary_key=True)
 
     born_country: str | None
     nationality: str | None
@@ -41,8 +86,12 @@ class Nationality(Orm, table=True):
 
 
 class Expertise(Orm, table=True):
+    __table_args__ = (
+        Index("ix_expertise_area_researcher_id", "area", "researcher_id"),
+    )
+
     id: int | None = key()
-    researcher_id: str = foreign("researcher.lattes_id")
+    researcher_id: int = researcher_key(index=True)
 
     major: str | None
     area: str | None
@@ -0,0 +1,64 @@
+"""Full-text search of Researchers.
+
+Each researcher has a ``tsvector`` document of its name, expertise and
+abstract, weighted in this order, as a generated column, so PostgreSQL
+computes it whenever a researcher is stored, by any loader.
+Its words are folded by ``unaccent`` and stemmed by the Portuguese
+dictionary, under the ``CONFIGURATION`` text search configuration,
+which queries must use too.
+
+Names are searched by substring instead, on their `folded` form,
+stored once by the ingestion, so neither side is folded while searched.
+"""
+
+import unicodedata
+
+from sqlalchemy import DDL
+
+__all__ = ["CONFIGURATION", "DOCUMENT", "SETUP", "TEARDOWN", "folded"]
+
+CONFIGURATION = "vitae_pt"
+
+DOCUMENT = " || ".join(
+    f"setweight(to_tsvector('{CONFIGURATION}'::regconfig,"
+    f" coalesce({column}, '')), '{weight}')"
+    for column, weight in (
+        ("full_name", "A"),
+        ("expertise_areas", "B"),
+        ("abstract", "C"),
+    )
+)
+
+# Run before the researcher table is created, and after it's dropped.
+SETUP = (
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),  # for trigrams of names
+    DDL("CREATE EXTENSION IF NOT EXISTS unaccent"),
+    DDL(f"DROP TEXT SEARCH CONFIGURATION IF EXISTS {CONFIGURATION}"),
+    DDL(
+        f"CREATE TEXT SEARCH CONFIGURATION {CONFIGURATION} (COPY = portuguese)",
+    ),
+    DDL(
+        f"ALTER TEXT SEARCH CONFIGURATION {CONFIGURATION}"
+        " ALTER MAPPING FOR hword, hword_part, word"
+        " WITH unaccent, portuguese_stem",
+    ),
+)
+TEARDOWN = (DDL(f"DROP TEXT SEARCH CONFIGURATION IF EXISTS {CONFIGURATION}"),)
+
+
+def folded(text: str) -> str:
+    """Fold a text for searches, e.g. ``"JOÃO  Silva"`` into ``"joao silva"``.
+
+    Accents, and any other combining mark, are stripped, letters are
+    case folded, and whitespace is collapsed into single spaces.
+
+    Returns
+    -------
+    The folded text.
+
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    )
+    return " ".join(stripped.casefold().split())
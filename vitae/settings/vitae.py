@@ -7,12 +7,14 @@ from functools import cached_property
 import os
 from pathlib import Path
 import sys
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, get_args
 
 import attrs
 from sqlalchemy import create_engine
 import tomllib
 
+from vitae.infra.database import Loader
+
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine
 
@@ -44,12 +46,17 @@ class PostgresDatabase:
     port: int = 5433
 
     flush_every: int = 100
+    loader: Loader = "orm"
 
     def __post_init__(self) -> None:
         if not all((self.name, self.host, self.port)):
             message: str = f"Missing fields {self}"
             raise ValueError(message)
 
+        if self.loader not in get_args(Loader.__value__):
+            message: str = f"Unknown loader {self.loader!r}"
+            raise ValueError(message)
+
     def __str__(self) -> str:
         return f"{self.host}:{self.port}/{self.name}"
 
@@ -91,6 +98,8 @@ class PathsSettings:
     """
 
     logs: Path = Path("logs/")
+    cache: Path = Path("cache/")
+    staging: Path = Path("staging/")
     _curricula: Path = Path("all_files")
 
     def __post_init__(self) -> None:
@@ -182,6 +191,7 @@ def _vitae_from_parsed(data: dict[str, Any]) -> Vitae:
         host=postgres["database"].get("host", "127.0.0.1"),
         port=postgres["database"].get("port", 5433),
         flush_every=postgres["database"].get("flush_every", 100),
+        loader=postgres["database"].get("loader", "orm"),
     )
 
     pg_user = PostgresUser(
@@ -194,5 +204,7 @@ def _vitae_from_parsed(data: dict[str, Any]) -> Vitae:
         postgres=PostgresSettings(user=pg_user, db=pg_db),
         paths=PathsSettings(
             curricula=Path(paths.get("curricula") or "all_files"),
+            cache=Path(paths.get("cache") or "cache"),
+            staging=Path(paths.get("staging") or "staging"),
         ),
     )